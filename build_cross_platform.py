@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import json
 
+from hvym_runtime import compute_build_hash, BUILD_HASH_FILE
+
 # Build-time check for pexpect on Unix-like systems
 if platform.system().lower() != 'windows':
     try:
@@ -22,8 +24,15 @@ if platform.system().lower() != 'windows':
         raise RuntimeError('pexpect is required on Unix-like systems. Please install it.')
 
 class CrossPlatformBuilder:
-    def __init__(self):
+    def __init__(self, layout: str = 'onefile', build_core: bool = True):
         self.cwd = Path.cwd()
+        # onefile: single self-extracting binary (default, what CI ships)
+        # onedir: unpacked tree plus an archive for the persistent runtime cache (hvym_runtime.py)
+        self.layout = layout
+        self.optimize = os.environ.get('HVYM_PYI_OPTIMIZE', '1' if layout == 'onedir' else '')
+        self.build_hash = None
+        # Second, Qt-free hvym-core artifact for fast query commands
+        self.build_core = build_core
         self.home = Path.home()
         self.platform_info = self._get_platform_info()
         self.build_dir = self.cwd.parent / 'hvym'
@@ -32,6 +41,12 @@ class CrossPlatformBuilder:
         self.src_files = {
             'main': self.cwd / 'hvym.py',
             'lazy_loader': self.cwd / 'lazy_loader.py',
+            'runtime': self.cwd / 'hvym_runtime.py',
+            'ui_server': self.cwd / 'hvym_ui_server.py',
+            'glb': self.cwd / 'hvym_glb.py',
+            'asset_index': self.cwd / 'hvym_asset_index.py',
+            'template_cache': self.cwd / 'hvym_template_cache.py',
+            'data_url': self.cwd / 'hvym_data_url.py',
             'requirements': self.cwd / 'requirements.txt',
             'templates': self.cwd / 'templates',
             'images': self.cwd / 'images',
@@ -44,15 +59,18 @@ class CrossPlatformBuilder:
         self.platform_configs = {
             'windows': {
                 'dist_dir': self.build_dir / 'dist' / 'windows',
-                'executable_name': 'hvym.exe'
+                'executable_name': 'hvym.exe',
+                'core_executable_name': 'hvym-core.exe'
             },
             'macos': {
                 'dist_dir': self.build_dir / 'dist' / 'macos',
-                'executable_name': 'hvym'
+                'executable_name': 'hvym',
+                'core_executable_name': 'hvym-core'
             },
             'linux': {
                 'dist_dir': self.build_dir / 'dist' / 'linux',
-                'executable_name': 'hvym'
+                'executable_name': 'hvym',
+                'core_executable_name': 'hvym-core'
             }
         }
         
@@ -256,6 +274,12 @@ class CrossPlatformBuilder:
         shutil.copy(self.src_files['main'], self.build_dir)
         shutil.copy(self.src_files['requirements'], self.build_dir)
         shutil.copy(self.src_files['lazy_loader'], self.build_dir)
+        shutil.copy(self.src_files['runtime'], self.build_dir)
+        shutil.copy(self.src_files['ui_server'], self.build_dir)
+        shutil.copy(self.src_files['glb'], self.build_dir)
+        shutil.copy(self.src_files['asset_index'], self.build_dir)
+        shutil.copy(self.src_files['template_cache'], self.build_dir)
+        shutil.copy(self.src_files['data_url'], self.build_dir)
         
         # Copy macOS runtime hook if it exists and we're building for macOS
         runtime_hook_src = self.cwd / 'pyi_rth_hvym.py'
@@ -265,7 +289,7 @@ class CrossPlatformBuilder:
         
         # Copy directories
         for name, src_path in self.src_files.items():
-            if name in ['main', 'requirements', 'lazy_loader']:
+            if name in ['main', 'requirements', 'lazy_loader', 'runtime', 'ui_server', 'glb', 'asset_index', 'template_cache', 'data_url']:
                 continue
             if src_path.exists():
                 shutil.copytree(src_path, self.build_dir / src_path.name)
@@ -369,9 +393,14 @@ class CrossPlatformBuilder:
         # Base PyInstaller command
         pyinstaller_cmd = [
             'pyinstaller',
-            '--onefile',
+            f'--{self.layout}',
             f'--distpath={config["dist_dir"]}',
         ]
+
+        # Precompile bytecode at the requested level. Level 2 would strip the
+        # docstrings click uses for --help, so 1 is the sensible maximum.
+        if self.optimize:
+            pyinstaller_cmd.extend(['--optimize', self.optimize])
         
         # Add splash screen if available
         if use_splash:
@@ -409,7 +438,16 @@ class CrossPlatformBuilder:
             '--add-data', 'data:data',
             '--add-data', 'npm_links:npm_links',
             '--add-data', 'lazy_loader.py:.',
+            '--add-data', 'hvym_runtime.py:.',
+            '--add-data', 'hvym_ui_server.py:.',
+            '--add-data', 'hvym_glb.py:.',
+            '--add-data', 'hvym_asset_index.py:.',
+            '--add-data', 'hvym_template_cache.py:.',
+            '--add-data', 'hvym_data_url.py:.',
         ])
+        # Development tools; hvym bench only runs from a source checkout
+        for module in ['hvym_bench', 'hvym_fixtures']:
+            pyinstaller_cmd.extend(['--exclude-module', module])
         
         # Add Qt platform plugins for Linux
         if platform_name == 'linux':
@@ -466,6 +504,68 @@ class CrossPlatformBuilder:
             print(f"PyInstaller build failed: {e}")
             raise
 
+    def _build_core_executable(self, target_platform: Optional[str] = None):
+        """Build the Qt-free hvym-core executable.
+
+        Same entry point as hvym, but without PyQt5, qthvym and the Stellar SDK
+        (only used behind popups), and without a splash screen. Commands in
+        hvym._UI_COMMANDS are forwarded to the full hvym next to it.
+        """
+        platform_name = target_platform or self.platform_info['platform']
+        config = self.platform_configs[platform_name]
+
+        print(f"\nBuilding {platform_name} core executable...")
+
+        pyinstaller_cmd = [
+            'pyinstaller',
+            f'--{self.layout}',
+            f'--distpath={config["dist_dir"]}',
+            f'--workpath={self.build_dir / "build" / "core"}',
+            '--noconfirm',
+        ]
+        if self.optimize:
+            pyinstaller_cmd.extend(['--optimize', self.optimize])
+
+        if platform_name == 'macos':
+            pyinstaller_cmd.append('--noupx')
+            runtime_hook_path = self.build_dir / 'pyi_rth_hvym.py'
+            if runtime_hook_path.exists():
+                pyinstaller_cmd.extend(['--runtime-hook', str(runtime_hook_path)])
+
+        if os.environ.get('CI') or os.environ.get('HVYM_PYI_LOG_DEBUG') == '1':
+            pyinstaller_cmd.extend(['--log-level', 'DEBUG'])
+
+        pyinstaller_cmd.extend([
+            '--add-data', 'templates:templates',
+            '--add-data', 'scripts:scripts',
+            '--add-data', 'images:images',
+            '--add-data', 'data:data',
+            '--add-data', 'npm_links:npm_links',
+            '--add-data', 'lazy_loader.py:.',
+            '--add-data', 'hvym_runtime.py:.',
+            '--add-data', 'hvym_ui_server.py:.',
+            '--add-data', 'hvym_glb.py:.',
+            '--add-data', 'hvym_asset_index.py:.',
+            '--add-data', 'hvym_template_cache.py:.',
+            '--add-data', 'hvym_data_url.py:.',
+        ])
+        # hvym_bench/hvym_fixtures are development tools that only run from a source checkout
+        for module in ['PyQt5', 'qthvym', 'stellar_sdk', 'hvym_stellar', 'tkinter', 'hvym_bench', 'hvym_fixtures']:
+            pyinstaller_cmd.extend(['--exclude-module', module])
+
+        pyinstaller_cmd.extend([
+            '--name', 'hvym-core',
+            'hvym.py'
+        ])
+
+        print(f"Running PyInstaller command: {' '.join(pyinstaller_cmd)}")
+
+        try:
+            subprocess.run(pyinstaller_cmd, check=True, cwd=self.build_dir)
+        except subprocess.CalledProcessError as e:
+            print(f"PyInstaller core build failed: {e}")
+            raise
+
     def run_experiments(self, platform_name: Optional[str] = None):
         """Run a small matrix of builds with diagnostic toggles and try a simple command.
 
@@ -497,7 +597,7 @@ class CrossPlatformBuilder:
                 self._install_dependencies()
                 self._build_executable(target)
 
-                exe_path = self.platform_configs[target]['dist_dir'] / self.platform_configs[target]['executable_name']
+                exe_path = self._executable_path(target)
                 if not exe_path.exists():
                     print(f"Executable not found at {exe_path}")
                     results[scenario['name']] = {"built": False, "ran": False, "rc": None}
@@ -556,17 +656,53 @@ def setup_environment():
         os.environ['QT_MAC_WANTS_LAYER'] = '1'
 ''')
     
+    def _executable_path(self, platform_name: str, core: bool = False) -> Path:
+        """Path of the built binary; onedir builds put it inside dist/<platform>/<name>/"""
+        config = self.platform_configs[platform_name]
+        name = config['core_executable_name'] if core else config['executable_name']
+        if self.layout == 'onedir':
+            return config['dist_dir'] / Path(name).stem / name
+        return config['dist_dir'] / name
+
+    def _compute_build_hash(self) -> str:
+        """Hash of sources, toolchain and build options, used to key the runtime cache"""
+        try:
+            pi_ver = subprocess.run(['pyinstaller', '--version'], capture_output=True, text=True).stdout.strip()
+        except Exception:
+            pi_ver = 'unknown'
+        extra = [
+            self.platform_info['platform'],
+            self.platform_info['machine'],
+            self.platform_info['python_version'],
+            pi_ver,
+            self.layout,
+            self.optimize,
+        ]
+        return compute_build_hash(self.src_files.values(), extra)
+
+    def _package_onedir(self, platform_name: str) -> Path:
+        """Stamp the onedir tree with its build hash and archive it for installation"""
+        config = self.platform_configs[platform_name]
+        onedir = config['dist_dir'] / 'hvym'
+        (onedir / BUILD_HASH_FILE).write_text(self.build_hash)
+        archive_format = 'zip' if platform_name == 'windows' else 'gztar'
+        archive = shutil.make_archive(
+            str(config['dist_dir'] / f'hvym-{platform_name}-onedir-{self.build_hash}'),
+            archive_format,
+            root_dir=onedir,
+        )
+        print(f"Created onedir archive: {archive}")
+        return Path(archive)
+
     def _set_executable_permissions(self, platform_name: str):
         """Set executable permissions for the built binary"""
-        config = self.platform_configs[platform_name]
-        executable_path = config['dist_dir'] / config['executable_name']
-        
-        if platform_name in ['linux', 'macos'] and executable_path.exists():
-            try:
-                os.chmod(executable_path, 0o755)
-                print(f"Set executable permissions for {executable_path}")
-            except Exception as e:
-                print(f"Warning: Could not set executable permissions: {e}")
+        for executable_path in (self._executable_path(platform_name), self._executable_path(platform_name, core=True)):
+            if platform_name in ['linux', 'macos'] and executable_path.exists():
+                try:
+                    os.chmod(executable_path, 0o755)
+                    print(f"Set executable permissions for {executable_path}")
+                except Exception as e:
+                    print(f"Warning: Could not set executable permissions: {e}")
     
     def _create_release_info(self, platform_name: str):
         """Create release information file"""
@@ -577,8 +713,15 @@ def setup_environment():
             'python_version': self.platform_info['python_version'],
             'build_date': subprocess.run(['date'], capture_output=True, text=True).stdout.strip(),
             'executable_name': config['executable_name'],
-            'executable_path': str(config['dist_dir'] / config['executable_name'])
+            'executable_path': str(self._executable_path(platform_name)),
+            'core_executable_name': config['core_executable_name'] if self.build_core else None,
+            'core_executable_path': str(self._executable_path(platform_name, core=True)) if self.build_core else None,
+            'layout': self.layout,
+            'optimize': self.optimize or '0',
+            'build_hash': self.build_hash
         }
+        if self.layout == 'onedir':
+            release_info['archive'] = str(self._package_onedir(platform_name))
         
         release_file = config['dist_dir'] / 'release_info.json'
         with open(release_file, 'w') as f:
@@ -619,7 +762,10 @@ def setup_environment():
             self._install_dependencies()
             
             # Build executable
+            self.build_hash = self._compute_build_hash()
             self._build_executable(platform_name)
+            if self.build_core:
+                self._build_core_executable(platform_name)
             
             # Set permissions
             self._set_executable_permissions(platform_name)
@@ -675,10 +821,16 @@ def main():
                        help='Show platform information and exit')
     parser.add_argument('--experiment', action='store_true',
                         help='Run experimental builds with diagnostics and execute version command')
+    parser.add_argument('--layout', choices=['onefile', 'onedir'],
+                        default=os.environ.get('HVYM_PYI_LAYOUT', 'onefile'),
+                        help='onefile binary (default) or onedir tree plus archive for the persistent runtime cache')
+    
+    parser.add_argument('--no-core', action='store_true',
+                        help='Skip the Qt-free hvym-core executable')
     
     args = parser.parse_args()
     
-    builder = CrossPlatformBuilder()
+    builder = CrossPlatformBuilder(layout=args.layout, build_core=not args.no_core)
     
     if args.info:
         print("Platform Information:")
@@ -7,15 +7,15 @@ import platform
 import json
 import time
 import hashlib
+import functools
 import re
 import copy
 import shutil
 import subprocess
-from base64 import b64encode
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, List, Any, Union, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from dataclasses_json import dataclass_json
 import click
 from lazy_loader import LazyImporter
@@ -77,6 +77,62 @@ def _ensure_qss_environment():
     """Ensure required QSS environment variables are set for runtime."""
     os.environ.setdefault("HVYM_USE_QSS", "1")
 
+# Commands that open Qt dialogs (directly or through a *_popup helper). The
+# Qt-free hvym-core build does not bundle PyQt5/qthvym and forwards these to the
+# full hvym executable shipped next to it. test_hvym_ui_commands.py checks this
+# against the commands that reach _get_hvym_interaction.
+_UI_COMMANDS = frozenset({
+    'custom-choice-prompt', 'custom-copy-line-prompt', 'custom-copy-text-prompt',
+    'custom-prompt', 'didc-bind-js-popup', 'didc-bind-ts-popup', 'img-to-url',
+    'pinggy-set-tier', 'pinggy-set-token', 'pintheon-set-network', 'pintheon-set-port',
+    'pintheon-setup', 'pintheon-tunnel-open', 'splash', 'stellar-load-keys',
+    'stellar-load-shared-pub', 'stellar-new-account', 'stellar-new-testnet-account',
+    'stellar-remove-account', 'stellar-select-keys', 'stellar-select-shared-pub',
+    'stellar-set-account', 'stellar-update-db-pw', 'up', 'ui-server',
+})
+
+CORE_EXECUTABLE_STEM = 'hvym-core'
+
+def _is_core_build():
+    """True when running as the frozen, Qt-free hvym-core executable."""
+    return getattr(sys, 'frozen', False) and Path(sys.executable).stem == CORE_EXECUTABLE_STEM
+
+def _full_executable():
+    """Locate the full (Qt) hvym executable that ships next to hvym-core."""
+    override = os.environ.get('HVYM_FULL_EXE')
+    if override:
+        return Path(override)
+    name = 'hvym.exe' if sys.platform == 'win32' else 'hvym'
+    exe = Path(sys.executable)
+    sibling = exe.with_name(name)
+    if sibling.exists():
+        return sibling
+    # onedir layout: dist/hvym-core/hvym-core next to dist/hvym/hvym
+    return exe.parent.parent / 'hvym' / name
+
+def _handoff_ui_command(argv):
+    """In hvym-core, replace the process with the full hvym for UI commands."""
+    if not _is_core_build() or len(argv) < 2 or argv[1] not in _UI_COMMANDS:
+        return
+    # With a UI server running, popups go over IPC and core can run the command
+    # itself; Stellar commands still need the SDK that only the full build has.
+    if argv[1] != 'ui-server' and not argv[1].startswith('stellar-') and os.environ.get('HVYM_UI_SERVER') != '0':
+        import hvym_ui_server
+        if hvym_ui_server.ping(CLI_PATH):
+            return
+    full = _full_executable()
+    if not full.exists():
+        print(f"'{argv[1]}' needs the full hvym executable, not found at {full}", file=sys.stderr)
+        sys.exit(1)
+    args = [str(full)] + argv[1:]
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if sys.platform == 'win32':
+        # os.execv on Windows spawns a new process and returns control to the
+        # caller early, which breaks callers waiting on our exit code.
+        sys.exit(subprocess.call(args))
+    os.execv(str(full), args)
+
 def _hvym_startup_diag():
     """Emit diagnostic information early in process startup when HVYM_DIAG=1.
 
@@ -265,6 +321,9 @@ NPM_LINKS = os.path.join(FILE_PATH, 'npm_links')
 DATA_PATH = os.path.join(FILE_PATH, 'data')
 SCRIPT_PATH = os.path.join(FILE_PATH, 'scripts')
 INSTALL_DIDC_SH = os.path.join(SCRIPT_PATH, 'install_didc.sh')
+# Overridable so benchmarks and tests can point at a local stand-in
+PINGGY_DEBUGGER_URL = os.environ.get('HVYM_PINGGY_DEBUGGER_URL', 'http://localhost:4300')
+FRIENDBOT_URL = os.environ.get('HVYM_FRIENDBOT_URL', 'https://horizon-testnet.stellar.org/friendbot/')
 FG_TXT_COLOR = '#98314a'
 
 # Database paths (lazy initialization)
@@ -607,6 +666,103 @@ def _open_encrypted_storage(pw):
       return { 'db':db, 'accounts': accounts}
 
 
+@functools.lru_cache(maxsize=None)
+def _fast_json_backend():
+      """'orjson' or 'msgspec' when installed, else None."""
+      for name in ('orjson', 'msgspec'):
+            try:
+                  __import__(name)
+            except ImportError:
+                  continue
+            return name
+      return None
+
+class _JsonCodec:
+      """JSON encode/decode for the Blender-facing commands.
+
+      Output is encoded with the stdlib by default, byte-identical to
+      json.dumps, because Blender add-ons parse it as text. With fast=True
+      (HVYM_JSON_FAST=1 or --fast-json) it uses orjson, then msgspec, when
+      installed: compact UTF-8 with the same values but without the spaces
+      after ','/':' and with non-ASCII text unescaped. Decoding always uses
+      the fast backend when there is one, since it does not affect output.
+      Data classes are encoded directly (no asdict copy) and records through
+      their shallow dict. Values a fast backend cannot encode (orjson rejects
+      integers over 64 bits) are retried with the stdlib. Both fast backends
+      write NaN and Infinity as null, where the stdlib writes the non-standard
+      NaN/Infinity tokens; finding them first would cost a full walk of the
+      data, so fast output keeps that difference.
+      """
+
+      def __init__(self, fast=False):
+            self.fast = fast
+
+      @property
+      def backend(self):
+            """The encoding backend: 'json', 'orjson' or 'msgspec'."""
+            return (self.fast and _fast_json_backend()) or 'json'
+
+      def set_fast(self, fast=True):
+            self.fast = fast
+
+      @staticmethod
+      def _default(obj):
+            if isinstance(obj, _record_base):
+                  return obj.dictionary
+            if hasattr(obj, '__dataclass_fields__'):
+                  return asdict(obj)
+            raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+      def loads(self, data):
+            backend = _fast_json_backend()
+            try:
+                  if backend == 'orjson':
+                        import orjson
+                        return orjson.loads(data)
+                  if backend == 'msgspec':
+                        import msgspec
+                        return msgspec.json.decode(data)
+            except ValueError:
+                  pass    # the stdlib decides, and words the error
+            return json.loads(data)
+
+      def dumpb(self, obj):
+            """Encode obj to UTF-8 bytes."""
+            backend = self.backend
+            try:
+                  if backend == 'orjson':
+                        import orjson
+                        return orjson.dumps(obj, default=self._default, option=orjson.OPT_NON_STR_KEYS)
+                  if backend == 'msgspec':
+                        import msgspec
+                        try:
+                              return msgspec.json.encode(obj, enc_hook=self._default)
+                        except msgspec.EncodeError:
+                              pass
+            except (TypeError, ValueError, OverflowError):
+                  pass
+            return json.dumps(obj, default=self._default).encode('utf-8')
+
+      def dumps(self, obj):
+            if self.backend == 'json':
+                  return json.dumps(obj, default=self._default)
+            return self.dumpb(obj).decode('utf-8')
+
+      def iterencode(self, obj):
+            """Stdlib encoding of obj in chunks, for streaming large documents."""
+            return json.JSONEncoder(default=self._default).iterencode(obj)
+
+_JSON = _JsonCodec(fast=os.environ.get('HVYM_JSON_FAST') == '1')
+
+def _fast_json_option(f):
+      """Add --fast-json, which switches _JSON to compact orjson/msgspec output."""
+      def enable(ctx, param, value):
+            if value:
+                  _JSON.set_fast()
+      return click.option('--fast-json', is_flag=True, expose_value=False, is_eager=True, callback=enable,
+                          help='Encode with orjson/msgspec when installed: compact JSON, not byte-identical to older releases (NaN/Infinity become null).')(f)
+
+
 #Material Data classes
 @dataclass_json
 @dataclass
@@ -617,7 +773,53 @@ class base_data_class:
 
       @property
       def json(self):
-            return json.dumps(self.dictionary)
+            return _JSON.dumps(self)
+
+
+# Blender parse hot loop: dataclass construction plus asdict's recursive deep
+# copy dominate the cost of large collections. Records mirror a data class's
+# fields in a __slots__ class with a generated __init__ and emit their dict
+# directly (nested values by reference), giving byte-identical JSON.
+# HVYM_RECORDS=0 falls back to the data classes.
+_USE_RECORDS = os.environ.get('HVYM_RECORDS') != '0'
+_RECORD_CLASSES = {}
+
+class _record_base:
+      __slots__ = ()
+      _fields = ()
+
+      @property
+      def json(self):
+            return _JSON.dumps(self)
+
+      def __eq__(self, other):
+            return type(self) is type(other) and all(getattr(self, n) == getattr(other, n) for n in self._fields)
+
+      def __repr__(self):
+            return f"{type(self).__name__}({', '.join(f'{n}={getattr(self, n)!r}' for n in self._fields)})"
+
+def _record(data_class):
+      """Return the cached __slots__ record class for data_class (or data_class itself when records are off)."""
+      if not _USE_RECORDS:
+            return data_class
+      record = _RECORD_CLASSES.get(data_class)
+      if record is None:
+            names = tuple(f.name for f in fields(data_class))
+            assigns = ''.join(f'\n      self.{n} = {n}' for n in names) or '\n      pass'
+            items = ', '.join(f'{n!r}: self.{n}' for n in names)
+            source = (f"def __init__(self, {', '.join(names)}):{assigns}\n"
+                      f"def dictionary(self):\n      return {{{items}}}\n")
+            namespace = {}
+            exec(source, namespace)
+            record = type(f'{data_class.__name__}_record', (_record_base,), {
+                  '__slots__': names,
+                  '_fields': names,
+                  '__init__': namespace['__init__'],
+                  'dictionary': property(namespace['dictionary']),
+                  '__module__': __name__,
+            })
+            _RECORD_CLASSES[data_class] = record
+      return record
 
 
 @dataclass_json
@@ -1416,10 +1618,20 @@ def _get_session(chain):
 
       return path
 
-def _download_unzip(url, out_path):
-      with urlopen(url) as zipresp:
-          with ZipFile(BytesIO(zipresp.read())) as zfile:
-              zfile.extractall(out_path)
+# HVYM_OFFLINE=1 serves project templates from the download cache only.
+_TEMPLATE_ZIPS = (MODEL_DEBUG_ZIP, MODEL_MINTER_ZIP, CUSTOM_CLIENT_ZIP, ASSETS_CLIENT_ZIP)
+
+def _template_cache():
+      import hvym_template_cache
+      return hvym_template_cache.TemplateCache(hvym_template_cache.cache_root(CLI_PATH))
+
+def _download_unzip(url, out_path, offline=None):
+      """Unpack the archive at url into out_path, from the download cache when it is current."""
+      if offline is None:
+            offline = os.environ.get('HVYM_OFFLINE') == '1'
+      cache = _template_cache()
+      tree, _ = cache.fetch(url, offline=offline)
+      cache.materialize(tree, out_path)
 
 # Architecture detection now handled by _get_platform_info() function
 
@@ -1609,29 +1821,134 @@ def _npm_list_links():
       output = subprocess.run(command, shell=True, capture_output=True, text=True)
       return re.split(r'\s+|\n', output.stdout)
 
-def _module_is_linked(module):
-      result = False
-      for txt in _npm_list_links():
-            if module in txt:
-                  result = True
-                  break
-      return result
+NPM_PREFIX_FILE = 'npm_prefix.json'
+
+def _npmrc_paths(npm):
+      """The user and global npmrc files that can set the global prefix."""
+      user = os.environ.get('NPM_CONFIG_USERCONFIG') or os.environ.get('npm_config_userconfig') or os.path.join(Path.home(), '.npmrc')
+      # Without an override npm reads <node prefix>/etc/npmrc, next to the bin dir holding npm
+      node_prefix = os.path.dirname(os.path.dirname(os.path.realpath(npm)))
+      default_global = os.path.join(node_prefix, 'npmrc' if IS_WINDOWS else os.path.join('etc', 'npmrc'))
+      return [user, os.environ.get('NPM_CONFIG_GLOBALCONFIG') or os.environ.get('npm_config_globalconfig') or default_global]
+
+def _npm_prefix_key(npm):
+      """What the cached `npm prefix -g` answer depends on: npm itself, prefix overrides and npmrc mtimes."""
+      mtimes = []
+      for path in _npmrc_paths(npm):
+            try:
+                  mtimes.append([path, os.stat(path).st_mtime])
+            except OSError:
+                  mtimes.append([path, None])
+      return [os.path.realpath(npm), os.environ.get('NPM_CONFIG_PREFIX') or os.environ.get('npm_config_prefix'), mtimes]
+
+@functools.lru_cache(maxsize=None)
+def _npm_global_prefix(use_cache=True):
+      """Return (npm global prefix, True if it came from the cache file), or None if npm is unavailable.
+
+      `npm prefix -g` starts Node, so its answer is kept in CLI_PATH and
+      reused for as long as the same npm binary, prefix settings and npmrc
+      files are in effect. use_cache=False asks npm again and rewrites it.
+      """
+      npm = shutil.which('npm')
+      if npm is None:
+            return None
+      key = _npm_prefix_key(npm)
+      cache_file = os.path.join(CLI_PATH, NPM_PREFIX_FILE)
+      if use_cache:
+            try:
+                  with open(cache_file, 'r', encoding='utf-8') as f:
+                        cached = json.load(f)
+                  if cached.get('key') == key and os.path.isdir(cached.get('prefix', '')):
+                        return cached['prefix'], True
+            except (OSError, ValueError, AttributeError):
+                  pass
+      output = subprocess.run('npm prefix -g', shell=True, capture_output=True, text=True)
+      prefix = output.stdout.strip()
+      if output.returncode != 0 or not prefix:
+            return None
+      try:
+            os.makedirs(CLI_PATH, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                  json.dump({'key': key, 'prefix': prefix}, f)
+      except OSError:
+            pass
+      return prefix, False
+
+def _npm_global_modules(prefix):
+      """The global node_modules directory under an npm global prefix."""
+      return os.path.join(prefix, 'node_modules') if IS_WINDOWS else os.path.join(prefix, 'lib', 'node_modules')
+
+def _is_link(path):
+      # npm link makes symlinks, or junctions on Windows
+      return os.path.islink(path) or (hasattr(os.path, 'isjunction') and os.path.isjunction(path))
+
+def _scan_npm_links(root):
+      links = {}
+      try:
+            entries = list(os.scandir(root))
+      except FileNotFoundError:
+            return links
+      for entry in entries:
+            if entry.name.startswith('@') and entry.is_dir() and not _is_link(entry.path):
+                  with os.scandir(entry.path) as scoped:
+                        links.update((f'{entry.name}/{e.name}', os.path.realpath(e.path)) for e in scoped if _is_link(e.path))
+            elif _is_link(entry.path):
+                  links[entry.name] = os.path.realpath(entry.path)
+      return links
+
+def _npm_linked_modules(modules=()):
+      """Return {package name: link target} for every `npm link`ed global package, or None without npm.
+
+      Reads the symlinks in the global node_modules directly, scoped
+      packages (@scope/name) included, instead of running `npm ls`. If any
+      of `modules` is missing and the prefix came from the cache, npm is
+      asked for the prefix again in case it moved, and the scan repeated.
+      """
+      found = _npm_global_prefix()
+      if found is None:
+            return None
+      prefix, from_cache = found
+      links = _scan_npm_links(_npm_global_modules(prefix))
+      if from_cache and any(m is not None and m not in links for m in modules):
+            fresh = _npm_global_prefix(use_cache=False)
+            if fresh is not None and fresh[0] != prefix:
+                  links = _scan_npm_links(_npm_global_modules(fresh[0]))
+      return links
+
+def _module_is_linked(module, links=None):
+      """Whether module is `npm link`ed globally; pass links from _npm_linked_modules() to check many modules."""
+      if module is None:
+            return False
+      if links is None:
+            links = _npm_linked_modules()
+      if links is None:
+            # No usable npm prefix: fall back to npm's own listing
+            return any(module in txt for txt in _npm_list_links())
+      return module in links
+
+def _npm_link_packages(npm_links):
+      """Return [(package dir, package name or None)] for the packages in the npm_links folder."""
+      packages = []
+      for dirpath in next(os.walk(npm_links))[1]:
+            module_path = os.path.join(npm_links, dirpath)
+            pkg_json = os.path.join(module_path, 'package.json')
+            module = None
+            if os.path.isfile(pkg_json):
+                  with open(pkg_json, 'r', encoding='utf-8') as file:
+                        module = json.load(file)['name']
+            packages.append((module_path, module))
+      return packages
 
 def _update_hvym_npm_modules():
       home = Path.home()
       npm_links = home / '.local' / 'share' / 'heavymeta-cli' / 'npm_links'
 
-      for dirpath in next(os.walk(str(npm_links)))[1]:
-                  module_path = os.path.join(npm_links, dirpath)
-                  pkg_json = os.path.join(module_path, 'package.json')
-                  module = None
-                  if os.path.isfile(pkg_json):
-                        with open(pkg_json, 'r+', encoding='utf-8') as file:
-                              data = json.load(file)
-                              module = data['name']
-                  if not _module_is_linked(module):
-                        if os.path.isdir(module_path):
-                              _npm_unlink(module)
+      modules = _npm_link_packages(str(npm_links))
+      links = _npm_linked_modules([module for _, module in modules])
+      for module_path, module in modules:
+            if not _module_is_linked(module, links):
+                  if os.path.isdir(module_path):
+                        _npm_unlink(module)
 
       for item in npm_links.iterdir():
         if item.name != '.git' and item.name != 'README.md' and item.name != 'install.sh':
@@ -1655,15 +1972,10 @@ def _link_hvym_npm_modules():
                   print("Copy custom backend failed with:", str(e))
                   return
 
-            for dirpath in next(os.walk(npm_links))[1]:
-                  module_path = os.path.join(npm_links, dirpath)
-                  pkg_json = os.path.join(module_path, 'package.json')
-                  module = None
-                  if os.path.isfile(pkg_json):
-                        with open(pkg_json, 'r+', encoding='utf-8') as file:
-                              data = json.load(file)
-                              module = data['name']
-                  if not _module_is_linked(module):
+            modules = _npm_link_packages(npm_links)
+            links = _npm_linked_modules([module for _, module in modules])
+            for module_path, module in modules:
+                  if not _module_is_linked(module, links):
                         if os.path.isdir(module_path):
                               _npm_install(module_path)
                               _npm_new_link(module_path)
@@ -1679,31 +1991,43 @@ def _add_db_file():
       dst = os.path.join(CLI_PATH, 'db.json')
       shutil.copyfile(src, dst)
 
+@functools.lru_cache(maxsize=None)
+def _creator_hash(principal):
+      return _create_hex(principal).upper()
+
 def _parse_hvym_data(hvym_data, model):
       all_val_props = {}
       all_call_props = {}
+      collections = {}
       contract_props = None
       data = {}
       # ICP functions removed - using default values
       active = "default"
       principal = "anonymous"
-      creator_hash = _create_hex(principal.encode('utf-8')).upper()
+      creator_hash = _creator_hash(principal)
 
       for key, value in hvym_data.items():
           if key != 'contract':
+                val_props = {}
+                call_props = {}
                 for propType, props in value.items():
                       if propType == 'valProps':
                             for name, prop in props.items():
                               if prop['prop_action_type'] != 'Static' and not prop['immutable']:
-                                    all_val_props[name] = prop
+                                    val_props[name] = prop
                       if propType == 'callProps':
-                            for name, prop in props.items():
-                                  all_call_props[name] = prop
+                            call_props.update(props)
+                all_val_props.update(val_props)
+                all_call_props.update(call_props)
+                if val_props or call_props:
+                      collections[key] = {'valProps': val_props, 'callProps': call_props}
           else:
                 contract_props = value
 
       data['valProps'] = all_val_props
       data['callProps'] = all_call_props
+      # The same mutable props, grouped by the collection they belong to
+      data['collections'] = collections
       data['contract'] = contract_props
       data['creatorHash'] = creator_hash
       data['model'] = model
@@ -1712,92 +2036,305 @@ def _parse_hvym_data(hvym_data, model):
       return data
 
 def _load_hvym_data(model_path):
-      gltf = None
+      import hvym_glb
       result = None
       if os.path.isfile(model_path):
-            gltf = GLTF2().load(model_path)
-            if 'HVYM_nft_data' in gltf.extensions.keys():
-              result = gltf.extensions['HVYM_nft_data']
-            else:
+            # Reads only the JSON chunk, never the binary buffer
+            result = hvym_glb.read_extension(model_path, 'HVYM_nft_data', _JSON.loads)
+            if result is None:
               click.echo("No Heavymeta Data in model.")
 
       return result
 
-def _render_template(template_file, data, out_file_path):
-      file_loader = FileSystemLoader(FILE_PATH / 'templates')
-      env = Environment(loader=file_loader)
-      template = env.get_template(template_file)
+# _hvym_model_data results in this process, keyed by (path, size, mtime)
+_HVYM_MODEL_CACHE = {}
+_HVYM_MODEL_CACHE_SIZE = 64
+
+def _hvym_model_data(model_path, use_index=True):
+      """Return the _parse_hvym_data view of a model file, or None if it has no Heavymeta data.
+
+      Memoized per file version in memory and, with use_index, in the asset
+      index (`hvym assets`), so rendering many templates from one model
+      reads and traverses its data once. The result is shared: treat it as
+      read-only.
+      """
+      path = os.path.abspath(model_path)
+      st = os.stat(path)
+      key = (path, st.st_size, st.st_mtime)
+      if key in _HVYM_MODEL_CACHE:
+            return _HVYM_MODEL_CACHE[key]
+
+      index = row = None
+      if use_index:
+            import hvym_asset_index
+            import sqlite3
+            try:
+                  index = hvym_asset_index.AssetIndex(hvym_asset_index.index_path(CLI_PATH))
+                  row = index.get(path)
+            except sqlite3.Error:
+                  index = None
+      try:
+            fresh = row is not None and (row['size'], row['mtime']) == key[1:] and not row['error']
+            if fresh:
+                  parsed = _JSON.loads(row['parsed']) if row['parsed'] else None
+                  # Entries indexed before props were grouped by collection are re-read
+                  fresh = parsed is None or 'collections' in parsed
+            if not fresh:
+                  row = _index_hvym_file((path, st.st_size, st.st_mtime, False, None))
+                  if row.get('error'):
+                        raise ValueError(f"{model_path}: {row['error']}")
+                  parsed = _JSON.loads(row['parsed']) if row.get('parsed') else None
+                  if index is not None:
+                        index.upsert([row])
+      finally:
+            if index is not None:
+                  index.close()
+
+      if len(_HVYM_MODEL_CACHE) >= _HVYM_MODEL_CACHE_SIZE:
+            _HVYM_MODEL_CACHE.pop(next(iter(_HVYM_MODEL_CACHE)))
+      _HVYM_MODEL_CACHE[key] = parsed
+      return parsed
+
+# Compiled templates are cached here, one file per template source checksum
+TEMPLATE_CACHE_DIR = 'template_cache'
+
+@functools.lru_cache(maxsize=None)
+def _template_env():
+      """The shared Jinja environment for the project templates.
+
+      Templates are compiled once per process (and reloaded if their file's
+      mtime changes); the compiled bytecode is also kept under CLI_PATH, so
+      later runs skip compilation until the template source changes.
+      """
+      modules = lazy_importer.get_modules('templating')
+      bytecode_cache = None
+      cache_dir = os.path.join(CLI_PATH, TEMPLATE_CACHE_DIR)
+      try:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = modules['FileSystemBytecodeCache'](cache_dir)
+      except OSError:
+            pass
+      return modules['Environment'](loader=modules['FileSystemLoader'](FILE_PATH / 'templates'),
+                                    bytecode_cache=bytecode_cache, auto_reload=True)
 
-      with open(out_file_path, 'w') as f:
-        output = template.render(data=data)
-        f.write(output)
+def _render_template(template_file, data, out_file_path):
+      """Render template_file to out_file_path; return False if the file already held that output.
+
+      The output is streamed to a temp file beside out_file_path, which then
+      replaces it atomically. When the new output is byte-identical the old
+      file is left alone, so its mtime does not change and file watchers and
+      bundlers are not triggered.
+      """
+      import filecmp
+      import threading
+      template = _template_env().get_template(template_file)
+      out_file_path = os.path.abspath(out_file_path)
+      out_dir, name = os.path.split(out_file_path)
+      tmp = os.path.join(out_dir, f'.{name}.{os.getpid()}.{threading.get_ident()}.tmp')
+      try:
+            # Written as it is generated, without building the whole output in memory
+            with open(tmp, 'w') as f:
+              f.writelines(template.generate(data=data))
+            if os.path.isfile(out_file_path) and filecmp.cmp(tmp, out_file_path, shallow=False):
+                  os.unlink(tmp)
+                  return False
+            os.replace(tmp, out_file_path)
+      except BaseException:
+            if os.path.exists(tmp):
+                  os.unlink(tmp)
+            raise
+      return True
+
+def _render_plan(plan, data, jobs=None):
+      """Render a list of (template_file, out_file_path) pairs against the same data.
+
+      Templates share the cached environment and are rendered on a thread
+      pool (jobs=1 renders in order). Returns {out_file_path: True if
+      written, False if unchanged}; the first failure is raised once every
+      other entry has finished.
+      """
+      from concurrent.futures import ThreadPoolExecutor
+      plan = list(plan)
+      if jobs is None:
+            jobs = min(len(plan), os.cpu_count() or 1, 8)
+      if jobs <= 1 or len(plan) <= 1:
+            return {out: _render_template(template, data, out) for template, out in plan}
+
+      # Compile everything up front so the workers only render
+      env = _template_env()
+      for template, _ in plan:
+            env.get_template(template)
+      with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [(out, pool.submit(_render_template, template, data, out)) for template, out in plan]
+      return {out: future.result() for out, future in futures}
 
 def _svg_to_data_url(svgfile):
-    tree = ET.parse(svgfile)
-    root = tree.getroot()
-
-    # Remove XML declaration and namespaces
-    if len(root.attrib) > 0:
-      if 'xmlns' in root.attrib:
-        root.attrib.pop('xmlns')
-        for child in root:
-            child.attrib.pop('xmlns', None)
-    
-    svg_str = ET.tostring(root, encoding='unicode')
-    
-    # Convert SVG to base64 and format it as a data URL
-    return f"data:image/svg+xml;base64,{b64encode(svg_str.encode('utf-8')).decode('utf-8')}"
+    import hvym_data_url
+    return hvym_data_url.data_url(svgfile, 'image/svg+xml')
 
 
 def _png_to_data_url(pngfile):
-    with open(pngfile, "rb") as image_file:
-        encoded_string = b64encode(image_file.read()).decode('utf-8')
-    
-    return f"data:image/png;base64,{encoded_string}"
+    import hvym_data_url
+    return hvym_data_url.data_url(pngfile, 'image/png')
+
+
+# Encode uncached assets in a process pool once they add up to this many bytes
+_ENCODE_PARALLEL_BYTES = 32 << 20
+
+def _asset_content_key(entry):
+      import hvym_data_url
+      path, mime, optimize = entry
+      return hvym_data_url.content_key(path, mime, 'optimized' if optimize else '')
+
+def _encode_asset(entry):
+      """Process pool worker: the data URL of one (path, mime, optimize) asset as bytes."""
+      import hvym_data_url
+      path, mime, optimize = entry
+      return b''.join(hvym_data_url.iter_data_url(path, mime, optimize=optimize))
+
+def _cached_data_urls(entries, optimize=False, jobs=None, use_cache=True):
+      """Return {path: data URL bytes} for (path, mime) entries, in order, through the data URL cache."""
+      import sqlite3
+      import hvym_data_url
+      from concurrent.futures import ThreadPoolExecutor
+      entries = list(dict.fromkeys((path, mime, optimize) for path, mime in entries))
+      urls = {}
+      keys = {}
+      cache = None
+      if use_cache:
+            try:
+                  cache = hvym_data_url.DataUrlCache(hvym_data_url.cache_path(CLI_PATH))
+            except sqlite3.Error as e:
+                  click.echo(f'Data URL cache unavailable, encoding everything: {e}', err=True)
+      try:
+            if cache is not None:
+                  # hashlib releases the GIL, so threads hash files in parallel
+                  with ThreadPoolExecutor(max_workers=min(len(entries), os.cpu_count() or 1, 8)) as pool:
+                        keys = dict(zip(entries, pool.map(_asset_content_key, entries)))
+                  found = cache.get(keys.values())
+                  urls = {entry[0]: found[keys[entry]] for entry in entries if keys[entry] in found}
+
+            misses = [entry for entry in entries if entry[0] not in urls]
+            if jobs is None:
+                  large = sum(os.path.getsize(entry[0]) for entry in misses) >= _ENCODE_PARALLEL_BYTES
+                  # Optimizing is CPU heavy even for small images
+                  jobs = (os.cpu_count() or 1) if large or (optimize and len(misses) > 1) else 1
+            jobs = max(1, min(jobs, len(misses) or 1))
+            if jobs > 1:
+                  from concurrent.futures import ProcessPoolExecutor
+                  with ProcessPoolExecutor(max_workers=jobs) as pool:
+                        encoded = list(pool.map(_encode_asset, misses))
+            else:
+                  encoded = [_encode_asset(entry) for entry in misses]
+            for entry, url in zip(misses, encoded):
+                  urls[entry[0]] = url
+
+            if cache is not None and misses:
+                  cache.put({keys[entry]: url for entry, url in zip(misses, encoded)})
+      except (OSError, ET.ParseError) as e:
+            raise click.ClickException(str(e))
+      finally:
+            if cache is not None:
+                  cache.close()
+      return {entry[0]: urls[entry[0]] for entry in entries}
+
+def _report_data_url_savings(urls):
+      """Print to stderr how much smaller each optimized image is than its file."""
+      import hvym_data_url
+      total_before = total_after = 0
+      for path, url in urls.items():
+            before = os.path.getsize(path)
+            after = hvym_data_url.decoded_size(url)
+            total_before += before
+            total_after += after
+            saved = 100 * (before - after) / before if before else 0
+            click.echo(f'{path}: {before} -> {after} bytes ({saved:.1f}% smaller)', err=True)
+      if len(urls) > 1 and total_before:
+            saved = 100 * (total_before - total_after) / total_before
+            click.echo(f'total: {total_before} -> {total_after} bytes ({saved:.1f}% smaller)', err=True)
+
+def _echo_data_urls(files, mime, out_dir=None, optimize=False):
+      """Stream the data URL of each file to stdout, one per line, or to <out_dir>/<file name>.txt."""
+      import hvym_data_url
+      if out_dir is not None:
+            # Checked before writing anything, so a clash never leaves half the outputs behind
+            targets = {}
+            for path in files:
+                  name = os.path.normcase(os.path.basename(path))
+                  other = targets.setdefault(name, path)
+                  if os.path.abspath(other) != os.path.abspath(path):
+                        raise click.BadParameter(f'{other} and {path} would both be written to {os.path.basename(path)}.txt',
+                                                 param_hint='--out-dir')
+      # Optimized output is built in memory anyway, so it goes through the cache
+      urls = _cached_data_urls([(path, mime) for path in files], optimize=True) if optimize else None
+      if out_dir is None:
+            sys.stdout.flush()
+            out = click.get_binary_stream('stdout')
+      for path in files:
+            try:
+                  if out_dir is None:
+                        if urls is not None:
+                              out.write(urls[path])
+                        else:
+                              hvym_data_url.write_data_url(path, out, mime)
+                        out.write(b'\n')
+                        continue
+                  target = os.path.join(out_dir, os.path.basename(path) + '.txt')
+                  with open(target, 'wb') as f:
+                        if urls is not None:
+                              f.write(urls[path])
+                        else:
+                              hvym_data_url.write_data_url(path, f, mime)
+            except (OSError, ET.ParseError) as e:
+                  raise click.ClickException(f'{path}: {e}')
+      if out_dir is None:
+            out.flush()
+      if urls is not None:
+            _report_data_url_savings(urls)
 
 
 def parse_val_prop(obj):
       result = None
 
       if obj['prop_action_type'] == 'Immutable' or obj['prop_action_type'] == 'Static':
-            result = int_data_class(obj['prop_slider_type'],
-                                          obj['show'],
-                                          obj['prop_slider_type'],
-                                          obj['prop_action_type'],
-                                          obj['int_default'],
-                                          obj['int_min'],
-                                          obj['int_max'],
-                                          obj['prop_immutable']).dictionary
+            result = _record(int_data_class)(obj['prop_slider_type'],
+                                                   obj['show'],
+                                                   obj['prop_slider_type'],
+                                                   obj['prop_action_type'],
+                                                   obj['int_default'],
+                                                   obj['int_min'],
+                                                   obj['int_max'],
+                                                   obj['prop_immutable']).dictionary
       else:
-            result = cremental_int_data_class(obj['prop_slider_type'],
-                                                obj['show'], 
-                                                obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['int_default'],
-                                                obj['int_min'],
-                                                obj['int_max'],
-                                                obj['prop_immutable'],
-                                                obj['int_amount']).dictionary
+            result = _record(cremental_int_data_class)(obj['prop_slider_type'],
+                                                         obj['show'], 
+                                                         obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['int_default'],
+                                                         obj['int_min'],
+                                                         obj['int_max'],
+                                                         obj['prop_immutable'],
+                                                         obj['int_amount']).dictionary
                 
       if obj['prop_value_type'] == 'Float':
             if obj['prop_action_type'] == 'Immutable' or obj['prop_action_type'] == 'Static':
-                  result = int_data_class(obj['prop_slider_type'],
-                                                obj['show'],
-                                                obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['float_default'],
-                                                obj['float_min'],
-                                                obj['float_max'],
-                                                obj['prop_immutable']).dictionary
+                  result = _record(int_data_class)(obj['prop_slider_type'],
+                                                         obj['show'],
+                                                         obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['float_default'],
+                                                         obj['float_min'],
+                                                         obj['float_max'],
+                                                         obj['prop_immutable']).dictionary
             else:
-                  result = cremental_float_data_class(obj['prop_slider_type'],
-                                                obj['show'], obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['float_default'],
-                                                obj['float_min'],
-                                                obj['float_max'],
-                                                obj['prop_immutable'],
-                                                obj['float_amount']).dictionary
+                  result = _record(cremental_float_data_class)(obj['prop_slider_type'],
+                                                         obj['show'], obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['float_default'],
+                                                         obj['float_min'],
+                                                         obj['float_max'],
+                                                         obj['prop_immutable'],
+                                                         obj['float_amount']).dictionary
 
       return result
 
@@ -1806,48 +2343,48 @@ def parse_behavior_val_prop(obj):
       result = None
 
       if obj['prop_action_type'] == 'Immutable' or obj['prop_action_type'] == 'Static':
-            result = int_data_behavior_class(obj['prop_slider_type'],
-                                          obj['show'],
-                                          obj['prop_slider_type'],
-                                          obj['prop_action_type'],
-                                          obj['int_default'],
-                                          obj['int_min'],
-                                          obj['int_max'],
-                                          obj['prop_immutable'],
-                                          obj['behavior_set']).dictionary
+            result = _record(int_data_behavior_class)(obj['prop_slider_type'],
+                                                   obj['show'],
+                                                   obj['prop_slider_type'],
+                                                   obj['prop_action_type'],
+                                                   obj['int_default'],
+                                                   obj['int_min'],
+                                                   obj['int_max'],
+                                                   obj['prop_immutable'],
+                                                   obj['behavior_set']).dictionary
       else:
-            result = cremental_int_data_behavior_class(obj['prop_slider_type'],
-                                                obj['show'], 
-                                                obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['int_default'],
-                                                obj['int_min'],
-                                                obj['int_max'],
-                                                obj['prop_immutable'],
-                                                obj['int_amount'],
-                                                obj['behavior_set']).dictionary
+            result = _record(cremental_int_data_behavior_class)(obj['prop_slider_type'],
+                                                         obj['show'], 
+                                                         obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['int_default'],
+                                                         obj['int_min'],
+                                                         obj['int_max'],
+                                                         obj['prop_immutable'],
+                                                         obj['int_amount'],
+                                                         obj['behavior_set']).dictionary
                 
       if obj['prop_value_type'] == 'Float':
             if obj['prop_action_type'] == 'Immutable' or obj['prop_action_type'] == 'Static':
-                  result = int_data_behavior_class(obj['prop_slider_type'],
-                                                obj['show'],
-                                                obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['float_default'],
-                                                obj['float_min'],
-                                                obj['float_max'],
-                                                obj['prop_immutable'],
-                                                obj['behavior_set']).dictionary
+                  result = _record(int_data_behavior_class)(obj['prop_slider_type'],
+                                                         obj['show'],
+                                                         obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['float_default'],
+                                                         obj['float_min'],
+                                                         obj['float_max'],
+                                                         obj['prop_immutable'],
+                                                         obj['behavior_set']).dictionary
             else:
-                  result = cremental_float_data_behavior_class(obj['prop_slider_type'],
-                                                obj['show'], obj['prop_slider_type'],
-                                                obj['prop_action_type'],
-                                                obj['float_default'],
-                                                obj['float_min'],
-                                                obj['float_max'],
-                                                obj['prop_immutable'],
-                                                obj['float_amount'],
-                                                obj['behavior_set']).dictionary
+                  result = _record(cremental_float_data_behavior_class)(obj['prop_slider_type'],
+                                                         obj['show'], obj['prop_slider_type'],
+                                                         obj['prop_action_type'],
+                                                         obj['float_default'],
+                                                         obj['float_min'],
+                                                         obj['float_max'],
+                                                         obj['prop_immutable'],
+                                                         obj['float_amount'],
+                                                         obj['behavior_set']).dictionary
 
       return result
 
@@ -1857,229 +2394,767 @@ def cli():
       pass
 
 
-@click.command('parse-blender-hvym-interactables')
-@click.argument('obj_data', type=str)
-def parse_blender_hvym_interactables(obj_data):
-      """Return parsed interactables data structure from blender for heavymeta gltf extension"""
-      objs = json.loads(obj_data)
+# Blender field feeding each interactable_data_class field, in field order;
+# mesh_set and behavior are derived from 'children' and the fields below.
+_INTERACTABLE_COLUMNS = (
+      'hvym_interactable', 'hvym_interactable_has_return', 'hvym_mesh_interaction_type',
+      'hvym_interactable_selector_dir', 'hvym_mesh_interaction_name', 'hvym_mesh_interaction_call',
+      'hvym_mesh_interaction_default_text', 'hvym_mesh_interaction_text_scale',
+      'hvym_mesh_interaction_text_wrap', 'hvym_mesh_interaction_param_type',
+      'hvym_mesh_interaction_slider_param_type', 'hvym_mesh_interaction_toggle_param_type',
+      'hvym_mesh_interaction_string_param', 'hvym_mesh_interaction_int_param',
+      'hvym_mesh_interaction_float_default', 'hvym_mesh_interaction_float_min',
+      'hvym_mesh_interaction_float_max', 'hvym_mesh_interaction_int_default', 'hvym_mesh_interaction_int_min',
+      'hvym_mesh_interaction_int_max', 'hvym_mesh_interaction_toggle_state', 'hvym_mesh_interaction_toggle_int',
+)
+_INTERACTABLE_FIELDS = frozenset(_INTERACTABLE_COLUMNS[1:] + ('name', 'children', 'hvym_interactable_behavior'))
+# Reserved keys of a columnar interactables document; Blender object names may be anything else
+_INTERACTABLE_COLUMNS_KEY = '__columns__'
+_INTERACTABLE_COLUMNS_FORMAT = 1
+# (min, default, max) fields checked by the columnar mode
+_INTERACTABLE_RANGES = (
+      ('hvym_mesh_interaction_float_min', 'hvym_mesh_interaction_float_default', 'hvym_mesh_interaction_float_max'),
+      ('hvym_mesh_interaction_int_min', 'hvym_mesh_interaction_int_default', 'hvym_mesh_interaction_int_max'),
+)
+# Columnar documents with at least this many rows are split across a process
+# pool when --jobs is not given.
+_INTERACTABLE_PARALLEL_ROWS = 50000
+# Importing NumPy costs about as much as checking this many rows in Python
+_INTERACTABLE_NUMPY_ROWS = 50000
+
+def _check_interactables(objs, path='$'):
+      """Return [(json_path, message)] for every interactable object that cannot be parsed."""
+      if not isinstance(objs, dict):
+            return [(path, 'expected an object')]
+      errors = []
+      for key, obj in objs.items():
+            obj_path = _json_path(path, key)
+            if not isinstance(obj, dict):
+                  errors.append((obj_path, 'expected an object'))
+                  continue
+            if 'hvym_interactable' not in obj:
+                  errors.append((f'{obj_path}.hvym_interactable', _MISSING))
+                  continue
+            if not obj['hvym_interactable']:
+                  continue
+            errors.extend((f'{obj_path}.{f}', _MISSING) for f in sorted(_INTERACTABLE_FIELDS.difference(obj)))
+            if 'name' in obj and not isinstance(obj['name'], str):
+                  errors.append((f'{obj_path}.name', 'expected a string'))
+            if 'children' in obj:
+                  errors.extend(_check_children(obj['children'], f'{obj_path}.children'))
+      return errors
+
+def _check_children(children, path):
+      if not isinstance(children, list):
+            return [(path, 'expected an array')]
+      errors = []
+      for n, child in enumerate(children):
+            if not isinstance(child, dict) or 'type' not in child:
+                  errors.append((f'{path}[{n}].type', _MISSING))
+            elif child['type'] == 'MESH' and 'name' not in child:
+                  errors.append((f'{path}[{n}].name', _MISSING))
+      return errors
+
+def _is_number(value):
+      return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+def _range_error_rows(columns, active, use_numpy=True):
+      """Yield (row, (min, default, max) fields) for active rows breaking min <= default <= max.
+
+      NumPy, when installed, checks each field triple over all rows at once;
+      otherwise (or for columns it cannot convert) rows are checked one by one.
+      """
+      np = None
+      if use_numpy:
+            try:
+                  import numpy as np
+            except ImportError:
+                  pass
+      for triple in _INTERACTABLE_RANGES:
+            lo, value, hi = (columns[f] for f in triple)
+            rows = None
+            if np is not None:
+                  try:
+                        lo_a, value_a, hi_a = (np.asarray(c, dtype=np.float64) for c in (lo, value, hi))
+                  except (TypeError, ValueError):
+                        pass
+                  else:
+                        bad = (lo_a > hi_a) | (value_a < lo_a) | (value_a > hi_a)
+                        # NaN (from None) fails every comparison above
+                        bad |= np.isnan(lo_a) | np.isnan(value_a) | np.isnan(hi_a)
+                        rows = np.flatnonzero(bad & np.asarray(active, dtype=bool)).tolist()
+            if rows is None:
+                  rows = [i for i, (on, l, v, h) in enumerate(zip(active, lo, value, hi))
+                          if on and not (_is_number(l) and _is_number(v) and _is_number(h) and l <= v <= h)]
+            for i in rows:
+                  yield i, triple
+
+def _check_interactable_columns(columns, use_numpy=None, path='$.__columns__'):
+      """Return [(json_path, message)] for a columnar interactables document.
+
+      use_numpy=None uses NumPy (if installed) from _INTERACTABLE_NUMPY_ROWS rows up.
+      """
+      if not isinstance(columns, dict):
+            return [(path, 'expected an object')]
+      required = _INTERACTABLE_FIELDS | {'hvym_interactable'}
+      errors = [(f'{path}.{f}', _MISSING) for f in sorted(required.difference(columns))]
+      if errors:
+            return errors
+      rows = len(columns['name']) if isinstance(columns['name'], list) else 0
+      for f in sorted(required):
+            if not isinstance(columns[f], list):
+                  errors.append((f'{path}.{f}', 'expected an array'))
+            elif len(columns[f]) != rows:
+                  errors.append((f'{path}.{f}', f'expected {rows} values, got {len(columns[f])}'))
+      if errors:
+            return errors
+      if use_numpy is None:
+            use_numpy = rows >= _INTERACTABLE_NUMPY_ROWS
+      active = columns['hvym_interactable']
+      for i, (on, name, children) in enumerate(zip(active, columns['name'], columns['children'])):
+            if on:
+                  if not isinstance(name, str):
+                        errors.append((f'{path}.name[{i}]', 'expected a string'))
+                  errors.extend(_check_children(children, f'{path}.children[{i}]'))
+      for i, (lo_f, value_f, hi_f) in _range_error_rows(columns, active, use_numpy):
+            lo, value, hi = columns[lo_f][i], columns[value_f][i], columns[hi_f][i]
+            if not all(_is_number(v) for v in (lo, value, hi)):
+                  bad = next(f for f, v in ((lo_f, lo), (value_f, value), (hi_f, hi)) if not _is_number(v))
+                  errors.append((f'{path}.{bad}[{i}]', 'expected a number'))
+            elif lo > hi:
+                  errors.append((f'{path}.{lo_f}[{i}]', f'minimum {lo} is greater than maximum {hi}'))
+            else:
+                  errors.append((f'{path}.{value_f}[{i}]', f'{value} is outside [{lo}, {hi}]'))
+      return errors
+
+def _interactable_entry(values, children, behavior_type):
+      """Build one interactable dict from its _INTERACTABLE_COLUMNS values."""
+      mesh_set = [{'name': child['name'], 'visible': True} for child in children if child['type'] == 'MESH']
+      use = behavior_type != 'NONE'
+      # values[4], values[5]: interaction name and call
+      behavior = _record(behavior_data_class)(values[4], 'text', 'NONE', use, values[5], behavior_type, use).dictionary
+      return _record(interactable_data_class)(*values, mesh_set, behavior).dictionary
+
+def _interactables_from_columns(columns):
+      """Process pool worker: build {name: interactable} for a validated columnar chunk."""
       data = {}
-      for key in objs:
-            obj = objs[key]
-            if obj['hvym_interactable']:
-                  mesh_set = []
-                  for child in obj['children']:
-                        if child['type'] == 'MESH':
-                              mesh_set.append({'name':child['name'], 'visible': True})
-                  behavior = _text_behavior(obj['hvym_mesh_interaction_name'], False, obj['hvym_mesh_interaction_call'], obj['hvym_interactable_behavior'], False)
-                  if obj['hvym_interactable_behavior'] != 'NONE':
-                    behavior['use_method'] = True
-                    behavior['use_behavior'] = True
-
-                  d = interactable_data_class(
-                        obj['hvym_interactable'],
-                        obj['hvym_interactable_has_return'],
-                        obj['hvym_mesh_interaction_type'],
-                        obj['hvym_interactable_selector_dir'],
-                        obj['hvym_mesh_interaction_name'],
-                        obj['hvym_mesh_interaction_call'],
-                        obj['hvym_mesh_interaction_default_text'],
-                        obj['hvym_mesh_interaction_text_scale'],
-                        obj['hvym_mesh_interaction_text_wrap'],
-                        obj['hvym_mesh_interaction_param_type'],
-                        obj['hvym_mesh_interaction_slider_param_type'],
-                        obj['hvym_mesh_interaction_toggle_param_type'],
-                        obj['hvym_mesh_interaction_string_param'],
-                        obj['hvym_mesh_interaction_int_param'],
-                        obj['hvym_mesh_interaction_float_default'],
-                        obj['hvym_mesh_interaction_float_min'],
-                        obj['hvym_mesh_interaction_float_max'],
-                        obj['hvym_mesh_interaction_int_default'],
-                        obj['hvym_mesh_interaction_int_min'],
-                        obj['hvym_mesh_interaction_int_max'],
-                        obj['hvym_mesh_interaction_toggle_state'],
-                        obj['hvym_mesh_interaction_toggle_int'],
-                        mesh_set,
-                        behavior).dictionary
-                  data[obj['name']] = d
-      click.echo( json.dumps(data) )
+      for name, values, children, behavior_type in zip(columns['name'],
+                                                       zip(*(columns[c] for c in _INTERACTABLE_COLUMNS)),
+                                                       columns['children'],
+                                                       columns['hvym_interactable_behavior']):
+            if values[0]:
+                  data[name] = _interactable_entry(values, children, behavior_type)
+      return data
 
+def _parse_interactable_columns(columns, jobs=None):
+      rows = len(columns['name'])
+      if jobs is None:
+            jobs = (os.cpu_count() or 1) if rows >= _INTERACTABLE_PARALLEL_ROWS else 1
+      jobs = max(1, min(jobs, rows or 1))
+      if jobs == 1:
+            return _interactables_from_columns(columns)
+      from concurrent.futures import ProcessPoolExecutor
+      size = -(-rows // jobs)
+      needed = ('name', 'children', 'hvym_interactable_behavior') + _INTERACTABLE_COLUMNS
+      chunks = [{c: columns[c][start:start + size] for c in needed} for start in range(0, rows, size)]
+      data = {}
+      with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for part in pool.map(_interactables_from_columns, chunks):
+                  data.update(part)
+      return data
 
-@click.command('parse-blender-hvym-collection')
-@click.argument('collection_name', type=str)
-@click.argument('collection_type', type=str)
-@click.argument('collection_id', type=str)
-@click.argument('collection_json', type=str)
-@click.argument('menu_json', type=str)
-@click.argument('nodes_json', type=str)
-@click.argument('actions_json', type=str)
-def parse_blender_hvym_collection(collection_name, collection_type, collection_id, collection_json, menu_json, nodes_json, actions_json):
-      """Return parsed data structure from blender for heavymeta gltf extension"""
-      col_data = json.loads(collection_json)
-      menu_data = json.loads(menu_json)
-      node_data = json.loads(nodes_json)
-      action_data = json.loads(actions_json)
-      val_props = {}
-      text_props = {}
-      call_props = {}
-      mesh_props = {}
-      mesh_sets = {}
-      morph_sets = {}
-      anim_props = {}
-      mat_props = {}
-      mat_sets = {}
-      col_menu = {}
-      prop_label_data = {}
-      action_props = {}
+@click.command('parse-blender-hvym-interactables')
+@_fast_json_option
+@click.argument('obj_data', type=str, required=False)
+@click.option('--input', 'input_path', type=str, default=None, help="Read the document from a file or '-' for stdin (gzip accepted) instead of OBJ_DATA.")
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes for columnar documents (1 = serial). Default: serial unless the document is large.')
+def parse_blender_hvym_interactables(obj_data, input_path, jobs):
+      """Return parsed interactables data structure from blender for heavymeta gltf extension
+
+      Besides {"<object>": {...}} the document may be columnar:
+      {"__format__": 1, "__columns__": {"name": [...], "children": [[...], ...], "hvym_interactable": [...], ...}}
+      with one array per object field, which is range-checked and parsed in batches.
+      """
+      if input_path is not None:
+            try:
+                  objs = _read_json_input(input_path)
+            except (OSError, ValueError) as e:
+                  raise click.BadParameter(str(e), param_hint='--input')
+      elif obj_data is not None:
+            objs = _JSON.loads(obj_data)
+      else:
+            raise click.UsageError('Pass OBJ_DATA or use --input.')
 
-      # name: str
-      # show: bool
-      # immutable: bool
-      # text: str
-      # behaviors: list
+      if isinstance(objs, dict) and _INTERACTABLE_COLUMNS_KEY in objs:
+            if objs.get('__format__') != _INTERACTABLE_COLUMNS_FORMAT:
+                  errors = [('$.__format__', f'expected {_INTERACTABLE_COLUMNS_FORMAT}, got {objs.get("__format__")!r}')]
+            else:
+                  errors = _check_interactable_columns(objs[_INTERACTABLE_COLUMNS_KEY])
+            if errors:
+                  raise click.ClickException(str(HvymSchemaError(errors)))
+            _echo_json_stream(_parse_interactable_columns(objs[_INTERACTABLE_COLUMNS_KEY], jobs))
+            return
+
+      errors = _check_interactables(objs)
+      if errors:
+            raise click.ClickException(str(HvymSchemaError(errors)))
+      data = {}
+      for obj in objs.values():
+            if obj['hvym_interactable']:
+                  values = tuple(obj[c] for c in _INTERACTABLE_COLUMNS)
+                  data[obj['name']] = _interactable_entry(values, obj['children'], obj['hvym_interactable_behavior'])
+      click.echo( _JSON.dumps(data) )
+
+
+# Trait handlers for _parse_hvym_collection, keyed by Blender trait_type. Each
+# declares the collection section it fills and the object fields it reads;
+# a handler returns the section entry for obj['type'], or None to skip it.
+_TRAIT_HANDLERS = {}
+
+_PROP_LABEL_FIELDS = ('value_prop_label', 'text_prop_label', 'call_prop_label',
+                      'mesh_prop_label', 'mat_prop_label', 'anim_prop_label',
+                      'mesh_set_label', 'morph_set_label', 'mat_set_label')
+
+@dataclass(frozen=True)
+class _trait_handler_spec:
+      section: str
+      fields: tuple
+      handler: Any
+      validate: Any = None
+
+def _trait_handler(trait_type, section, fields, validate=None):
+      """Register the decorated function as the handler for trait_type.
+
+      validate(obj), if given, checks what `fields` cannot express (conditional
+      or nested fields) and returns [(sub_path, message)] for each problem.
+      """
+      def register(handler):
+            _TRAIT_HANDLERS[trait_type] = _trait_handler_spec(section, tuple(fields), handler, validate)
+            _compiled_trait_schema.cache_clear()
+            return handler
+      return register
+
+class HvymSchemaError(ValueError):
+      """Blender payload failed validation; errors is a list of (json_path, message)."""
+
+      def __init__(self, errors):
+            super().__init__(errors)
+            self.errors = errors
+
+      def __str__(self):
+            lines = [f'{len(self.errors)} invalid field(s) in input:']
+            lines += [f'  {path}: {message}' for path, message in self.errors]
+            return '\n'.join(lines)
+
+_MISSING = 'missing required field'
+_MENU_FIELDS = frozenset(('collection_id', 'menu_name', 'menu_primary_color', 'menu_secondary_color',
+                          'menu_text_color', 'menu_alignment'))
+_ACTION_FIELDS = frozenset(('trait_type', 'type', 'action_set', 'sequence_type', 'additive'))
+_ACTION_KIND_FIELDS = {
+      'mesh_action': _ACTION_FIELDS | {'mesh_interaction_type', 'model_ref'},
+}
+_ACTION_DEFAULT_FIELDS = _ACTION_FIELDS | {'anim_interaction_type'}
+
+@functools.lru_cache(maxsize=None)
+def _compiled_trait_schema():
+      """Compile the handler registry once into ({trait_type: required fields}, fields for unknown types).
+
+      Every digit-keyed object needs trait_type and the property labels; handled
+      trait types also need 'type' plus whatever their handler declares.
+      """
+      base = frozenset(('trait_type',) + _PROP_LABEL_FIELDS)
+      schema = {trait_type: base | {'type'} | frozenset(spec.fields) for trait_type, spec in _TRAIT_HANDLERS.items()}
+      return schema, base
+
+def _json_path(parent, key):
+      return f'{parent}[{json.dumps(key)}]'
+
+def _check_ref(obj, key, allow_none):
+      ref = obj[key]
+      if ref is None:
+            return [] if allow_none else [(f'.{key}', 'expected an object, got null')]
+      if not isinstance(ref, dict):
+            return [(f'.{key}', f'expected an object, got {type(ref).__name__}')]
+      if 'name' not in ref:
+            return [(f'.{key}.name', _MISSING)]
+      return []
+
+def _check_property_trait(obj):
+      required = []
+      stepped = obj['prop_action_type'] not in ('Immutable', 'Static')
+      if stepped:
+            required.append('int_amount')
+      if obj['prop_value_type'] == 'Float':
+            required += ['float_default', 'float_min', 'float_max']
+            if stepped:
+                  required.append('float_amount')
+      return [(f'.{f}', _MISSING) for f in required if f not in obj]
+
+def _check_anim_trait(obj):
+      if obj['anim_loop'] == 'Clamp' and 'prop_anim_slider_type' not in obj:
+            return [('.prop_anim_slider_type', _MISSING)]
+      return []
+
+def _check_mat_prop_trait(obj):
+      return _check_ref(obj, 'mat_ref', False) if 'mat_ref' in obj else []
+
+@_trait_handler('property', 'valProps',
+                ('behavior_set', 'prop_value_type', 'prop_action_type', 'prop_slider_type', 'show',
+                 'prop_immutable', 'int_default', 'int_min', 'int_max'),
+                _check_property_trait)
+def _property_trait(obj):
+      if obj['behavior_set'] != None:
+            return parse_behavior_val_prop(obj)
+      return parse_val_prop(obj)
+
+@_trait_handler('text', 'textValProps',
+                ('type', 'show', 'prop_immutable', 'text_value', 'prop_text_widget_type', 'behavior_set'))
+def _text_trait(obj):
+      return _record(text_data_class)(obj['type'],
+                                      obj['show'],
+                                      obj['prop_immutable'],
+                                      obj['text_value'],
+                                      obj['prop_text_widget_type'],
+                                      obj['behavior_set']).dictionary
+
+@_trait_handler('call', 'callProps', ('type', 'call_param'))
+def _call_trait(obj):
+      return _record(call_data_class)(obj['type'], obj['call_param']).dictionary
+
+@_trait_handler('mesh', 'meshProps', ('model_ref', 'prop_toggle_type', 'show', 'visible'),
+                lambda obj: _check_ref(obj, 'model_ref', True))
+def _mesh_trait(obj):
+      if obj['model_ref'] == None:
+            return None
+      return _record(mesh_data_class)(obj['prop_toggle_type'],
+                                      obj['show'],
+                                      obj['model_ref']['name'],
+                                      obj['visible']).dictionary
+
+@_trait_handler('mesh_set', 'meshSets', ('prop_selector_type', 'show', 'mesh_set'))
+def _mesh_set_trait(obj):
+      return _record(mesh_set_data_class)(obj['prop_selector_type'],
+                                          obj['show'], obj['mesh_set'],
+                                          0).dictionary
+
+@_trait_handler('morph_set', 'morphSets', ('prop_selector_type', 'show', 'morph_set', 'model_ref'))
+def _morph_set_trait(obj):
+      return _record(morph_set_data_class)(obj['prop_selector_type'],
+                                           obj['show'], obj['morph_set'],
+                                           0, obj['model_ref']).dictionary
+
+@_trait_handler('anim', 'animProps',
+                ('prop_toggle_type', 'anim_loop', 'show', 'type', 'anim_start', 'anim_end',
+                 'anim_blending', 'anim_weight', 'anim_play', 'model_ref'),
+                _check_anim_trait)
+def _anim_trait(obj):
+      widget_type = obj['prop_toggle_type']
+      if obj['anim_loop'] == 'Clamp':
+            widget_type = obj['prop_anim_slider_type']
+      return _record(anim_prop_data_class)(widget_type,
+                                           obj['show'],
+                                           obj['type'],
+                                           obj['anim_loop'],
+                                           obj['anim_start'],
+                                           obj['anim_end'],
+                                           obj['anim_blending'],
+                                           obj['anim_weight'],
+                                           obj['anim_play'],
+                                           obj['model_ref']).dictionary
+
+@_trait_handler('mat_prop', 'matProps',
+                ('mat_type', 'mat_reflective', 'mat_iridescent', 'mat_sheen', 'mat_emissive',
+                 'prop_multi_widget_type', 'show'),
+                _check_mat_prop_trait)
+def _mat_prop_trait(obj):
+      if 'mat_ref' not in obj:
+            return None
+      save_data = _mat_save_data(obj['mat_ref'], obj['mat_type'],
+                                 obj['mat_reflective'],
+                                 obj['mat_iridescent'],
+                                 obj['mat_sheen'],
+                                 obj['mat_emissive'])
+      return _record(mat_prop_data_class)(obj['prop_multi_widget_type'],
+                                          obj['show'],
+                                          obj['mat_ref']['name'],
+                                          obj['mat_type'],
+                                          obj['mat_emissive'],
+                                          obj['mat_reflective'],
+                                          obj['mat_iridescent'],
+                                          obj['mat_sheen'],
+                                          obj['mat_ref'],
+                                          save_data).dictionary
+
+@_trait_handler('mat_set', 'materialSets',
+                ('prop_selector_type', 'show', 'mat_set', 'mesh_set_name', 'material_id'))
+def _mat_set_trait(obj):
+      return _record(mat_set_data_class)(obj['prop_selector_type'],
+                                         obj['show'],
+                                         obj['mat_set'],
+                                         obj['mesh_set_name'],
+                                         obj['material_id'],
+                                         0).dictionary
+
+def _hvym_menu_index(menu_data, errors=None, path='$.menu'):
+      """Return ({collection_id: menu obj}, last menu obj) over the digit keys of menu_data.
+
+      A collection takes the first menu whose collection_id matches, or the
+      last menu when none does. Invalid menus are appended to errors when a
+      list is given, otherwise they raise HvymSchemaError.
+      """
+      raise_now = errors is None
+      errors = [] if errors is None else errors
+      index = {}
+      last = None
+      if not isinstance(menu_data, dict):
+            errors.append((path, 'expected an object'))
+            menu_data = {}
+      for i in menu_data:
+            if i.isdigit():
+                  obj = menu_data[i]
+                  if not isinstance(obj, dict):
+                        errors.append((_json_path(path, i), 'expected an object'))
+                        continue
+                  missing = _MENU_FIELDS.difference(obj)
+                  if missing:
+                        errors.extend((f'{_json_path(path, i)}.{f}', _MISSING) for f in sorted(missing))
+                        continue
+                  if not isinstance(obj['collection_id'], str):
+                        errors.append((f'{_json_path(path, i)}.collection_id', 'expected a string'))
+                        continue
+                  index.setdefault(obj['collection_id'], obj)
+                  last = obj
+      if raise_now and errors:
+            raise HvymSchemaError(errors)
+      return index, last
+
+def _parse_hvym_collection(collection_name, collection_type, collection_id, col_data, menu_data, node_data, action_data, menu_index=None, path='$', validate=True):
+      """Build the collection record for one Blender collection from its decoded payloads.
+
+      Objects are checked against _compiled_trait_schema() as they are
+      transformed; every problem is collected with its JSON path (rooted at
+      `path`) and raised together as HvymSchemaError. menu_index, from
+      _hvym_menu_index(menu_data), lets callers parsing many collections
+      against one menu build (and validate) it once.
+      """
+      errors = []
+      for name, payload in (('collection', col_data), ('menu', menu_data), ('nodes', node_data), ('actions', action_data)):
+            if not isinstance(payload, dict):
+                  errors.append((f'{path}.{name}', 'expected an object'))
+      if errors:
+            raise HvymSchemaError(errors)
+
+      schema, base_fields = _compiled_trait_schema()
+      sections = {spec.section: {} for spec in _TRAIT_HANDLERS.values()}
+      last_obj = None
+      col_path = f'{path}.collection'
 
       for i in col_data:
           if i.isdigit():
                 obj = col_data[i]
+                if validate:
+                      if not isinstance(obj, dict):
+                            errors.append((_json_path(col_path, i), 'expected an object'))
+                            continue
+                      if not isinstance(obj.get('trait_type', ''), str):
+                            errors.append((f'{_json_path(col_path, i)}.trait_type', 'expected a string'))
+                            continue
+                      missing = schema.get(obj.get('trait_type'), base_fields).difference(obj)
+                      if missing:
+                            errors.extend((f'{_json_path(col_path, i)}.{f}', _MISSING) for f in sorted(missing))
+                            continue
+                      if obj['trait_type'] in schema and not isinstance(obj['type'], str):
+                            errors.append((f'{_json_path(col_path, i)}.type', 'expected a string'))
+                            continue
+                last_obj = obj
+                spec = _TRAIT_HANDLERS.get(obj['trait_type'])
+                if spec is not None:
+                      if validate and spec.validate is not None:
+                            problems = spec.validate(obj)
+                            if problems:
+                                  errors.extend((_json_path(col_path, i) + sub, message) for sub, message in problems)
+                                  continue
+                      value = spec.handler(obj)
+                      if value is not None:
+                            sections[spec.section][obj['type']] = value
+
+      # Only the last object's labels were ever kept
+      prop_label_data = {}
+      if last_obj is not None:
+            prop_label_data = _record(property_label_data_class)(*[last_obj[f] for f in _PROP_LABEL_FIELDS]).dictionary
 
-                int_props = None
-
-                if obj['behavior_set'] != None:
-                  int_props = parse_behavior_val_prop(obj)
-                else:
-                  int_props = parse_val_prop(obj)
-                            
-                      
-                if obj['trait_type'] == 'property':
-                      val_props[obj['type']] = int_props
-
-                elif obj['trait_type'] == 'text':
-                      text_props[obj['type']] = text_data_class(obj['type'], 
-                                                                obj['show'], 
-                                                                obj['prop_immutable'], 
-                                                                obj['text_value'],
-                                                                obj['prop_text_widget_type'],
-                                                                obj['behavior_set']).dictionary
-
-                elif obj['trait_type'] == 'call':
-                      call_props[obj['type']] = call_data_class(obj['type'], obj['call_param']).dictionary
-
-                elif obj['trait_type']  == 'mesh':
-                      if obj['model_ref'] != None:
-                            mesh_props[obj['type']] = mesh_data_class(obj['prop_toggle_type'],
-                                                                      obj['show'],
-                                                                      obj['model_ref']['name'],
-                                                                      obj['visible']).dictionary
-
-                elif obj['trait_type']  == 'mesh_set':
-                      mesh_sets[obj['type']] = mesh_set_data_class(obj['prop_selector_type'],
-                                                                   obj['show'], obj['mesh_set'],
-                                                                   0).dictionary
-
-                elif obj['trait_type']  == 'morph_set':
-                      morph_sets[obj['type']] = morph_set_data_class(obj['prop_selector_type'],
-                                                                     obj['show'], obj['morph_set'],
-                                                                     0, obj['model_ref']).dictionary
-                      
-                elif obj['trait_type']  == 'anim':
-                      widget_type = obj['prop_toggle_type']
-                      if obj['anim_loop'] == 'Clamp':
-                            widget_type = obj['prop_anim_slider_type']
-                      anim_props[obj['type']] = anim_prop_data_class(widget_type,
-                                                                     obj['show'],
-                                                                     obj['type'],
-                                                                     obj['anim_loop'],
-                                                                     obj['anim_start'],
-                                                                     obj['anim_end'],
-                                                                     obj['anim_blending'],
-                                                                     obj['anim_weight'],
-                                                                     obj['anim_play'],
-                                                                     obj['model_ref']).dictionary
-                      
-                elif obj['trait_type']  == 'mat_prop' and 'mat_ref' in obj:
-                      save_data = _mat_save_data(obj['mat_ref'], obj['mat_type'],
-                                                 obj['mat_reflective'],
-                                                 obj['mat_iridescent'],
-                                                 obj['mat_sheen'],
-                                                 obj['mat_emissive'])
-                            
-                      mat_props[obj['type']] = mat_prop_data_class(obj['prop_multi_widget_type'],
-                                                                   obj['show'],
-                                                                   obj['mat_ref']['name'],
-                                                                   obj['mat_type'],
-                                                                   obj['mat_emissive'],
-                                                                   obj['mat_reflective'],
-                                                                   obj['mat_iridescent'],
-                                                                   obj['mat_sheen'],
-                                                                   obj['mat_ref'],
-                                                                   save_data).dictionary
-                            
-                elif obj['trait_type']  == 'mat_set':
-                      mat_sets[obj['type']] = mat_set_data_class(obj['prop_selector_type'],
-                                                                 obj['show'],
-                                                                 obj['mat_set'],
-                                                                 obj['mesh_set_name'],
-                                                                 obj['material_id'],
-                                                                 0).dictionary
-
-                      
-                prop_label_data = property_label_data_class(obj['value_prop_label'],
-                                                            obj['text_prop_label'],
-                                                            obj['call_prop_label'],
-                                                            obj['mesh_prop_label'],
-                                                            obj['mat_prop_label'],
-                                                            obj['anim_prop_label'],
-                                                            obj['mesh_set_label'],
-                                                            obj['morph_set_label'],
-                                                            obj['mat_set_label']).dictionary
+      if menu_index is None:
+            menu_index = _hvym_menu_index(menu_data, errors, f'{path}.menu')
+      index, last_menu = menu_index
+      menu_obj = index.get(collection_id, last_menu)
+      col_menu = {}
+      if menu_obj is not None:
+            col_menu = _record(menu_data_class)(menu_obj['menu_name'],
+                                                menu_obj['menu_primary_color'],
+                                                menu_obj['menu_secondary_color'],
+                                                menu_obj['menu_text_color'],
+                                                menu_obj['menu_alignment']).dictionary
 
-      for i in menu_data:
-          if i.isdigit():
-                obj = menu_data[i]
-                col_menu = menu_data_class(obj['menu_name'],
-                                           obj['menu_primary_color'],
-                                           obj['menu_secondary_color'],
-                                           obj['menu_text_color'],
-                                           obj['menu_alignment']).dictionary
-                if obj['collection_id'] == collection_id:
-                      break
-                  
+      action_props = {}
+      action_path = f'{path}.actions'
       for i in action_data:
           if i.isdigit():
                 obj = action_data[i]
+                if validate:
+                      if not isinstance(obj, dict):
+                            errors.append((_json_path(action_path, i), 'expected an object'))
+                            continue
+                      if not isinstance(obj.get('trait_type', ''), str):
+                            errors.append((f'{_json_path(action_path, i)}.trait_type', 'expected a string'))
+                            continue
+                      missing = _ACTION_KIND_FIELDS.get(obj.get('trait_type'), _ACTION_DEFAULT_FIELDS).difference(obj)
+                      if missing:
+                            errors.extend((f'{_json_path(action_path, i)}.{f}', _MISSING) for f in sorted(missing))
+                            continue
+                      if not isinstance(obj['type'], str):
+                            errors.append((f'{_json_path(action_path, i)}.type', 'expected a string'))
+                            continue
                 if obj['trait_type'] == 'mesh_action':
-                      action_props[obj['type']] = action_mesh_data_class(obj['trait_type'],
-                                                                         obj['action_set'],
-                                                                         obj['mesh_interaction_type'],
-                                                                         obj['sequence_type'],
-                                                                         obj['additive'],
-                                                                         obj['model_ref'])
+                      action_props[obj['type']] = _record(action_mesh_data_class)(obj['trait_type'],
+                                                                                  obj['action_set'],
+                                                                                  obj['mesh_interaction_type'],
+                                                                                  obj['sequence_type'],
+                                                                                  obj['additive'],
+                                                                                  obj['model_ref']).dictionary
                 else:
-                      action_props[obj['type']] = action_data_class(obj['trait_type'],
-                                                                    obj['action_set'],
-                                                                    obj['anim_interaction_type'],
-                                                                    obj['sequence_type'],
-                                                                    obj['additive'])
-                
-                  
-      data = collection_data_class(collection_name,
-                                   collection_type,
-                                   val_props,
-                                   text_props,
-                                   call_props,
-                                   mesh_props,
-                                   mesh_sets,
-                                   morph_sets,
-                                   anim_props,
-                                   mat_props,
-                                   mat_sets,
-                                   col_menu,
-                                   prop_label_data,
-                                   node_data,
-                                   action_props).json
-      click.echo(data)
+                      action_props[obj['type']] = _record(action_data_class)(obj['trait_type'],
+                                                                             obj['action_set'],
+                                                                             obj['anim_interaction_type'],
+                                                                             obj['sequence_type'],
+                                                                             obj['additive']).dictionary
+
+      if errors:
+            raise HvymSchemaError(errors)
+
+      return _record(collection_data_class)(collectionName=collection_name,
+                                            collectionType=collection_type,
+                                            valProps=sections.get('valProps', {}),
+                                            textValProps=sections.get('textValProps', {}),
+                                            callProps=sections.get('callProps', {}),
+                                            meshProps=sections.get('meshProps', {}),
+                                            meshSets=sections.get('meshSets', {}),
+                                            morphSets=sections.get('morphSets', {}),
+                                            animProps=sections.get('animProps', {}),
+                                            matProps=sections.get('matProps', {}),
+                                            materialSets=sections.get('materialSets', {}),
+                                            menuData=col_menu,
+                                            propLabelData=prop_label_data,
+                                            nodes=node_data,
+                                            actionProps=action_props)
+
+
+def _read_json_input(source):
+      """Load a JSON document from a path or '-' (stdin); gzip input is detected by its magic bytes."""
+      import gzip
+      if source == '-':
+            data = click.get_binary_stream('stdin').read()
+      else:
+            with open(source, 'rb') as f:
+                  data = f.read()
+      if data[:2] == b'\x1f\x8b':
+            try:
+                  data = gzip.decompress(data)
+            except EOFError as e:
+                  raise ValueError(f'truncated gzip input: {e}')
+      return _JSON.loads(data)
+
+def _echo_json_stream(obj):
+      """Write obj as JSON plus a newline to stdout; unless fast, the same bytes as json.dumps(obj)."""
+      if _JSON.backend == 'json':
+            out = click.get_text_stream('stdout')
+            for chunk in _JSON.iterencode(obj):
+                  out.write(chunk)
+            out.write('\n')
+            out.flush()
+            return
+      sys.stdout.flush()
+      out = click.get_binary_stream('stdout')
+      out.write(_JSON.dumpb(obj) + b'\n')
+      out.flush()
+
+def _collection_diff(previous, current):
+      """Describe current relative to previous, both plain collection dicts.
+
+      Object-valued fields are compared entry by entry: `changed` holds the
+      new or changed entries, `removed` the names of deleted ones. Other
+      fields appear in `changed` whole. Without a previous output the result
+      is marked full and `changed` is the whole document.
+      """
+      if previous is None:
+            return {'full': True, 'changed': current, 'removed': {}}
+      changed = {}
+      removed = {}
+      for field_name, value in current.items():
+            old = previous.get(field_name)
+            if isinstance(value, dict) and isinstance(old, dict):
+                  entries = {k: v for k, v in value.items() if k not in old or old[k] != v}
+                  gone = [k for k in old if k not in value]
+                  if entries:
+                        changed[field_name] = entries
+                  if gone:
+                        removed[field_name] = gone
+            elif value != old:
+                  changed[field_name] = value
+      return {'full': False, 'changed': changed, 'removed': removed}
+
+# Last output of each collection, under CLI_PATH, for parse-blender-hvym-collection --diff
+COLLECTION_OUTPUTS_DIR = 'collection_outputs'
+_COLLECTION_OUTPUTS_MAX = 256
+
+def _previous_collection_path(collection_key):
+      name = hashlib.sha256(collection_key.encode('utf-8')).hexdigest()[:32]
+      return os.path.join(CLI_PATH, COLLECTION_OUTPUTS_DIR, f'{name}.json')
+
+def _store_collection_output(collection_key, doc):
+      """Keep doc as the last output of collection_key, dropping the oldest beyond _COLLECTION_OUTPUTS_MAX."""
+      path = _previous_collection_path(collection_key)
+      folder = os.path.dirname(path)
+      os.makedirs(folder, exist_ok=True)
+      tmp = f'{path}.{os.getpid()}.tmp'
+      with open(tmp, 'wb') as f:
+            f.write(doc)
+      os.replace(tmp, path)
+      entries = [e for e in os.scandir(folder) if e.name.endswith('.json')]
+      if len(entries) > _COLLECTION_OUTPUTS_MAX:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:len(entries) - _COLLECTION_OUTPUTS_MAX]:
+                  try:
+                        os.remove(entry.path)
+                  except OSError:
+                        pass
+
+@click.command('parse-blender-hvym-collection')
+@_fast_json_option
+@click.argument('collection_name', type=str, required=False)
+@click.argument('collection_type', type=str, required=False)
+@click.argument('collection_id', type=str, required=False)
+@click.argument('collection_json', type=str, required=False)
+@click.argument('menu_json', type=str, required=False)
+@click.argument('nodes_json', type=str, required=False)
+@click.argument('actions_json', type=str, required=False)
+@click.option('--input', 'input_path', type=str, default=None, help="Read one combined JSON document from a file or '-' for stdin (gzip accepted) instead of positional arguments.")
+@click.option('--diff', is_flag=True, default=False, help='Print only what changed since the last parse of this collection.')
+def parse_blender_hvym_collection(collection_name, collection_type, collection_id, collection_json, menu_json, nodes_json, actions_json, input_path, diff):
+      """Return parsed data structure from blender for heavymeta gltf extension
+
+      With --input the document holds every argument under one key:
+      {"collection_name", "collection_type", "collection_id", "collection", "menu", "nodes", "actions"}
+      """
+      if input_path is not None:
+            try:
+                  doc = _read_json_input(input_path)
+            except (OSError, ValueError) as e:
+                  raise click.BadParameter(str(e), param_hint='--input')
+            if not isinstance(doc, dict):
+                  raise click.BadParameter('input document must be a JSON object', param_hint='--input')
+            missing = [k for k in ('collection_name', 'collection_type', 'collection_id', 'collection') if k not in doc]
+            if missing:
+                  raise click.BadParameter(f"input document is missing: {', '.join(missing)}", param_hint='--input')
+            args = (doc['collection_name'], doc['collection_type'], str(doc['collection_id']),
+                    doc['collection'], doc.get('menu', {}), doc.get('nodes', {}), doc.get('actions', {}))
+      else:
+            args = (collection_name, collection_type, collection_id, collection_json, menu_json, nodes_json, actions_json)
+            if any(a is None for a in args):
+                  raise click.UsageError('Pass all seven positional arguments or use --input.')
+            args = args[:3] + tuple(_JSON.loads(a) for a in args[3:])
+      try:
+            data = _parse_hvym_collection(*args).dictionary
+      except HvymSchemaError as e:
+            raise click.ClickException(str(e))
+      if diff:
+            # Collection ids are only unique within a .blend file
+            collection_key = f'{args[2]}:{args[0]}'
+            doc = _JSON.dumpb(data)
+            try:
+                  with open(_previous_collection_path(collection_key), 'rb') as f:
+                        previous = _JSON.loads(f.read())
+            except (OSError, ValueError):
+                  previous = None
+            data = _collection_diff(previous, _JSON.loads(doc))
+            try:
+                  _store_collection_output(collection_key, doc)
+            except OSError as e:
+                  click.echo(f'Collection output not stored for --diff: {e}', err=True)
+      _echo_json_stream(data)
+
+
+# Scenes with at least this many traits are parsed across a process pool
+# when --jobs is not given; below it, process start-up costs more than it saves.
+_SCENE_PARALLEL_TRAITS = 20000
+
+def _parse_scene_collection(args):
+      """Process pool worker: parse one collection of a scene to (dict, None), or (None, errors)."""
+      try:
+            return _parse_hvym_collection(*args).dictionary, None
+      except HvymSchemaError as e:
+            return None, e.errors
+
+@click.command('parse-blender-hvym-scene')
+@_fast_json_option
+@click.option('--input', 'input_path', type=str, default='-', show_default=True, help="Scene document file, or '-' for stdin (gzip accepted).")
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes (1 = serial). Default: serial unless the scene is large.')
+def parse_blender_hvym_scene(input_path, jobs):
+      """Parse every collection of a Blender scene in one call, keyed by collection id
+
+      Document: {"menu": {...}, "nodes": {...}, "actions": {...},
+                 "collections": {"<id>": {"collection_name", "collection_type", "collection",
+                                          "nodes"?, "actions"?}}}
+      Per-collection nodes/actions override the scene-wide ones.
+      """
+      try:
+            doc = _read_json_input(input_path)
+      except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint='--input')
+      if not isinstance(doc, dict):
+            raise click.BadParameter('input document must be a JSON object', param_hint='--input')
+      collections = doc.get('collections')
+      if not isinstance(collections, dict):
+            raise click.BadParameter("input document has no 'collections' object", param_hint='--input')
+
+      errors = []
+      menu_index = _hvym_menu_index(doc.get('menu', {}), errors)
+      tasks = []
+      for collection_id, entry in collections.items():
+            entry_path = _json_path('$.collections', collection_id)
+            if not isinstance(entry, dict):
+                  errors.append((entry_path, 'expected an object'))
+                  continue
+            tasks.append((entry.get('collection_name', ''),
+                          entry.get('collection_type', ''),
+                          str(collection_id),
+                          entry.get('collection', {}),
+                          {},
+                          entry.get('nodes', doc.get('nodes', {})),
+                          entry.get('actions', doc.get('actions', {})),
+                          menu_index,
+                          entry_path))
+
+      if jobs is None:
+            traits = sum(len(t[3]) for t in tasks if isinstance(t[3], dict))
+            jobs = (os.cpu_count() or 1) if traits >= _SCENE_PARALLEL_TRAITS else 1
+      jobs = max(1, min(jobs, len(tasks) or 1))
+
+      if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                  results = list(pool.map(_parse_scene_collection, tasks))
+      else:
+            results = [_parse_scene_collection(t) for t in tasks]
+
+      for _, collection_errors in results:
+            errors.extend(collection_errors or ())
+      if errors:
+            raise click.ClickException(str(HvymSchemaError(errors)))
+      _echo_json_stream({t[2]: r for t, (r, _) in zip(tasks, results)})
 
 
 @click.command('collection-data')
+@_fast_json_option
 @click.argument('collectionName', type=str)
 @click.argument('collectionType', type=str)
 @click.argument('valProps', type=dict)
@@ -2648,17 +3723,21 @@ def docker_installed():
       click.echo(_check_docker_installed())
 
 @click.command('svg-to-data-url')
-@click.argument('svgfile', type=str)
-def svg_to_data_url(svgfile):
-      """ Convert an svg file to data url. """
-      click.echo(_svg_to_data_url(svgfile))
+@click.argument('svgfiles', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--out-dir', '-o', type=click.Path(exists=True, file_okay=False), default=None, help='Write each data URL to <out-dir>/<file name>.txt instead of stdout.')
+@click.option('--optimize', is_flag=True, default=False, help='Minify the SVGs first; savings go to stderr.')
+def svg_to_data_url(svgfiles, out_dir, optimize):
+      """ Convert svg files to data urls, one per line. """
+      _echo_data_urls(svgfiles, 'image/svg+xml', out_dir, optimize)
 
 
 @click.command('png-to-data-url')
-@click.argument('pngfile', type=str)
-def png_to_data_url(pngfile):
-      """ Convert a png file to data url. """
-      click.echo(_png_to_data_url(pngfile))
+@click.argument('pngfiles', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--out-dir', '-o', type=click.Path(exists=True, file_okay=False), default=None, help='Write each data URL to <out-dir>/<file name>.txt instead of stdout.')
+@click.option('--optimize', is_flag=True, default=False, help='Losslessly recompress the PNGs first; savings go to stderr.')
+def png_to_data_url(pngfiles, out_dir, optimize):
+      """ Convert png files to data urls, one per line. """
+      _echo_data_urls(pngfiles, 'image/png', out_dir, optimize)
 
 @click.command('update-npm-modules')
 def update_npm_modules():
@@ -2670,12 +3749,151 @@ def update_proprium_js_file():
       """Update the local js file for hvym-proprium module"""
       _update_proprium_js_file()
 
+@click.command('fetch-templates')
+@click.option('--offline', is_flag=True, default=False, help='Only report what is cached; make no requests.')
+@click.option('--clear', is_flag=True, default=False, help='Empty the download cache first.')
+def fetch_templates(offline, clear):
+      """Download or revalidate the project templates in the local cache, for offline use"""
+      import hvym_template_cache
+      cache = _template_cache()
+      if clear:
+            cache.clear()
+      failed = False
+      for url in _TEMPLATE_ZIPS:
+            try:
+                  tree, status = cache.fetch(url, offline=offline)
+            except hvym_template_cache.TemplateCacheError as e:
+                  click.echo(f'missing      {e}', err=True)
+                  failed = True
+                  continue
+            commit = (cache.entry(url) or {}).get('commit') or tree.name[:12]
+            click.echo(f'{status:<12} {url} ({commit[:12]})')
+      if failed:
+            sys.exit(1)
+
 @click.command('check')
 @measure_startup_time
 def check():
       """For checking if cli is on the path"""
       click.echo('ONE-TWO')
 
+@click.command('bench')
+@click.option('--mode', type=click.Choice(['source', 'frozen', 'both']), default='source', help='Run the CLI from source, from a built executable, or both.')
+@click.option('--frozen-exe', type=click.Path(exists=True, dir_okay=False), default=None, help='Built hvym executable used for frozen mode.')
+@click.option('--iterations', '-n', type=int, default=20, show_default=True, help='Measured runs per command and scenario.')
+@click.option('--commands', '-c', type=str, default=None, help='Comma separated subset of commands to measure.')
+@click.option('--scenario', type=click.Choice(['cold', 'warm', 'both']), default='both', help='Cold start, warm start, or both.')
+@click.option('--save-baseline', type=click.Path(dir_okay=False), default=None, help='Write results to this baseline file.')
+@click.option('--compare', 'compare_path', type=click.Path(exists=True, dir_okay=False), default=None, help='Baseline file to compare against; exits 1 on regression.')
+@click.option('--threshold', type=float, default=None, help='Relative slowdown that counts as a regression (default 0.25).')
+@click.option('--json', 'as_json', is_flag=True, default=False, help='Print the full report as JSON.')
+@click.option('--fixture-latency-ms', type=float, default=0, show_default=True, help='Latency injected into the Docker, Pinggy and Friendbot stand-ins.')
+@click.option('--fixture-failure-rate', type=float, default=0.0, show_default=True, help='Fraction of stand-in calls that fail (seeded, deterministic).')
+@click.option('--micro', is_flag=True, default=False, help='Run the in-process parser micro-benchmarks instead (-c selects them, -n sets repeats).')
+@click.option('--traits', type=int, default=10000, show_default=True, help='Synthetic collection size for --micro.')
+def bench(mode, frozen_exe, iterations, commands, scenario, save_baseline, compare_path, threshold, as_json, fixture_latency_ms, fixture_failure_rate, micro, traits):
+      """Benchmark hot CLI commands (p50/p95/p99 wall time, peak RSS).
+
+      Needs a source checkout: hvym_bench.py and hvym_fixtures.py are not
+      bundled into release builds.
+      """
+      try:
+            import hvym_bench
+            from hvym_fixtures import FaultPlan
+      except ImportError as e:
+            raise click.ClickException(f'hvym bench runs from a source checkout only; the benchmark modules are not in this build ({e})')
+
+      if micro:
+            names = [c.strip() for c in commands.split(',') if c.strip()] if commands else None
+            unknown = [n for n in names or [] if n not in hvym_bench.MICRO_BENCHMARKS]
+            if unknown:
+                  raise click.UsageError(f"unknown micro-benchmark: {', '.join(unknown)}")
+            results = hvym_bench.run_micro_benchmarks(sys.modules[__name__], names, traits, iterations)
+            click.echo(json.dumps(results, indent=2) if as_json else hvym_bench.format_micro_table(results))
+            return
+
+      modes = ['source', 'frozen'] if mode == 'both' else [mode]
+      scenarios = hvym_bench.SCENARIOS if scenario == 'both' else (scenario,)
+      selected = [c.strip() for c in commands.split(',') if c.strip()] if commands else None
+
+      def _progress(run_mode, command, run_scenario, stats):
+            if not as_json:
+                  click.echo(f"{run_mode:<7}{command:<36}{run_scenario:<6} p50={stats['p50_ms']:.1f}ms p95={stats['p95_ms']:.1f}ms", err=True)
+
+      try:
+            report = hvym_bench.run_benchmarks(modes, selected, iterations, scenarios,
+                                               hvym_script=Path(__file__).resolve(),
+                                               frozen_exe=frozen_exe, progress=_progress,
+                                               fault_plan=FaultPlan(latency_ms=fixture_latency_ms, failure_rate=fixture_failure_rate))
+      except ValueError as e:
+            raise click.UsageError(str(e))
+
+      ratios = hvym_bench.mode_ratios(report)
+      if ratios:
+            report['frozen_vs_source_p50'] = ratios
+
+      if as_json:
+            click.echo(json.dumps(report, indent=2))
+      else:
+            click.echo(hvym_bench.format_table(report))
+            for command, by_scenario in ratios.items():
+                  click.echo(f"frozen/source p50 {command}: " + ', '.join(f'{k}={v}x' for k, v in by_scenario.items()))
+
+      if save_baseline:
+            with open(save_baseline, 'w') as f:
+                  json.dump(report, f, indent=2)
+
+      if compare_path:
+            with open(compare_path, 'r') as f:
+                  baseline = json.load(f)
+            limit = hvym_bench.DEFAULT_THRESHOLD if threshold is None else threshold
+            regressions = hvym_bench.compare(report, baseline, limit)
+            for line in regressions:
+                  click.echo(f'REGRESSION {line}', err=True)
+            if regressions:
+                  sys.exit(1)
+
+@click.command('runtime-install')
+@click.argument('archive', type=click.Path(exists=True, dir_okay=False))
+@click.option('--keep', type=int, default=2, show_default=True, help='Installed versions to keep.')
+def runtime_install(archive, keep):
+      """Unpack a onedir build archive into the persistent runtime cache."""
+      import hvym_runtime
+      try:
+            pointer = hvym_runtime.install(archive, hvym_runtime.runtime_root(CLI_PATH), keep=keep)
+      except (ValueError, OSError) as e:
+            raise click.ClickException(str(e))
+      click.echo(pointer['executable'])
+
+@click.command('runtime-path')
+def runtime_path():
+      """Print the executable of the active onedir runtime."""
+      import hvym_runtime
+      pointer = hvym_runtime.current(hvym_runtime.runtime_root(CLI_PATH))
+      if pointer is None:
+            click.echo('No runtime installed', err=True)
+            sys.exit(1)
+      click.echo(pointer['executable'])
+
+@click.command('ui-server')
+@click.option('--idle-timeout', type=int, default=900, show_default=True, help='Exit after this many seconds without a request (0 = never).')
+@click.option('--stop', 'stop_server', is_flag=True, default=False, help='Stop the running UI server.')
+@click.option('--status', is_flag=True, default=False, help='Print whether a UI server is running.')
+def ui_server(idle_timeout, stop_server, status):
+      """Keep Qt loaded and serve popups to other hvym calls."""
+      import hvym_ui_server
+      if status:
+            click.echo('running' if hvym_ui_server.ping(CLI_PATH) else 'stopped')
+            return
+      if stop_server:
+            click.echo('stopped' if hvym_ui_server.stop(CLI_PATH) else 'not running')
+            return
+      if hvym_ui_server.ping(CLI_PATH):
+            click.echo('UI server already running')
+            return
+      preload = [LOGO_IMG, LOGO_WARN_IMG, LOGO_CHOICE_IMG, STELLAR_LOGO_IMG, BG_IMG]
+      hvym_ui_server.serve(CLI_PATH, idle_timeout, preload, log=lambda msg: click.echo(msg, err=True))
+
 @click.command('up')
 def up():
       """Set up the cli"""
@@ -2737,20 +3955,16 @@ def test():
 def print_hvym_data(path):
     """Print Heavymeta data embedded in glb file."""
     try:
-        # Lazy load the 3D module
-        lazy = LazyImporter()
-        lazy._import_3d()  # This will load the GLTF2 module
-        
-        # Now import GLTF2
-        from pygltflib import GLTF2
-        
+        # Reads the GLB header and JSON chunk only, not the meshes and textures
+        import hvym_glb
+
         if not os.path.exists(path):
             click.echo(f"Error: File not found: {path}", err=True)
             return
-            
-        gltf = GLTF2().load(path)
-        if hasattr(gltf, 'extensions') and gltf.extensions and 'HVYM_nft_data' in gltf.extensions:
-            click.echo(json.dumps(gltf.extensions['HVYM_nft_data'], indent=2))
+
+        nft_data = hvym_glb.read_extension(path, 'HVYM_nft_data', _JSON.loads)
+        if nft_data:
+            click.echo(json.dumps(nft_data, indent=2))
         else:
             click.echo("No HVYM NFT data found in the GLB file.")
     except Exception as e:
@@ -2759,10 +3973,304 @@ def print_hvym_data(path):
             import traceback
             click.echo(traceback.format_exc(), err=True)
 
+@click.command('write-hvym-data')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.argument('data', type=str, required=False)
+@click.option('--input', 'input_path', type=str, default=None, help="Read the HVYM_nft_data JSON from a file or '-' for stdin (gzip accepted) instead of DATA.")
+@click.option('--output', '-o', 'out_path', type=click.Path(dir_okay=False), default=None, help='Write to this file instead of replacing PATH.')
+@click.option('--remove', is_flag=True, default=False, help='Remove the HVYM_nft_data extension instead.')
+def write_hvym_data(path, data, input_path, out_path, remove):
+      """Set the Heavymeta data embedded in a glb (or gltf) file.
+
+      Only the JSON chunk is rewritten; meshes and textures are copied as is
+      and the file is replaced atomically.
+      """
+      import hvym_glb
+      if remove:
+            value = None
+      elif input_path is not None:
+            try:
+                  value = _read_json_input(input_path)
+            except (OSError, ValueError) as e:
+                  raise click.BadParameter(str(e), param_hint='--input')
+      elif data is not None:
+            try:
+                  value = _JSON.loads(data)
+            except ValueError as e:
+                  raise click.BadParameter(str(e), param_hint='DATA')
+      else:
+            raise click.UsageError('Pass DATA, --input or --remove.')
+      if value is not None and not isinstance(value, dict):
+            raise click.BadParameter('HVYM_nft_data must be a JSON object', param_hint='DATA')
+      try:
+            size = hvym_glb.write_extension(path, 'HVYM_nft_data', value, out_path, _JSON.loads, _JSON.dumpb)
+      except (OSError, ValueError) as e:
+            raise click.ClickException(f'Cannot update {path}: {e}')
+      click.echo(f"{'Removed' if remove else 'Wrote'} HVYM_nft_data in {out_path or path} ({size} bytes)")
+
+# Contract fields copied into scan-hvym-data results
+_SCAN_CONTRACT_FIELDS = ('nftType', 'nftChain', 'nftPrice', 'maxSupply', 'mintable', 'minterType', 'minterName')
+# Trees with at least this many models are scanned with one process per CPU
+# when --jobs is not given.
+_SCAN_PARALLEL_FILES = 64
+
+def _scan_hvym_file(entry):
+      """Process pool worker: summarize the HVYM_nft_data of one (path, size, mtime) model."""
+      import hvym_glb
+      path, size, mtime = entry
+      result = {'path': path, 'size': size, 'mtime': mtime, 'has_data': False, 'contract': None, 'collections': 0}
+      try:
+            nft_data = hvym_glb.read_extension(path, 'HVYM_nft_data', _JSON.loads)
+            if isinstance(nft_data, dict):
+                  contract = nft_data.get('contract')
+                  if isinstance(contract, dict):
+                        result['contract'] = {f: contract[f] for f in _SCAN_CONTRACT_FIELDS if f in contract}
+                  result['collections'] = sum(1 for k, v in nft_data.items() if k not in ('contract', 'project') and isinstance(v, dict))
+                  result['has_data'] = True
+      except (OSError, ValueError) as e:
+            result.update(contract=None, collections=0, error=str(e))
+      except Exception as e:
+            # One malformed model must not abort the whole scan
+            result.update(contract=None, collections=0, error=f'unexpected error: {e!r}')
+      return result
+
+def _walk_models(root, suffixes):
+      """Yield (path, size, mtime) of every file under root with one of suffixes, in sorted order."""
+      try:
+            entries = sorted(os.scandir(root), key=lambda e: e.name)
+      except OSError:
+            return
+      for entry in entries:
+            try:
+                  if entry.is_dir(follow_symlinks=False):
+                        yield from _walk_models(entry.path, suffixes)
+                  elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                        st = entry.stat()
+                        yield entry.path, st.st_size, st.st_mtime
+            except OSError:
+                  continue
+
+def _read_scan_checkpoint(checkpoint):
+      """Return {(path, size, mtime)} already recorded in a checkpoint file."""
+      done = set()
+      try:
+            with open(checkpoint, 'rb') as f:
+                  for line in f:
+                        try:
+                              row = _JSON.loads(line)
+                              done.add((row['path'], row['size'], row['mtime']))
+                        except (ValueError, KeyError, TypeError):
+                              continue    # a line cut short by an interrupted run
+      except FileNotFoundError:
+            pass
+      return done
+
+@click.command('scan-hvym-data')
+@click.argument('root', type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes (1 = serial). Default: one per CPU for 64+ models.')
+@click.option('--checkpoint', type=click.Path(dir_okay=False), default=None, help='NDJSON file that records finished models; models already in it (same size and mtime) are skipped.')
+@click.option('--gltf/--no-gltf', default=False, help='Also scan .gltf files.')
+def scan_hvym_data(root, jobs, checkpoint, gltf):
+      """Scan a directory tree of glb models for Heavymeta data.
+
+      Prints one JSON line per model: {"path", "size", "mtime", "has_data",
+      "contract", "collections"} plus "error" for unreadable files. Only the
+      JSON chunk of each model is read.
+      """
+      suffixes = ('.glb', '.gltf') if gltf else ('.glb',)
+      entries = list(_walk_models(root, suffixes))
+      log = None
+      if checkpoint:
+            done = _read_scan_checkpoint(checkpoint)
+            entries = [e for e in entries if e not in done]
+            log = open(checkpoint, 'a+b')
+            # Start on a fresh line if an interrupted run left a partial one
+            if log.seek(0, os.SEEK_END):
+                  log.seek(-1, os.SEEK_END)
+                  if log.read(1) != b'\n':
+                        log.write(b'\n')
+
+      if jobs is None:
+            jobs = (os.cpu_count() or 1) if len(entries) >= _SCAN_PARALLEL_FILES else 1
+      jobs = max(1, min(jobs, len(entries) or 1))
+
+      out = click.get_binary_stream('stdout')
+      try:
+            if jobs > 1:
+                  from concurrent.futures import ProcessPoolExecutor
+                  pool = ProcessPoolExecutor(max_workers=jobs)
+                  results = pool.map(_scan_hvym_file, entries, chunksize=16)
+            else:
+                  pool = None
+                  results = map(_scan_hvym_file, entries)
+            try:
+                  for result in results:
+                        line = _JSON.dumpb(result) + b'\n'
+                        out.write(line)
+                        out.flush()
+                        if log:
+                              log.write(line)
+                              log.flush()
+            finally:
+                  if pool:
+                        pool.shutdown(cancel_futures=True)
+      finally:
+            if log:
+                  log.close()
+
+def _index_hvym_file(entry):
+      """Process pool worker: build the asset index row for one (path, size, mtime, hash?, old hash) model."""
+      path, size, mtime, want_hash, old_hash = entry
+      try:
+            return _index_row(path, size, mtime, want_hash, old_hash)
+      except (OSError, ValueError) as e:
+            error = str(e)
+      except Exception as e:
+            # One malformed model must not abort the whole index run
+            error = f'unexpected error: {e!r}'
+      return {'path': path, 'size': size, 'mtime': mtime, 'has_data': 0, 'error': error}
+
+def _index_row(path, size, mtime, want_hash, old_hash):
+      import hvym_glb
+      import hvym_asset_index
+      row = {'path': path, 'size': size, 'mtime': mtime, 'has_data': 0}
+      if want_hash:
+            row['content_hash'] = hvym_asset_index.content_hash(path)
+            if row['content_hash'] == old_hash:
+                  row['unchanged'] = True
+                  return row
+      nft_data = hvym_glb.read_extension(path, 'HVYM_nft_data', _JSON.loads)
+      if not isinstance(nft_data, dict):
+            return row
+      row['has_data'] = 1
+      row['nft_data'] = _JSON.dumps(nft_data)
+      contract = nft_data.get('contract')
+      if isinstance(contract, dict):
+            row['nft_type'] = contract.get('nftType')
+            row['chain'] = contract.get('nftChain')
+      try:
+            parsed = _parse_hvym_data(nft_data, os.path.basename(path))
+      except (KeyError, AttributeError, TypeError) as e:
+            row['error'] = f'unexpected HVYM_nft_data layout: {e!r}'
+      else:
+            row['parsed'] = _JSON.dumps(parsed)
+            row['creator_hash'] = parsed['creatorHash']
+      return row
+
+@click.group('assets')
+def assets():
+      """Index and query the Heavymeta data of local model files."""
+      pass
+
+@assets.command('index')
+@click.argument('root', type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes (1 = serial). Default: one per CPU for 64+ changed models.')
+@click.option('--hash', 'use_hash', is_flag=True, default=False, help='Also compare content hashes, so touched but unchanged files are not re-read.')
+@click.option('--gltf/--no-gltf', default=False, help='Also index .gltf files.')
+@click.option('--keep-missing', is_flag=True, default=False, help='Keep entries for files under ROOT that no longer exist.')
+def assets_index(root, jobs, use_hash, gltf, keep_missing):
+      """Add or refresh the index entries of every model under ROOT."""
+      import hvym_asset_index
+      root = os.path.abspath(root)
+      suffixes = ('.glb', '.gltf') if gltf else ('.glb',)
+      with hvym_asset_index.AssetIndex(hvym_asset_index.index_path(CLI_PATH)) as index:
+            known = index.known(root)
+            stale = []
+            unchanged = 0
+            for path, size, mtime in _walk_models(root, suffixes):
+                  old = known.pop(path, None)
+                  if old and old[0] == size and old[1] == mtime:
+                        unchanged += 1
+                  else:
+                        stale.append((path, size, mtime, use_hash, old[2] if old else None))
+
+            if jobs is None:
+                  jobs = (os.cpu_count() or 1) if len(stale) >= _SCAN_PARALLEL_FILES else 1
+            jobs = max(1, min(jobs, len(stale) or 1))
+            if jobs > 1:
+                  from concurrent.futures import ProcessPoolExecutor
+                  with ProcessPoolExecutor(max_workers=jobs) as pool:
+                        rows = list(pool.map(_index_hvym_file, stale, chunksize=16))
+            else:
+                  rows = [_index_hvym_file(e) for e in stale]
+
+            touched = [(r['path'], r['size'], r['mtime']) for r in rows if r.get('unchanged')]
+            updated = [r for r in rows if not r.get('unchanged')]
+            index.touch(touched)
+            index.upsert(updated)
+            if not keep_missing:
+                  index.remove(known)
+      errors = sum(1 for r in updated if r.get('error'))
+      click.echo(f"Indexed {root}: {len(updated)} updated, {unchanged + len(touched)} unchanged, "
+                 f"{0 if keep_missing else len(known)} removed, {errors} with errors")
+
+@assets.command('query')
+@click.option('--nft-type', type=str, default=None, help='Contract nftType, e.g. HVYC (case-insensitive).')
+@click.option('--chain', type=str, default=None, help='Contract nftChain, e.g. stellar (case-insensitive).')
+@click.option('--under', 'prefix', type=click.Path(file_okay=False), default=None, help='Only models below this directory.')
+@click.option('--all', 'include_all', is_flag=True, default=False, help='Include models without Heavymeta data.')
+@click.option('--full', is_flag=True, default=False, help='Include the stored HVYM_nft_data and parsed data.')
+def assets_query(nft_type, chain, prefix, include_all, full):
+      """Print indexed models as JSON lines, without opening the model files."""
+      import hvym_asset_index
+      with hvym_asset_index.AssetIndex(hvym_asset_index.index_path(CLI_PATH)) as index:
+            rows = index.query(nft_type, chain, os.path.abspath(prefix) if prefix else None,
+                               None if include_all else True)
+      out = click.get_binary_stream('stdout')
+      for row in rows:
+            item = {'path': row['path'], 'size': row['size'], 'mtime': row['mtime'], 'has_data': bool(row['has_data']),
+                    'nft_type': row['nft_type'], 'chain': row['chain'], 'creator_hash': row['creator_hash']}
+            if row['error']:
+                  item['error'] = row['error']
+            if full:
+                  item['nft_data'] = _JSON.loads(row['nft_data']) if row['nft_data'] else None
+                  item['parsed'] = _JSON.loads(row['parsed']) if row['parsed'] else None
+            out.write(_JSON.dumpb(item) + b'\n')
+      out.flush()
+
+@assets.command('encode')
+@click.argument('files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes (1 = serial). Default: one per CPU once the uncached files reach 32 MB.')
+@click.option('--no-cache', is_flag=True, default=False, help='Encode every file, without reading or updating the cache.')
+@click.option('--optimize', is_flag=True, default=False, help='Losslessly recompress PNGs and minify SVGs first; savings go to stderr.')
+def assets_encode(files, jobs, no_cache, optimize):
+      """Print a JSON map of each image file to its data URL.
+
+      Results are cached by content hash, so a file encoded before only costs
+      a hash of its bytes.
+      """
+      import hvym_data_url
+      try:
+            entries = [(path, hvym_data_url.mime_type(path)) for path in files]
+      except ValueError as e:
+            raise click.ClickException(str(e))
+      urls = _cached_data_urls(entries, optimize, jobs, use_cache=not no_cache)
+      if optimize:
+            _report_data_url_savings(urls)
+      _echo_json_stream({path: url.decode('ascii') for path, url in urls.items()})
+
 '''popup creation methods:'''
 
+def _remote_interaction():
+      """Proxy to a running `hvym ui-server`, or None when there is none (HVYM_UI_SERVER=0 disables).
+
+      Once the server has answered, a failed popup request is reported as a
+      ClickException rather than retried with in-process Qt.
+      """
+      if os.environ.get('HVYM_UI_SERVER') == '0':
+            return None
+      import hvym_ui_server
+      return hvym_ui_server.connect(CLI_PATH, error=click.ClickException)
+
 def _get_hvym_interaction():
       """Lazy-load HVYMInteraction from qthvym to avoid PyQt5 import overhead for non-UI commands."""
+      remote = _remote_interaction()
+      if remote is not None:
+            return remote
+      if _is_core_build():
+            # _handoff_ui_command only kept this command in hvym-core because
+            # the UI server answered; it has stopped since, and core has no Qt.
+            raise click.ClickException('The UI server stopped responding; start `hvym ui-server` again or run the full hvym executable.')
       modules = lazy_importer.get_modules('qthvym')
       # Process pending Qt events to ensure QApplication is fully initialized
       # before showing any dialogs. Without this, the first dialog may hang
@@ -3478,8 +4986,8 @@ def _stellar_friendbot_fund(public_key):
             modules = lazy_importer.get_modules('network')
             requests = modules['requests']
             
-            url = f"https://horizon-testnet.stellar.org/friendbot/?addr={public_key}"
-            response = requests.get(url)
+            url = f"{FRIENDBOT_URL}?addr={public_key}"
+            response = requests.get(url, timeout=30)
             response.raise_for_status() # Raise an exception for bad status codes
             
             if response.status_code == 200:
@@ -3630,13 +5138,14 @@ def _is_pinggy_tunnel_open():
         modules = lazy_importer.get_modules('network')
         requests = modules['requests']
         # Pinggy web debugger runs on localhost:4300
-        response = requests.get("http://localhost:4300", timeout=5)
+        response = requests.get(PINGGY_DEBUGGER_URL, timeout=5)
         return response.status_code == 200
     except:
         return False
 
 cli.add_command(parse_blender_hvym_interactables)
 cli.add_command(parse_blender_hvym_collection)
+cli.add_command(parse_blender_hvym_scene)
 cli.add_command(contract_data)
 cli.add_command(collection_data)
 cli.add_command(contract_data)
@@ -3689,8 +5198,13 @@ cli.add_command(img_to_url)
 cli.add_command(svg_to_data_url)
 cli.add_command(png_to_data_url)
 cli.add_command(update_npm_modules)
+cli.add_command(fetch_templates)
 cli.add_command(update_proprium_js_file)
 cli.add_command(check)
+cli.add_command(bench)
+cli.add_command(runtime_install)
+cli.add_command(runtime_path)
+cli.add_command(ui_server)
 cli.add_command(up)
 cli.add_command(custom_loading_msg)
 cli.add_command(custom_prompt)
@@ -3714,6 +5228,9 @@ def about():
 
 # Add all commands to the CLI
 cli.add_command(print_hvym_data)
+cli.add_command(write_hvym_data)
+cli.add_command(scan_hvym_data)
+cli.add_command(assets)
 cli.add_command(version)
 cli.add_command(about)
 # cli.add_command(pintheon_pull_popup)
@@ -3729,9 +5246,17 @@ def _cleanup_tunnel():
       _tunnel_status = "stopped"
 
 if __name__ == '__main__':
+    # In a frozen build every helper process multiprocessing starts (pool
+    # workers, the resource tracker, the forkserver) runs this executable;
+    # freeze_support() runs them and exits before the CLI starts. Needed for
+    # the process pools of parse-blender-hvym-scene, columnar
+    # parse-blender-hvym-interactables, scan-hvym-data and assets index/encode.
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         _ensure_qss_environment()
         _hvym_startup_diag()
+        _handoff_ui_command(sys.argv)
         cli()
     finally:
         _cleanup_tunnel()
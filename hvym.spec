@@ -11,6 +11,49 @@ hvym_script = current_dir / 'hvym.py'
 is_macos = sys.platform == 'darwin'
 is_windows = sys.platform == 'win32'
 
+# HVYM_PYI_LAYOUT=onedir builds an unpacked tree (see hvym_runtime.py) instead
+# of a self-extracting binary; HVYM_PYI_OPTIMIZE precompiles bytecode (keep <= 1,
+# level 2 strips the docstrings click uses for --help).
+onedir = os.environ.get('HVYM_PYI_LAYOUT', 'onefile') == 'onedir'
+optimize = int(os.environ.get('HVYM_PYI_OPTIMIZE', '1' if onedir else '0'))
+
+# HVYM_PYI_CORE=1 builds the Qt-free hvym-core executable instead; UI commands
+# are forwarded from it to the full hvym (see _UI_COMMANDS in hvym.py).
+core = os.environ.get('HVYM_PYI_CORE') == '1'
+exe_name = 'hvym-core' if core else 'hvym'
+
+datas = [
+    ('templates', 'templates'),
+    ('scripts', 'scripts'),
+    ('images', 'images'),
+    ('data', 'data'),
+    ('npm_links', 'npm_links'),
+    ('lazy_loader.py', '.'),
+    ('hvym_runtime.py', '.'),
+    ('hvym_ui_server.py', '.'),
+    ('hvym_glb.py', '.'),
+    ('hvym_asset_index.py', '.'),
+    ('hvym_template_cache.py', '.'),
+    ('hvym_data_url.py', '.')
+]
+hiddenimports = [
+    'platformdirs',
+    'tinydb',
+    'tinydb_encrypted_jsonstorage'
+]
+# Optional fast JSON backends (_JsonCodec in hvym.py) are imported by name, so
+# PyInstaller only sees them when listed here.
+import importlib.util
+hiddenimports += [m for m in ('orjson', 'msgspec') if importlib.util.find_spec(m)]
+# The bench harness and its fixtures are development tools: hvym bench runs
+# from a source checkout (it can still time a frozen build with --frozen-exe).
+excludes = ['hvym_bench', 'hvym_fixtures']
+if core:
+    excludes += ['PyQt5', 'qthvym', 'stellar_sdk', 'hvym_stellar', 'tkinter']
+else:
+    datas.insert(0, ('qthvym', 'qthvym'))
+    hiddenimports = ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'qthvym'] + hiddenimports
+
 # Runtime hooks
 runtime_hooks = []
 if is_macos:
@@ -22,40 +65,25 @@ a = Analysis(
     [str(hvym_script)],
     pathex=[str(current_dir)],
     binaries=[],
-    datas=[
-        ('qthvym', 'qthvym'), 
-        ('templates', 'templates'), 
-        ('scripts', 'scripts'), 
-        ('images', 'images'), 
-        ('data', 'data'), 
-        ('npm_links', 'npm_links'), 
-        ('lazy_loader.py', '.')
-    ],
-    hiddenimports=[
-        'PyQt5.QtCore',
-        'PyQt5.QtGui', 
-        'PyQt5.QtWidgets',
-        'qthvym',
-        'platformdirs',
-        'tinydb',
-        'tinydb_encrypted_jsonstorage'
-    ],
+    datas=datas,
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=runtime_hooks,
-    excludes=[],
+    excludes=excludes,
     noarchive=False,
+    optimize=optimize,
 )
 
 pyz = PYZ(a.pure)
 
+exe_contents = [a.scripts] if onedir else [a.scripts, a.binaries, a.datas, []]
+
 exe = EXE(
     pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='hvym',
+    *exe_contents,
+    exclude_binaries=onedir,
+    name=exe_name,
     debug=False,
     bootloader_ignore_signals=False,
     strip=False if is_macos else False,
@@ -69,3 +97,14 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+if onedir:
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False if is_macos else True,
+        upx_exclude=[],
+        name=exe_name,
+    )
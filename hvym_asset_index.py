@@ -0,0 +1,124 @@
+"""
+Persistent Asset Index for HeavyMeta CLI
+
+`hvym assets index` records, for every model under a directory, what the
+GLB metadata reader extracted: the raw HVYM_nft_data, the `_parse_hvym_data`
+output and the creator hash, plus the contract type and chain as indexed
+columns. Entries are keyed by path and invalidated when the file's size or
+mtime changes; with content hashing on, a touched but unchanged file is
+recognised by its hash and not re-read. `hvym assets query` answers from
+the index alone, without opening any model.
+
+Values are stored as JSON text encoded by the caller. Stdlib only.
+"""
+
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+
+
+INDEX_FILE = 'asset_index.sqlite'
+COLUMNS = ('path', 'size', 'mtime', 'content_hash', 'has_data', 'nft_type', 'chain',
+           'creator_hash', 'nft_data', 'parsed', 'error', 'indexed')
+
+
+def index_path(cli_path):
+    return Path(cli_path) / INDEX_FILE
+
+
+def content_hash(path, block_size=1 << 20):
+    """sha256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetIndex:
+    """SQLite table of model metadata keyed by absolute path."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=10)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('''CREATE TABLE IF NOT EXISTS assets (
+                            path TEXT PRIMARY KEY,
+                            size INTEGER NOT NULL,
+                            mtime REAL NOT NULL,
+                            content_hash TEXT,
+                            has_data INTEGER NOT NULL,
+                            nft_type TEXT COLLATE NOCASE,
+                            chain TEXT COLLATE NOCASE,
+                            creator_hash TEXT,
+                            nft_data TEXT,
+                            parsed TEXT,
+                            error TEXT,
+                            indexed REAL NOT NULL)''')
+        self._db.execute('CREATE INDEX IF NOT EXISTS assets_type_chain ON assets (nft_type, chain)')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def _prefix_clause(prefix):
+        # Match the directory itself and everything below it, not siblings
+        # that merely share the prefix ('/models' vs '/models2').
+        prefix = str(prefix).rstrip('/\\')
+        return "(path = ? OR substr(path, 1, ?) IN (? || '/', ? || '\\'))", [prefix, len(prefix) + 1, prefix, prefix]
+
+    def known(self, prefix):
+        """Return {path: (size, mtime, content_hash)} for the entries under prefix."""
+        clause, args = self._prefix_clause(prefix)
+        rows = self._db.execute(f'SELECT path, size, mtime, content_hash FROM assets WHERE {clause}', args)
+        return {row['path']: (row['size'], row['mtime'], row['content_hash']) for row in rows}
+
+    def get(self, path):
+        """Return the entry for path as a sqlite3.Row, or None."""
+        return self._db.execute('SELECT * FROM assets WHERE path = ?', (str(path),)).fetchone()
+
+    def upsert(self, rows):
+        """Insert or replace entries given as dicts with the COLUMNS keys (indexed is filled in)."""
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO assets VALUES ({', '.join('?' * len(COLUMNS))})",
+                ([row.get(c) if c != 'indexed' else now for c in COLUMNS] for row in rows))
+
+    def touch(self, entries):
+        """Record a new (size, mtime) for files whose content hash showed them unchanged."""
+        with self._db:
+            self._db.executemany('UPDATE assets SET size = ?, mtime = ? WHERE path = ?',
+                                 ((size, mtime, path) for path, size, mtime in entries))
+
+    def remove(self, paths):
+        with self._db:
+            self._db.executemany('DELETE FROM assets WHERE path = ?', ((p,) for p in paths))
+
+    def query(self, nft_type=None, chain=None, prefix=None, has_data=None):
+        """Return matching entries as sqlite3.Row objects, ordered by path."""
+        clauses, args = [], []
+        if nft_type is not None:
+            clauses.append('nft_type = ?')
+            args.append(nft_type)
+        if chain is not None:
+            clauses.append('chain = ?')
+            args.append(chain)
+        if prefix is not None:
+            clause, prefix_args = self._prefix_clause(prefix)
+            clauses.append(clause)
+            args += prefix_args
+        if has_data is not None:
+            clauses.append('has_data = ?')
+            args.append(int(has_data))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self._db.execute(f'SELECT * FROM assets{where} ORDER BY path', args).fetchall()
@@ -0,0 +1,655 @@
+"""
+Benchmark Harness for HeavyMeta CLI
+
+Measures p50/p95/p99 wall time and peak RSS of the hot CLI commands by
+spawning the CLI exactly the way the GUI and Blender do: one process per call.
+Runs happen inside an isolated HOME with the hvym_fixtures stand-ins for
+Docker, the Pinggy web debugger and Friendbot, so numbers are reproducible and
+never touch the real install.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import struct
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+
+from hvym_fixtures import FixtureEnvironment
+
+
+# Commands measured by default; payload-taking commands get their arguments
+# from BenchWorkspace.argv().
+DEFAULT_COMMANDS = [
+    'check',
+    'version',
+    'pinggy-token',
+    'pintheon-port',
+    'installation-stats',
+    'docker-installed',
+    'is-pintheon-tunnel-open',
+    'pintheon-start',
+    'pintheon-stop',
+    'parse-blender-hvym-collection',
+    'parse-blender-hvym-interactables',
+    'print-hvym-data',
+]
+
+SCENARIOS = ('cold', 'warm')
+
+# Relative slowdown tolerated before a comparison is flagged as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+BASELINE_SCHEMA = 1
+
+
+# === SYNTHETIC PAYLOADS ===
+
+TRAIT_TYPES = ['property', 'text', 'call', 'mesh', 'mesh_set', 'morph_set', 'anim', 'mat_prop', 'mat_set']
+
+
+def synthetic_trait(index, trait_type):
+    """Return one Blender trait object carrying every field the parser reads."""
+    model_ref = {'name': f'mesh_{index}', 'type': 'MESH'}
+    return {
+        'trait_type': trait_type,
+        'type': f'{trait_type}_{index}',
+        'show': True,
+        'visible': bool(index % 2),
+        'behavior_set': None if index % 3 else [{'name': f'b{index}', 'trait_type': 'property'}],
+        'prop_value_type': 'Float' if index % 2 else 'Int',
+        'prop_action_type': ['Immutable', 'Static', 'Incremental', 'Decremental'][index % 4],
+        'prop_slider_type': 'RANGE',
+        'prop_immutable': False,
+        'prop_toggle_type': 'TOGGLE',
+        'prop_selector_type': 'SELECTOR',
+        'prop_multi_widget_type': 'MULTI',
+        'prop_anim_slider_type': 'SLIDER',
+        'prop_text_widget_type': 'TEXT',
+        'int_default': index, 'int_min': 0, 'int_max': index + 100, 'int_amount': 1,
+        'float_default': index * 0.5, 'float_min': 0.0, 'float_max': index + 100.5, 'float_amount': 0.25,
+        'text_value': f'text {index}',
+        'call_param': f'param_{index}',
+        'model_ref': model_ref,
+        'mesh_set': [{'name': f'mesh_{index}_{i}', 'visible': True} for i in range(4)],
+        'morph_set': [{'name': f'morph_{index}_{i}'} for i in range(4)],
+        'anim_loop': 'Clamp' if index % 2 else 'LoopRepeat',
+        'anim_start': 0, 'anim_end': 120, 'anim_blending': 'NORMAL',
+        'anim_weight': 1.0, 'anim_play': False,
+        'mat_ref': {'name': f'mat_{index}', 'color': '#ffffff', 'roughness': 0.5,
+                    'metalness': 0.1, 'emissive': '#000000', 'emissiveIntensity': 1.0},
+        'mat_type': 'PBR' if index % 2 else 'STANDARD',
+        'mat_reflective': False, 'mat_iridescent': bool(index % 2),
+        'mat_sheen': False, 'mat_emissive': True,
+        'mat_set': [{'name': f'mat_{index}_{i}'} for i in range(3)],
+        'mesh_set_name': [{'name': f'mesh_{index}'}],
+        'material_id': 0,
+        'value_prop_label': 'Value Properties', 'text_prop_label': 'Text Properties',
+        'call_prop_label': 'Calls', 'mesh_prop_label': 'Meshes',
+        'mat_prop_label': 'Materials', 'anim_prop_label': 'Animations',
+        'mesh_set_label': 'Mesh Sets', 'morph_set_label': 'Morph Sets',
+        'mat_set_label': 'Material Sets',
+    }
+
+
+def synthetic_collection(num_traits, collection_id='0', num_menus=4, num_actions=4):
+    """Return (collection, menu, nodes, actions) dicts shaped like the Blender add-on output."""
+    collection = {'collection_name': f'collection_{collection_id}'}
+    for i in range(num_traits):
+        collection[str(i)] = synthetic_trait(i, TRAIT_TYPES[i % len(TRAIT_TYPES)])
+
+    menu = {}
+    for i in range(num_menus):
+        menu[str(i)] = {
+            'menu_name': f'menu_{i}',
+            'menu_primary_color': '#000000',
+            'menu_secondary_color': '#ffffff',
+            'menu_text_color': '#ff00ff',
+            'menu_alignment': 'CENTER',
+            'collection_id': str(i),
+        }
+
+    nodes = {str(i): {'name': f'node_{i}', 'type': 'MESH'} for i in range(num_traits // 4 + 1)}
+
+    actions = {}
+    for i in range(num_actions):
+        actions[str(i)] = {
+            'trait_type': 'mesh_action' if i % 2 else 'anim_action',
+            'type': f'action_{i}',
+            'action_set': [{'name': f'anim_{i}'}],
+            'mesh_interaction_type': 'CLICK',
+            'anim_interaction_type': 'HOVER',
+            'sequence_type': 'LOOP',
+            'additive': False,
+            'model_ref': {'name': f'mesh_{i}'},
+        }
+
+    return collection, menu, nodes, actions
+
+
+def synthetic_interactables(num_objects):
+    """Return an interactables payload shaped like the Blender add-on output."""
+    objs = {}
+    for i in range(num_objects):
+        objs[f'obj_{i}'] = {
+            'name': f'obj_{i}',
+            'hvym_interactable': True,
+            'hvym_interactable_has_return': bool(i % 2),
+            'hvym_mesh_interaction_type': 'button',
+            'hvym_interactable_selector_dir': 'VERTICAL',
+            'hvym_mesh_interaction_name': f'interaction_{i}',
+            'hvym_mesh_interaction_call': f'call_{i}',
+            'hvym_mesh_interaction_default_text': 'text',
+            'hvym_mesh_interaction_text_scale': 1.0,
+            'hvym_mesh_interaction_text_wrap': True,
+            'hvym_mesh_interaction_param_type': 'NONE',
+            'hvym_mesh_interaction_slider_param_type': 'INT',
+            'hvym_mesh_interaction_toggle_param_type': 'STATE',
+            'hvym_mesh_interaction_string_param': '',
+            'hvym_mesh_interaction_int_param': i,
+            'hvym_mesh_interaction_float_default': 0.5,
+            'hvym_mesh_interaction_float_min': 0.0,
+            'hvym_mesh_interaction_float_max': 1.0,
+            'hvym_mesh_interaction_int_default': 5,
+            'hvym_mesh_interaction_int_min': 0,
+            'hvym_mesh_interaction_int_max': 10,
+            'hvym_mesh_interaction_toggle_state': False,
+            'hvym_mesh_interaction_toggle_int': 0,
+            'hvym_interactable_behavior': 'NONE' if i % 2 else 'SELECT',
+            'children': [{'name': f'obj_{i}_child_{c}', 'type': 'MESH' if c % 2 == 0 else 'EMPTY'} for c in range(3)],
+        }
+    return objs
+
+
+def synthetic_hvym_data(num_collections=2, num_props=8):
+    """Return an HVYM_nft_data extension payload."""
+    data = {
+        'contract': {
+            'mintable': True, 'nftType': 'HVYC', 'nftChain': 'STELLAR',
+            'nftPrice': 1.0, 'premNftPrice': 2.0, 'maxSupply': 100,
+            'minterType': 'payable', 'minterName': 'bench', 'minterDesc': 'bench model',
+            'minterImage': '', 'minterVersion': 0.01,
+            'enableContextMenus': True, 'menuIndicatorsShown': False,
+        },
+        'project': 'bench_project',
+    }
+    for c in range(num_collections):
+        val_props = {}
+        for p in range(num_props):
+            val_props[f'prop_{p}'] = {
+                'widget_type': 'RANGE', 'show': True, 'prop_slider_type': 'RANGE',
+                'prop_action_type': 'Static' if p % 4 == 0 else 'Incremental',
+                'default': p, 'min': 0, 'max': 100, 'immutable': p % 5 == 0, 'amount': 1,
+            }
+        data[f'collection_{c}'] = {
+            'collectionName': f'collection_{c}',
+            'valProps': val_props,
+            'callProps': {f'call_{p}': {'name': f'call_{p}', 'call_param': ''} for p in range(num_props // 2)},
+        }
+    return data
+
+
+def write_synthetic_glb(path, hvym_data=None, bin_size=1 << 20):
+    """Write a minimal valid GLB with an HVYM_nft_data extension and a BIN chunk of bin_size bytes."""
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'hvym_bench'},
+        'buffers': [{'byteLength': bin_size}],
+        'extensionsUsed': ['HVYM_nft_data'],
+        'extensions': {'HVYM_nft_data': hvym_data if hvym_data is not None else synthetic_hvym_data()},
+    }
+    json_chunk = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    bin_size += -bin_size % 4
+    total = 12 + 8 + len(json_chunk) + 8 + bin_size
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, total))
+        f.write(struct.pack('<I4s', len(json_chunk), b'JSON'))
+        f.write(json_chunk)
+        f.write(struct.pack('<I4s', bin_size, b'BIN\x00'))
+        chunk = b'\x00' * min(bin_size, 1 << 20)
+        remaining = bin_size
+        while remaining > 0:
+            f.write(chunk[:remaining])
+            remaining -= len(chunk)
+    return path
+
+
+class BenchWorkspace:
+    """Isolated HOME, PATH and payload files shared by all benchmark runs.
+
+    The Docker, Pinggy and Friendbot stand-ins come from hvym_fixtures; pass a
+    FaultPlan to measure the CLI under slow or failing dependencies.
+    """
+
+    def __init__(self, root=None, traits=60, interactables=40, glb_bin_size=8 << 20, fault_plan=None):
+        self._owned = root is None
+        self.root = Path(root or tempfile.mkdtemp(prefix='hvym_bench_'))
+        self.traits = traits
+        self.interactables = interactables
+        self.glb_bin_size = glb_bin_size
+        self.env = None
+        self.payloads = {}
+        self.fixtures = FixtureEnvironment(
+            self.root / 'fixtures',
+            docker_faults=fault_plan,
+            engine_faults=fault_plan,
+            tunnel_faults=fault_plan,
+            friendbot_faults=fault_plan,
+        )
+
+    def __enter__(self):
+        self.fixtures.__enter__()
+        env = dict(self.fixtures.env)
+        env.pop('HVYM_PERF', None)
+        env.pop('HVYM_DIAG', None)
+        self.env = env
+
+        collection, menu, nodes, actions = synthetic_collection(self.traits)
+        self.payloads['collection'] = [
+            'bench_collection', 'multi', '0',
+            json.dumps(collection), json.dumps(menu), json.dumps(nodes), json.dumps(actions),
+        ]
+        self.payloads['interactables'] = [json.dumps(synthetic_interactables(self.interactables))]
+        self.payloads['glb'] = str(write_synthetic_glb(self.root / 'model.glb', bin_size=self.glb_bin_size))
+        return self
+
+    def __exit__(self, *exc):
+        self.fixtures.__exit__(*exc)
+        if self._owned:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def argv(self, command):
+        """Return the argv tail for a benchmarked command."""
+        if command == 'parse-blender-hvym-collection':
+            return [command] + self.payloads['collection']
+        if command == 'parse-blender-hvym-interactables':
+            return [command] + self.payloads['interactables']
+        if command == 'print-hvym-data':
+            return [command, self.payloads['glb']]
+        return [command]
+
+
+# === MEASUREMENT ===
+
+def _run_once(cmd, env):
+    """Run cmd to completion, returning (wall_ms, peak_rss_kb, returncode)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall_ms = (time.perf_counter() - start) * 1000
+        proc.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, 'waitstatus_to_exitcode') else status
+        # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+        rss_kb = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+        return wall_ms, rss_kb, proc.returncode
+    proc.wait()
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, _windows_peak_rss_kb(proc), proc.returncode
+
+
+def _windows_peak_rss_kb(proc):
+    """Peak working set of an exited process on Windows, or None if unavailable."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(int(proc._handle), ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize // 1024 if ok else None
+    except Exception:
+        return None
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Reduce (wall_ms, rss_kb, rc) samples to the stats stored in a baseline."""
+    walls = sorted(s[0] for s in samples)
+    rss = [s[1] for s in samples if s[1] is not None]
+    return {
+        'runs': len(samples),
+        'failures': sum(1 for s in samples if s[2] != 0),
+        'p50_ms': round(percentile(walls, 50), 2),
+        'p95_ms': round(percentile(walls, 95), 2),
+        'p99_ms': round(percentile(walls, 99), 2),
+        'min_ms': round(walls[0], 2),
+        'peak_rss_kb': max(rss) if rss else None,
+    }
+
+
+def cli_prefix(mode, hvym_script=None, frozen_exe=None):
+    """Return the argv prefix that invokes the CLI in the given mode."""
+    if mode == 'frozen':
+        exe = frozen_exe or (sys.executable if getattr(sys, 'frozen', False) else None)
+        if not exe:
+            raise ValueError('Frozen mode needs the path to a built hvym executable.')
+        return [str(exe)]
+    if getattr(sys, 'frozen', False):
+        raise ValueError('Source mode is unavailable from a frozen build.')
+    return [sys.executable, str(hvym_script)]
+
+
+def bench_command(prefix, workspace, command, iterations, scenario):
+    """Measure one command under one scenario.
+
+    cold: every run gets a fresh bytecode cache and a fresh CLI data dir,
+          so imports are recompiled and the fast config cache is empty.
+    warm: one discarded warm-up run, then all runs share caches.
+    """
+    argv = prefix + workspace.argv(command)
+    samples = []
+    if scenario == 'warm':
+        env = dict(workspace.env)
+        env['PYTHONPYCACHEPREFIX'] = str(workspace.root / 'pycache_warm')
+        _run_once(argv, env)
+        for _ in range(iterations):
+            samples.append(_run_once(argv, env))
+    else:
+        for i in range(iterations):
+            env = dict(workspace.env)
+            run_dir = workspace.root / 'cold' / f'{command}_{i}'
+            home = run_dir / 'home'
+            home.mkdir(parents=True, exist_ok=True)
+            env['HOME'] = str(home)
+            env['USERPROFILE'] = str(home)
+            env['PYTHONPYCACHEPREFIX'] = str(run_dir / 'pycache')
+            samples.append(_run_once(argv, env))
+            shutil.rmtree(run_dir, ignore_errors=True)
+    return summarize(samples)
+
+
+def run_benchmarks(modes, commands=None, iterations=20, scenarios=SCENARIOS,
+                   hvym_script=None, frozen_exe=None, progress=None, fault_plan=None):
+    """Run every command in every mode and scenario, returning a baseline document."""
+    commands = commands or DEFAULT_COMMANDS
+    results = {}
+    with BenchWorkspace(fault_plan=fault_plan) as workspace:
+        for mode in modes:
+            prefix = cli_prefix(mode, hvym_script, frozen_exe)
+            results[mode] = {}
+            for command in commands:
+                results[mode][command] = {}
+                for scenario in scenarios:
+                    stats = bench_command(prefix, workspace, command, iterations, scenario)
+                    results[mode][command][scenario] = stats
+                    if progress:
+                        progress(mode, command, scenario, stats)
+    return {
+        'schema': BASELINE_SCHEMA,
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'python': platform.python_version(),
+            'iterations': iterations,
+            'fault_plan': fault_plan.to_dict() if fault_plan else None,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of regression descriptions of current against baseline."""
+    regressions = []
+    for mode, commands in current['results'].items():
+        for command, scenarios in commands.items():
+            for scenario, stats in scenarios.items():
+                base = baseline.get('results', {}).get(mode, {}).get(command, {}).get(scenario)
+                if not base:
+                    continue
+                for key in ('p50_ms', 'p95_ms', 'peak_rss_kb'):
+                    old, new = base.get(key), stats.get(key)
+                    if old and new and new > old * (1 + threshold):
+                        regressions.append(
+                            f'{mode}/{command}/{scenario} {key}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)')
+                if stats.get('failures', 0) > base.get('failures', 0):
+                    regressions.append(f'{mode}/{command}/{scenario} failures: {base.get("failures", 0)} -> {stats["failures"]}')
+    return regressions
+
+
+def format_table(report):
+    """Render a report as a fixed-width text table."""
+    lines = [f"{'mode':<7}{'command':<36}{'scenario':<9}{'p50':>9}{'p95':>9}{'p99':>9}{'rss MB':>9}{'fail':>6}"]
+    for mode, commands in report['results'].items():
+        for command, scenarios in commands.items():
+            for scenario, s in scenarios.items():
+                rss = f"{s['peak_rss_kb'] / 1024:.1f}" if s['peak_rss_kb'] else '-'
+                lines.append(f"{mode:<7}{command:<36}{scenario:<9}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}"
+                             f"{s['p99_ms']:>9.1f}{rss:>9}{s['failures']:>6}")
+    return '\n'.join(lines)
+
+
+def mode_ratios(report):
+    """Return {command: {scenario: frozen_p50 / source_p50}} when both modes were measured."""
+    results = report['results']
+    if 'source' not in results or 'frozen' not in results:
+        return {}
+    ratios = {}
+    for command, scenarios in results['frozen'].items():
+        for scenario, stats in scenarios.items():
+            source = results['source'].get(command, {}).get(scenario)
+            if source and source['p50_ms']:
+                ratios.setdefault(command, {})[scenario] = round(stats['p50_ms'] / source['p50_ms'], 2)
+    return ratios
+
+
+# === IN-PROCESS MICRO-BENCHMARKS ===
+
+def _time_ms(fn, repeats):
+    """Run fn `repeats` times, returning (sorted wall times in ms, last result)."""
+    times = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000.0)
+    times.sort()
+    return times, result
+
+
+def bench_record_layer(hvym, num_traits=10000, repeats=5):
+    """_parse_hvym_collection with __slots__ records vs the dataclass_json classes."""
+    collection, menu, nodes, actions = synthetic_collection(num_traits)
+    args = ('bench_collection', 'multi', '0', collection, menu, nodes, actions)
+    saved = hvym._USE_RECORDS
+    stats = {}
+    outputs = {}
+    try:
+        for label, use_records in (('dataclass', False), ('record', True)):
+            hvym._USE_RECORDS = use_records
+            times, outputs[label] = _time_ms(lambda: hvym._parse_hvym_collection(*args).json, repeats)
+            stats[label] = {'p50_ms': round(percentile(times, 50), 2), 'min_ms': round(times[0], 2)}
+    finally:
+        hvym._USE_RECORDS = saved
+    return {
+        'traits': num_traits,
+        'baseline': stats['dataclass'],
+        'optimized': stats['record'],
+        'speedup': round(stats['dataclass']['p50_ms'] / stats['record']['p50_ms'], 2),
+        'identical': outputs['dataclass'] == outputs['record'],
+    }
+
+
+def bench_schema_validation(hvym, num_traits=10000, repeats=5):
+    """Cost of validating in the parse pass: validate=False (baseline) vs True.
+
+    Here 'optimized' is the validating path, so a speedup just under 1.0 is
+    the overhead of validation.
+    """
+    collection, menu, nodes, actions = synthetic_collection(num_traits)
+    args = ('bench_collection', 'multi', '0', collection, menu, nodes, actions)
+    stats = {}
+    outputs = {}
+    for label, validate in (('unchecked', False), ('validated', True)):
+        times, outputs[label] = _time_ms(lambda: hvym._parse_hvym_collection(*args, validate=validate).json, repeats)
+        stats[label] = {'p50_ms': round(percentile(times, 50), 2), 'min_ms': round(times[0], 2)}
+    return {
+        'traits': num_traits,
+        'baseline': stats['unchecked'],
+        'optimized': stats['validated'],
+        'speedup': round(stats['unchecked']['p50_ms'] / stats['validated']['p50_ms'], 2),
+        'identical': outputs['unchecked'] == outputs['validated'],
+    }
+
+
+def bench_json_codec(hvym, num_traits=10000, repeats=5):
+    """Decode + encode of a collection document: stdlib json vs the _JSON fast backend.
+
+    'identical' compares decoded values, since fast backends emit compact JSON.
+    """
+    collection, menu, nodes, actions = synthetic_collection(num_traits)
+    record = hvym._parse_hvym_collection('bench_collection', 'multi', '0', collection, menu, nodes, actions)
+    document = json.dumps({'collection': collection, 'menu': menu, 'nodes': nodes, 'actions': actions})
+    codec = hvym._JsonCodec(fast=True)
+    stdlib = hvym._JsonCodec()
+    stats = {}
+    outputs = {}
+    for label, c in (('stdlib', stdlib), ('fast', codec)):
+        times, outputs[label] = _time_ms(lambda: (c.loads(document), c.dumps(record))[1], repeats)
+        stats[label] = {'p50_ms': round(percentile(times, 50), 2), 'min_ms': round(times[0], 2)}
+    return {
+        'traits': num_traits,
+        'backend': codec.backend,
+        'baseline': stats['stdlib'],
+        'optimized': stats['fast'],
+        'speedup': round(stats['stdlib']['p50_ms'] / stats['fast']['p50_ms'], 2),
+        'identical': json.loads(outputs['stdlib']) == json.loads(outputs['fast']),
+    }
+
+
+def interactable_columns(objs):
+    """Transpose a synthetic_interactables payload into the columnar document."""
+    rows = list(objs.values())
+    columns = {key: [row[key] for row in rows] for key in rows[0]} if rows else {}
+    return {'__format__': 1, '__columns__': columns}
+
+
+def bench_interactable_columns(hvym, num_traits=10000, repeats=5):
+    """Interactables: per-object data classes (the original loop) vs the validated columnar batch."""
+    objs = synthetic_interactables(num_traits)
+    columns = interactable_columns(objs)['__columns__']
+    saved = hvym._USE_RECORDS
+
+    def rows():
+        hvym._USE_RECORDS = False
+        try:
+            return hvym._JSON.dumpb({obj['name']: hvym._interactable_entry(tuple(obj[c] for c in hvym._INTERACTABLE_COLUMNS),
+                                                                           obj['children'], obj['hvym_interactable_behavior'])
+                                     for obj in objs.values() if obj['hvym_interactable']})
+        finally:
+            hvym._USE_RECORDS = saved
+
+    def batch():
+        assert not hvym._check_interactable_columns(columns)
+        return hvym._JSON.dumpb(hvym._parse_interactable_columns(columns, jobs=1))
+
+    stats = {}
+    outputs = {}
+    for label, fn in (('rows', rows), ('columns', batch)):
+        times, outputs[label] = _time_ms(fn, repeats)
+        stats[label] = {'p50_ms': round(percentile(times, 50), 2), 'min_ms': round(times[0], 2)}
+    return {
+        'traits': num_traits,
+        'baseline': stats['rows'],
+        'optimized': stats['columns'],
+        'speedup': round(stats['rows']['p50_ms'] / stats['columns']['p50_ms'], 2),
+        'identical': outputs['rows'] == outputs['columns'],
+    }
+
+
+def bench_render_plan(hvym, num_traits=10000, repeats=5):
+    """Project templates: a fresh Jinja environment per render (the original) vs the render plan.
+
+    num_traits sets the number of collections' props in the model data. The
+    plan is re-run over unchanged outputs, so later repeats measure the
+    render-and-skip path.
+    """
+    from jinja2 import Environment, FileSystemLoader
+    hvym_data = synthetic_hvym_data(num_collections=max(1, num_traits // 1000), num_props=8)
+    hvym_data['project'] = {'name': 'bench_project'}
+    data = hvym._parse_hvym_data(hvym_data, 'bench.glb')
+    templates = [hvym.TEMPLATE_MODEL_MINTER_MAIN, hvym.TEMPLATE_MODEL_MINTER_TYPES,
+                 hvym.TEMPLATE_MODEL_MINTER_INDEX, hvym.TEMPLATE_MODEL_MINTER_JS,
+                 hvym.TEMPLATE_CUSTOM_CLIENT_INDEX, hvym.TEMPLATE_CUSTOM_CLIENT_JS]
+    with tempfile.TemporaryDirectory() as tmp:
+        def original():
+            out = {}
+            for template in templates:
+                env = Environment(loader=FileSystemLoader(hvym.FILE_PATH / 'templates'))
+                path = os.path.join(tmp, 'original_' + template)
+                with open(path, 'w') as f:
+                    f.write(env.get_template(template).render(data=data))
+                with open(path) as f:
+                    out[template] = f.read()
+            return out
+
+        def plan():
+            hvym._render_plan([(t, os.path.join(tmp, 'plan_' + t)) for t in templates], data)
+            out = {}
+            for template in templates:
+                with open(os.path.join(tmp, 'plan_' + template)) as f:
+                    out[template] = f.read()
+            return out
+
+        stats = {}
+        outputs = {}
+        for label, fn in (('original', original), ('plan', plan)):
+            times, outputs[label] = _time_ms(fn, repeats)
+            stats[label] = {'p50_ms': round(percentile(times, 50), 2), 'min_ms': round(times[0], 2)}
+    return {
+        'traits': num_traits,
+        'baseline': stats['original'],
+        'optimized': stats['plan'],
+        'speedup': round(stats['original']['p50_ms'] / stats['plan']['p50_ms'], 2),
+        'identical': outputs['original'] == outputs['plan'],
+    }
+
+
+# name -> fn(hvym_module, num_traits, repeats); each returns baseline/optimized
+# stats plus whether both paths produced identical output.
+MICRO_BENCHMARKS = {
+    'records': bench_record_layer,
+    'schema': bench_schema_validation,
+    'json': bench_json_codec,
+    'interactables': bench_interactable_columns,
+    'render': bench_render_plan,
+}
+
+
+def run_micro_benchmarks(hvym, names=None, num_traits=10000, repeats=5):
+    return {name: MICRO_BENCHMARKS[name](hvym, num_traits, repeats) for name in (names or MICRO_BENCHMARKS)}
+
+
+def format_micro_table(results):
+    lines = [f"{'benchmark':<16}{'traits':>8}{'baseline':>11}{'optimized':>11}{'speedup':>9}  identical"]
+    for name, r in results.items():
+        lines.append(f"{name:<16}{r['traits']:>8}{r['baseline']['p50_ms']:>11.1f}{r['optimized']['p50_ms']:>11.1f}"
+                     f"{r['speedup']:>8.2f}x  {r['identical']}")
+    return '\n'.join(lines)
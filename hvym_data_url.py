@@ -0,0 +1,360 @@
+"""
+Streaming data-URL encoder for HeavyMeta CLI
+
+`png-to-data-url` used to read a whole image and base64 it into one string,
+and `svg-to-data-url` re-serialized and encoded the SVG several times over.
+Here a file is read into one reusable buffer and encoded chunk by chunk.
+Base64 maps every 3 input bytes to 4 output characters, so chunks whose size
+is a multiple of 3 encode independently and their outputs simply
+concatenate. Peak memory is a few chunk sizes, whatever the size of the
+image.
+
+SVGs still go through ElementTree for the namespace cleanup the CLI has
+always done; only the encoding stage streams.
+
+DataUrlCache keeps encoded URLs in SQLite under CLI_PATH, keyed by a hash of
+the file's content and MIME type, so `hvym assets encode` only hashes files
+it has already encoded. It is an LRU bounded by the total size of the stored
+URLs.
+
+With optimize, images are shrunk before encoding: PNGs are re-encoded
+losslessly with Pillow (to a palette when they use 256 colours or fewer,
+and kept only if smaller and pixel-identical), and SVGs lose comments,
+editor metadata, insignificant whitespace and excess decimal places. The
+optimized bytes are built in memory, not streamed. Stdlib only, plus
+Pillow for PNGs when it is installed.
+"""
+
+import io
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import binascii
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+# 192 KiB of input, 256 KiB of base64 per chunk
+CHUNK_SIZE = 3 << 16
+CACHE_FILE = 'data_url_cache.sqlite'
+DEFAULT_MAX_BYTES = 256 << 20
+# Bump when the encoded output for the same input changes
+CACHE_VERSION = b'1'
+# Decimal places kept in SVG geometry when optimizing
+SVG_PRECISION = 3
+SVG_NS = 'http://www.w3.org/2000/svg'
+# Editor namespaces whose elements and attributes an optimized SVG drops
+SVG_EDITOR_NS = (
+    'http://www.inkscape.org/namespaces/inkscape',
+    'http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd',
+    'http://ns.adobe.com/AdobeIllustrator/10.0/',
+    'http://www.bohemiancoding.com/sketch/ns',
+    'http://purl.org/dc/elements/1.1/',
+    'http://creativecommons.org/ns#',
+    'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+)
+# Attributes whose numbers are rounded to SVG_PRECISION
+SVG_GEOMETRY_ATTRS = frozenset((
+    'd', 'points', 'transform', 'viewBox', 'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy',
+    'r', 'rx', 'ry', 'fx', 'fy', 'width', 'height', 'stroke-width', 'offset',
+))
+# Elements whose text is content, so their whitespace is kept
+SVG_TEXT_TAGS = frozenset(('text', 'tspan', 'textPath', 'style', 'script', 'title', 'desc'))
+_NUMBER = re.compile(r'-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?')
+MIME_TYPES = {
+    '.png': 'image/png',
+    '.svg': 'image/svg+xml',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+def mime_type(path):
+    """The MIME type for path's extension; ValueError for unsupported files."""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext not in MIME_TYPES:
+        raise ValueError(f'{path}: unsupported image type {ext or "(none)"}')
+    return MIME_TYPES[ext]
+
+
+def svg_bytes(path):
+    """The SVG at path re-serialized without its xmlns attributes, as the CLI has always embedded it."""
+    root = ET.parse(path).getroot()
+    if len(root.attrib) > 0:
+        if 'xmlns' in root.attrib:
+            root.attrib.pop('xmlns')
+            for child in root:
+                child.attrib.pop('xmlns', None)
+    return ET.tostring(root, encoding='unicode').encode('utf-8')
+
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _namespace(tag):
+    return tag[1:].split('}', 1)[0] if isinstance(tag, str) and tag.startswith('{') else ''
+
+
+def _round_number(match, precision):
+    text = match.group(0)
+    if '.' not in text and 'e' not in text.lower():
+        return text
+    value = round(float(text), precision)
+    out = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    if out in ('-0', ''):
+        out = '0'
+    if out.startswith('0.'):
+        out = out[1:]
+    elif out.startswith('-0.'):
+        out = '-' + out[2:]
+    return out
+
+
+def _compact_path(value):
+    # One space between numbers, none around commands or before a minus sign
+    value = re.sub(r'[\s,]+', ' ', value)
+    value = re.sub(r' ?([A-DF-Za-df-z]) ?', r'\1', value)
+    return value.replace(' -', '-')
+
+
+def minify_svg(path, precision=SVG_PRECISION):
+    """The SVG at path without comments, editor metadata, extra whitespace and excess decimals."""
+    # ElementTree drops comments and processing instructions while parsing
+    root = ET.parse(path).getroot()
+    parents = [root]
+    while parents:
+        parent = parents.pop()
+        for child in list(parent):
+            if _namespace(child.tag) in SVG_EDITOR_NS or _local(child.tag) == 'metadata':
+                parent.remove(child)
+                continue
+            parents.append(child)
+        for name in list(parent.attrib):
+            if _namespace(name) in SVG_EDITOR_NS:
+                del parent.attrib[name]
+            elif _local(name) in SVG_GEOMETRY_ATTRS:
+                value = _NUMBER.sub(lambda m: _round_number(m, precision), parent.attrib[name]).strip()
+                if _local(name) in ('d', 'points'):
+                    value = _compact_path(value)
+                parent.attrib[name] = value
+        if _local(parent.tag) not in SVG_TEXT_TAGS:
+            if parent.text is not None and not parent.text.strip():
+                parent.text = None
+            for child in parent:
+                if child.tail is not None and not child.tail.strip():
+                    child.tail = None
+    # Write SVG elements unprefixed under a default namespace instead of the
+    # ns0: prefix ElementTree would give them
+    if _namespace(root.tag) == SVG_NS:
+        for element in root.iter():
+            if _namespace(element.tag) == SVG_NS:
+                element.tag = _local(element.tag)
+        root.set('xmlns', SVG_NS)
+    return ET.tostring(root, encoding='unicode').encode('utf-8')
+
+
+def _rgba_bytes(image):
+    return image.convert('RGBA').tobytes()
+
+
+def optimize_png(data):
+    """Losslessly re-encode PNG data, returning it unchanged unless the result is smaller.
+
+    Images with at most 256 distinct colours become palette PNGs (with
+    per-entry alpha); others are re-saved with the best zlib settings. A
+    candidate is only used when it decodes to exactly the original pixels.
+    An ICC profile is kept, but Pillow does not write gAMA or sRGB chunks,
+    so an optimized PNG loses them and viewers that honour gamma may show
+    it slightly differently.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    with Image.open(io.BytesIO(data)) as image:
+        if image.format != 'PNG' or image.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+            return data
+        image.load()
+        icc_profile = image.info.get('icc_profile')
+        reference = _rgba_bytes(image)
+        candidates = [image]
+        if image.mode in ('RGB', 'RGBA', 'LA'):
+            rgba = image.convert('RGBA')
+            colors = rgba.getcolors(256)
+            if colors is not None:
+                palette = [color for _, color in colors]
+                index = {color: i for i, color in enumerate(palette)}
+                paletted = Image.new('P', rgba.size)
+                paletted.putdata([index[pixel] for pixel in rgba.getdata()])
+                paletted.putpalette([channel for color in palette for channel in color[:3]])
+                if any(color[3] != 255 for color in palette):
+                    paletted.info['transparency'] = bytes(color[3] for color in palette)
+                candidates.insert(0, paletted)
+
+        best = data
+        for candidate in candidates:
+            out = io.BytesIO()
+            options = {'optimize': True}
+            if 'transparency' in candidate.info:
+                options['transparency'] = candidate.info['transparency']
+            if icc_profile:
+                options['icc_profile'] = icc_profile
+            candidate.save(out, 'PNG', **options)
+            encoded = out.getvalue()
+            if len(encoded) >= len(best):
+                continue
+            with Image.open(io.BytesIO(encoded)) as check:
+                if _rgba_bytes(check) == reference:
+                    best = encoded
+        return best
+
+
+def optimized_bytes(path, mime=None):
+    """The bytes of path after optimize_png or minify_svg (other types are read as is)."""
+    mime = mime or mime_type(path)
+    if mime == 'image/svg+xml':
+        return minify_svg(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    return optimize_png(data) if mime == 'image/png' else data
+
+
+def decoded_size(url):
+    """The number of bytes encoded in a base64 data URL (str or bytes)."""
+    if isinstance(url, str):
+        url = url.encode('ascii')
+    payload = url[url.index(b',') + 1:]
+    return len(payload) * 3 // 4 - payload[-2:].count(b'=')
+
+
+def _encode_buffer(data, chunk_size):
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield binascii.b2a_base64(view[start:start + chunk_size], newline=False)
+
+
+def _encode_file(path, chunk_size):
+    view = memoryview(bytearray(chunk_size))
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            # Fill the whole chunk: a short read mid-file would leave padding
+            # in the middle of the output.
+            filled = 0
+            while filled < chunk_size:
+                n = f.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            if filled:
+                yield binascii.b2a_base64(view[:filled], newline=False)
+            if filled < chunk_size:
+                return
+
+
+def iter_data_url(path, mime=None, chunk_size=CHUNK_SIZE, optimize=False):
+    """Yield the data URL of the image at path as ASCII byte chunks."""
+    if chunk_size <= 0 or chunk_size % 3:
+        raise ValueError('chunk_size must be a positive multiple of 3')
+    mime = mime or mime_type(path)
+    yield f'data:{mime};base64,'.encode('ascii')
+    if optimize:
+        yield from _encode_buffer(optimized_bytes(path, mime), chunk_size)
+    elif mime == 'image/svg+xml':
+        yield from _encode_buffer(svg_bytes(path), chunk_size)
+    else:
+        yield from _encode_file(path, chunk_size)
+
+
+def write_data_url(path, out, mime=None, chunk_size=CHUNK_SIZE, optimize=False):
+    """Write the data URL of path to the binary stream out; return the bytes written."""
+    written = 0
+    for chunk in iter_data_url(path, mime, chunk_size, optimize):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def data_url(path, mime=None, optimize=False):
+    """The data URL of path as one string."""
+    return b''.join(iter_data_url(path, mime, optimize=optimize)).decode('ascii')
+
+
+def cache_path(cli_path):
+    return Path(cli_path) / CACHE_FILE
+
+
+def content_key(path, mime=None, variant=''):
+    """Cache key for the data URL of path: a hash of its bytes, MIME type and encoding variant."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(CACHE_VERSION + b'\0' + (mime or mime_type(path)).encode('ascii') + b'\0'
+                  + variant.encode('utf-8') + b'\0')
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+class DataUrlCache:
+    """SQLite-backed LRU of encoded data URLs, bounded by their total size in bytes."""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=10)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS urls (key BLOB PRIMARY KEY, url BLOB NOT NULL, '
+                         'size INTEGER NOT NULL, used REAL NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS urls_used ON urls (used)')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def get(self, keys):
+        """Return {key: url bytes} for the cached keys, marking them as used."""
+        found = {}
+        for key in set(keys):
+            row = self._db.execute('SELECT url FROM urls WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                found[key] = row[0]
+        if found:
+            now = time.time()
+            with self._db:
+                self._db.executemany('UPDATE urls SET used = ? WHERE key = ?', ((now, k) for k in found))
+        return found
+
+    def put(self, items):
+        """Store {key: url bytes}, then evict the least recently used URLs over max_bytes."""
+        now = time.time()
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?)',
+                                 ((k, v, len(v), now) for k, v in items.items()))
+            total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM urls').fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                evict = []
+                for key, size in self._db.execute('SELECT key, size FROM urls ORDER BY used'):
+                    if excess <= 0:
+                        break
+                    evict.append((key,))
+                    excess -= size
+                self._db.executemany('DELETE FROM urls WHERE key = ?', evict)
+
+    def clear(self):
+        with self._db:
+            self._db.execute('DELETE FROM urls')
+
+    def stats(self):
+        count, total = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM urls').fetchone()
+        return {'urls': count, 'bytes': total}
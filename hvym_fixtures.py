@@ -0,0 +1,457 @@
+"""
+Offline Fixtures for HeavyMeta CLI
+
+Stand-ins for the external services the CLI talks to, so the Docker, Pinggy
+and Friendbot paths can be benchmarked and regression-tested on an isolated
+box:
+
+- FakeDocker:          a `docker` executable placed first on PATH
+- FakeDockerEngine:    a Docker Engine API served on a unix socket (DOCKER_HOST)
+- FakePinggyDebugger:  the Pinggy web debugger normally on localhost:4300
+- FakeFriendbot:       the Horizon testnet Friendbot endpoint
+
+Every fixture takes a FaultPlan for latency and failure injection. Failures
+are drawn from a seeded RNG indexed by call number, so a given plan fails the
+same calls on every run.
+"""
+
+import os
+import abc
+import sys
+import json
+import time
+import random
+import shutil
+import socket
+import platform
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_DAPP = 'pintheon-testnet-linux-amd64'
+DEFAULT_IMAGES = [f'metavinci/{DEFAULT_DAPP}:latest']
+
+
+class FaultPlan:
+    """Latency and failure injection settings shared by all fixtures.
+
+    :param latency_ms: Fixed delay added to every call
+    :param jitter_ms: Extra uniform random delay in [0, jitter_ms]
+    :param failure_rate: Probability in [0, 1] that a call fails
+    :param fail_calls: Explicit 1-based call numbers that always fail
+    :param seed: Seed for the per-call RNG
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, failure_rate=0.0, fail_calls=(), seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.fail_calls = tuple(fail_calls)
+        self.seed = seed
+
+    def to_dict(self):
+        return {
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'failure_rate': self.failure_rate,
+            'fail_calls': list(self.fail_calls),
+            'seed': self.seed,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**(data or {}))
+
+    def apply(self, call_number):
+        """Sleep for this call's latency and return True if it must fail."""
+        rng = random.Random(f'{self.seed}:{call_number}')
+        delay = self.latency_ms + (rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000.0)
+        if call_number in self.fail_calls:
+            return True
+        return self.failure_rate > 0 and rng.random() < self.failure_rate
+
+
+class _CallCounter:
+    """Thread-safe call counter plus a bounded log of served calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.failures = 0
+        self.calls = []
+
+    def next(self, description):
+        with self._lock:
+            self.count += 1
+            self.calls.append(description)
+            return self.count
+
+    def failed(self):
+        with self._lock:
+            self.failures += 1
+
+
+# === DOCKER CLI ===
+
+# The fake CLI is a standalone script: it runs under the interpreter that
+# created it and keeps its state (containers, call counter) in a JSON file
+# next to it, so every invocation sees the previous ones.
+_FAKE_DOCKER_SCRIPT = r'''
+import sys, os, json, time, random
+
+STATE = __STATE_PATH__
+
+def load():
+    with open(STATE, 'r') as f:
+        return json.load(f)
+
+def save(state):
+    tmp = STATE + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp, STATE)
+
+state = load()
+state['calls'] += 1
+call = state['calls']
+args = sys.argv[1:]
+state['log'].append(args)
+save(state)
+
+plan = state['fault_plan']
+rng = random.Random('%s:%s' % (plan['seed'], call))
+delay = plan['latency_ms'] + (rng.uniform(0, plan['jitter_ms']) if plan['jitter_ms'] else 0)
+if delay:
+    time.sleep(delay / 1000.0)
+if call in plan['fail_calls'] or (plan['failure_rate'] > 0 and rng.random() < plan['failure_rate']):
+    sys.stderr.write('Cannot connect to the Docker daemon (injected failure)\n')
+    sys.exit(1)
+
+def option(name):
+    return args[args.index(name) + 1] if name in args and args.index(name) + 1 < len(args) else None
+
+cmd = args[0] if args else ''
+if cmd == '--version':
+    print('Docker version %s, build hvym-fixture' % state['version'])
+elif cmd == 'images':
+    print('\n'.join(state['images']))
+elif cmd == 'ps':
+    names = list(state['containers'])
+    if '-a' not in args:
+        names = [n for n in names if state['containers'][n]['running']]
+    flt = option('--filter')
+    if flt and flt.startswith('name='):
+        wanted = flt[len('name='):].strip('^$')
+        names = [n for n in names if n == wanted]
+    print('\n'.join(names))
+elif cmd in ('start', 'stop'):
+    name = args[-1]
+    if name not in state['containers']:
+        sys.stderr.write('Error: No such container: %s\n' % name)
+        sys.exit(1)
+    state['containers'][name]['running'] = cmd == 'start'
+    save(state)
+    print(name)
+elif cmd in ('run', 'create'):
+    name = option('--name') or 'container_%d' % call
+    state['containers'][name] = {'image': args[-1], 'running': cmd == 'run'}
+    save(state)
+    print('%064x' % call)
+elif cmd == 'pull':
+    if args[-1] not in state['images']:
+        state['images'].append(args[-1])
+        save(state)
+    print('Status: Downloaded newer image for %s' % args[-1])
+else:
+    sys.stderr.write('unknown command: %s\n' % cmd)
+    sys.exit(1)
+'''
+
+
+class FakeDocker:
+    """A `docker` executable answering the subcommands the CLI uses.
+
+    Call `install()` then prepend `bin_dir` to PATH. State lives in
+    `bin_dir/docker_state.json` and can be inspected through `state()`.
+    """
+
+    def __init__(self, bin_dir, images=None, containers=None, version='24.0.7', fault_plan=None):
+        self.bin_dir = Path(bin_dir)
+        self.state_path = self.bin_dir / 'docker_state.json'
+        self._initial = {
+            'version': version,
+            'images': list(DEFAULT_IMAGES if images is None else images),
+            'containers': {name: {'image': DEFAULT_IMAGES[0], 'running': False}
+                           for name in (['pintheon'] if containers is None else containers)},
+            'fault_plan': (fault_plan or FaultPlan()).to_dict(),
+            'calls': 0,
+            'log': [],
+        }
+
+    def install(self):
+        self.bin_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(self._initial))
+        script = self.bin_dir / 'fake_docker.py'
+        script.write_text(_FAKE_DOCKER_SCRIPT.replace('__STATE_PATH__', repr(str(self.state_path))))
+        if platform.system().lower() == 'windows':
+            (self.bin_dir / 'docker.cmd').write_text(f'@"{sys.executable}" "{script}" %*\r\n')
+        else:
+            launcher = self.bin_dir / 'docker'
+            launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+            os.chmod(launcher, 0o755)
+        return self
+
+    def state(self):
+        return json.loads(self.state_path.read_text())
+
+    def set_fault_plan(self, fault_plan):
+        state = self.state()
+        state['fault_plan'] = fault_plan.to_dict()
+        self.state_path.write_text(json.dumps(state))
+
+
+# === HTTP FIXTURES ===
+
+class _FixtureHTTPServer(abc.ABC):
+    """Threaded HTTP server wrapper with fault injection and call accounting."""
+
+    server_class = ThreadingHTTPServer
+
+    def __init__(self, address, fault_plan=None):
+        self.fault_plan = fault_plan or FaultPlan()
+        self.counter = _CallCounter()
+        self._server = self.server_class(address, self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @abc.abstractmethod
+    def handle(self, method, path, query, body):
+        """Return (status, content_type, payload bytes) for a request."""
+
+    def failure_response(self):
+        return 500, 'application/json', b'{"message": "injected failure"}'
+
+    def _make_handler(self):
+        fixture = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _dispatch(self, method):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                url = urlparse(self.path)
+                call = fixture.counter.next(f'{method} {self.path}')
+                if fixture.fault_plan.apply(call):
+                    fixture.counter.failed()
+                    status, content_type, payload = fixture.failure_response()
+                else:
+                    status, content_type, payload = fixture.handle(method, url.path, parse_qs(url.query), body)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if method != 'HEAD':
+                    self.wfile.write(payload)
+
+            def do_GET(self):
+                self._dispatch('GET')
+
+            def do_HEAD(self):
+                self._dispatch('HEAD')
+
+            def do_POST(self):
+                self._dispatch('POST')
+
+            def log_message(self, *args):
+                pass
+
+            def address_string(self):
+                # Unix socket peers have no (host, port) pair.
+                return 'fixture'
+
+        return _Handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class FakePinggyDebugger(_FixtureHTTPServer):
+    """Stand-in for the Pinggy web debugger the CLI polls to detect an open tunnel.
+
+    Set `tunnel_open = False` to answer like a closed tunnel. Binding port 4300
+    makes the stand-in visible to unpatched callers; the default (0) picks a
+    free port, exported to the CLI through HVYM_PINGGY_DEBUGGER_URL.
+    """
+
+    def __init__(self, port=0, tunnel_open=True, fault_plan=None):
+        super().__init__(('127.0.0.1', port), fault_plan)
+        self.tunnel_open = tunnel_open
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def handle(self, method, path, query, body):
+        if self.tunnel_open:
+            return 200, 'text/html', b'<html><body>pinggy debugger</body></html>'
+        return 503, 'text/plain', b'tunnel closed'
+
+
+class FakeFriendbot(_FixtureHTTPServer):
+    """Stand-in for Horizon testnet Friendbot (GET /friendbot?addr=G...).
+
+    The first request for an address answers 200, repeats answer 400 the way
+    Friendbot does for already funded accounts. Exported through
+    HVYM_FRIENDBOT_URL.
+    """
+
+    def __init__(self, port=0, fault_plan=None):
+        super().__init__(('127.0.0.1', port), fault_plan)
+        self.funded = set()
+        self._lock = threading.Lock()
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}/friendbot/'
+
+    def handle(self, method, path, query, body):
+        addr = (query.get('addr') or [''])[0]
+        if not path.rstrip('/').endswith('friendbot') or not addr:
+            return 400, 'application/json', b'{"detail": "missing addr"}'
+        with self._lock:
+            already = addr in self.funded
+            self.funded.add(addr)
+        if already:
+            return 400, 'application/json', json.dumps({'detail': 'createAccountAlreadyExist'}).encode()
+        return 200, 'application/json', json.dumps({'hash': '%064x' % abs(hash(addr)), 'successful': True}).encode()
+
+
+if hasattr(socket, 'AF_UNIX'):
+    import socketserver
+
+    class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def server_bind(self):
+            socketserver.UnixStreamServer.server_bind(self)
+            self.server_name = 'fixture'
+            self.server_port = 0
+else:
+    _UnixHTTPServer = None
+
+
+class FakeDockerEngine(_FixtureHTTPServer):
+    """Minimal Docker Engine API on a unix socket.
+
+    Point a real docker CLI (or SDK) at it with DOCKER_HOST=unix://<socket_path>.
+    Implements ping, version, image and container listing, and container
+    start/stop; anything else answers 404.
+    """
+
+    server_class = _UnixHTTPServer
+
+    def __init__(self, socket_path, images=None, containers=None, fault_plan=None):
+        if _UnixHTTPServer is None:
+            raise RuntimeError('FakeDockerEngine needs unix domain sockets.')
+        self.socket_path = str(socket_path)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.images = list(DEFAULT_IMAGES if images is None else images)
+        self.containers = {name: {'image': DEFAULT_IMAGES[0], 'running': False}
+                           for name in (['pintheon'] if containers is None else containers)}
+        super().__init__(self.socket_path, fault_plan)
+        self.docker_host = f'unix://{self.socket_path}'
+
+    def stop(self):
+        super().stop()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def handle(self, method, path, query, body):
+        parts = [p for p in path.split('/') if p]
+        if parts and parts[0].startswith('v1.'):
+            parts = parts[1:]
+        route = '/'.join(parts)
+
+        if route == '_ping':
+            return 200, 'text/plain', b'OK'
+        if route == 'version':
+            return 200, 'application/json', json.dumps({'Version': '24.0.7', 'ApiVersion': '1.43'}).encode()
+        if route == 'images/json':
+            images = [{'Id': 'sha256:%064x' % i, 'RepoTags': [tag]} for i, tag in enumerate(self.images)]
+            return 200, 'application/json', json.dumps(images).encode()
+        if route == 'containers/json':
+            show_all = (query.get('all') or ['0'])[0] in ('1', 'true')
+            listed = [{'Id': '%064x' % i, 'Names': [f'/{name}'], 'Image': c['image'],
+                       'State': 'running' if c['running'] else 'exited'}
+                      for i, (name, c) in enumerate(self.containers.items())
+                      if show_all or c['running']]
+            return 200, 'application/json', json.dumps(listed).encode()
+        if method == 'POST' and len(parts) == 3 and parts[0] == 'containers' and parts[2] in ('start', 'stop'):
+            container = self.containers.get(parts[1])
+            if container is None:
+                return 404, 'application/json', json.dumps({'message': f'No such container: {parts[1]}'}).encode()
+            container['running'] = parts[2] == 'start'
+            return 204, 'application/json', b''
+        return 404, 'application/json', json.dumps({'message': f'page not found: {path}'}).encode()
+
+
+# === COMBINED ENVIRONMENT ===
+
+class FixtureEnvironment:
+    """Isolated HOME plus every stand-in, wired into an environment dict.
+
+    `env` is a copy of os.environ with HOME/USERPROFILE pointing at a temporary
+    home, the fake docker first on PATH, and the HVYM_* URL overrides set.
+    The Engine socket is only started where unix sockets exist.
+    """
+
+    def __init__(self, root=None, docker_faults=None, engine_faults=None,
+                 tunnel_faults=None, friendbot_faults=None, tunnel_open=True):
+        self._owned = root is None
+        self.root = Path(root or tempfile.mkdtemp(prefix='hvym_fixtures_'))
+        self.home = self.root / 'home'
+        self.bin_dir = self.root / 'bin'
+        self.docker = FakeDocker(self.bin_dir, fault_plan=docker_faults)
+        self.engine = None
+        self.pinggy = FakePinggyDebugger(tunnel_open=tunnel_open, fault_plan=tunnel_faults)
+        self.friendbot = FakeFriendbot(fault_plan=friendbot_faults)
+        self._engine_faults = engine_faults
+        self.env = None
+
+    def __enter__(self):
+        self.home.mkdir(parents=True, exist_ok=True)
+        self.docker.install()
+        self.pinggy.start()
+        self.friendbot.start()
+        if _UnixHTTPServer is not None:
+            self.engine = FakeDockerEngine(self.root / 'docker.sock', fault_plan=self._engine_faults).start()
+
+        env = os.environ.copy()
+        env['HOME'] = str(self.home)
+        env['USERPROFILE'] = str(self.home)
+        env['PATH'] = str(self.bin_dir) + os.pathsep + env.get('PATH', '')
+        env['HVYM_PINGGY_DEBUGGER_URL'] = self.pinggy.url
+        env['HVYM_FRIENDBOT_URL'] = self.friendbot.url
+        if self.engine is not None:
+            env['DOCKER_HOST'] = self.engine.docker_host
+        self.env = env
+        return self
+
+    def __exit__(self, *exc):
+        for fixture in (self.engine, self.friendbot, self.pinggy):
+            if fixture is not None:
+                fixture.stop()
+        if self._owned:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,242 @@
+"""
+Lightweight glTF/GLB metadata reader for HeavyMeta CLI
+
+`GLTF2().load()` parses the whole asset and reads the BIN chunk, often
+hundreds of MB of meshes and textures, when the CLI only needs the JSON
+(e.g. extensions['HVYM_nft_data']). A GLB is laid out as
+
+    header   magic 'glTF' | version | total length          (3 x uint32 LE)
+    chunk 0  length | type 'JSON' | JSON, space padded to 4 bytes
+    chunk 1  length | type 'BIN\\0' | binary buffer          (optional)
+
+so this module reads the 20 bytes of header and chunk header, then only the
+JSON chunk. Large JSON chunks are mapped rather than read, so decoders that
+accept buffers (orjson, msgspec) parse them without a copy. `.gltf` files
+are plain JSON and are decoded directly. Stdlib only.
+"""
+
+import os
+import json
+import mmap
+import struct
+from collections import namedtuple
+
+
+GLB_MAGIC = b'glTF'
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+HEADER = struct.Struct('<4sII')
+CHUNK_HEADER = struct.Struct('<II')
+# JSON chunks at least this large are mmapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
+# Byte offsets of a GLB's parts; bin_offset/bin_length are None without a BIN chunk.
+GLBLayout = namedtuple('GLBLayout', 'version length json_offset json_length bin_offset bin_length')
+
+
+class GLBError(ValueError):
+    """Raised for files that are not well-formed glTF/GLB."""
+
+
+def is_glb(path):
+    with open(path, 'rb') as f:
+        return f.read(4) == GLB_MAGIC
+
+
+def read_layout(f):
+    """Return the GLBLayout of the open binary file f, reading only chunk headers."""
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    header = f.read(HEADER.size + CHUNK_HEADER.size)
+    if len(header) < HEADER.size + CHUNK_HEADER.size:
+        raise GLBError('file is too short for a GLB header')
+    magic, version, length = HEADER.unpack_from(header)
+    if magic != GLB_MAGIC:
+        raise GLBError('not a GLB file (bad magic)')
+    if version != 2:
+        raise GLBError(f'unsupported GLB version {version}')
+    if length > size:
+        raise GLBError(f'GLB header claims {length} bytes but the file has {size}')
+    json_length, chunk_type = CHUNK_HEADER.unpack_from(header, HEADER.size)
+    if chunk_type != CHUNK_JSON:
+        raise GLBError('first GLB chunk is not JSON')
+    json_offset = HEADER.size + CHUNK_HEADER.size
+    if json_offset + json_length > length:
+        raise GLBError('JSON chunk runs past the end of the file')
+
+    bin_offset = bin_length = None
+    next_chunk = json_offset + json_length
+    if next_chunk + CHUNK_HEADER.size <= length:
+        f.seek(next_chunk)
+        chunk_length, chunk_type = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+        if chunk_type == CHUNK_BIN:
+            if next_chunk + CHUNK_HEADER.size + chunk_length > length:
+                raise GLBError('BIN chunk runs past the end of the file')
+            bin_offset, bin_length = next_chunk + CHUNK_HEADER.size, chunk_length
+    return GLBLayout(version, length, json_offset, json_length, bin_offset, bin_length)
+
+
+def _decode(buffer, loads):
+    try:
+        return loads(buffer)
+    except TypeError:
+        # Decoders such as the stdlib json want bytes, not a memoryview
+        return loads(bytes(buffer))
+
+
+def read_gltf_json(path, loads=json.loads):
+    """Return the decoded glTF JSON of a .glb or .gltf file without reading any buffers."""
+    with open(path, 'rb') as f:
+        if f.read(4) != GLB_MAGIC:
+            f.seek(0)
+            return loads(f.read())
+        layout = read_layout(f)
+        if layout.json_length < MMAP_THRESHOLD:
+            f.seek(layout.json_offset)
+            return loads(f.read(layout.json_length))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view, view[layout.json_offset:layout.json_offset + layout.json_length] as chunk:
+                return _decode(chunk, loads)
+
+
+def read_extension(path, name='HVYM_nft_data', loads=json.loads):
+    """Return the top-level extensions[name] of a glTF/GLB file, or None when absent."""
+    doc = read_gltf_json(path, loads)
+    if not isinstance(doc, dict):
+        raise GLBError('glTF JSON is not an object')
+    extensions = doc.get('extensions') or {}
+    if not isinstance(extensions, dict):
+        raise GLBError('glTF extensions is not an object')
+    return extensions.get(name)
+
+
+def _copy_range(src, dst, offset, count):
+    """Append count bytes of src from offset to dst, in the kernel where the OS allows it.
+
+    Uses copy_file_range (which can share extents on CoW filesystems), then
+    sendfile, then a buffered copy. dst must be flushed before the call.
+    """
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    for name in ('copy_file_range', 'sendfile'):
+        call = getattr(os, name, None)
+        if call is None:
+            continue
+        try:
+            while count > 0:
+                if name == 'copy_file_range':
+                    sent = call(src_fd, dst_fd, count, offset)
+                else:
+                    sent = call(dst_fd, src_fd, offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+        except OSError:
+            # Not supported for this pair of files (e.g. cross-device, or
+            # macOS sendfile, which needs a socket); carry on below.
+            continue
+        if count == 0:
+            return
+    src.seek(offset)
+    while count > 0:
+        block = src.read(min(count, 1 << 20))
+        if not block:
+            raise GLBError('file ended while copying the binary chunk')
+        dst.write(block)
+        count -= len(block)
+
+
+def _write_temp(path, write):
+    """Run write(f) on a new temp file beside path and return the temp file's path."""
+    path = os.path.abspath(path)
+    tmp = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(tmp)
+        raise
+    return tmp
+
+
+def _discard(tmp):
+    try:
+        os.unlink(tmp)
+    except OSError:
+        pass
+
+
+def _commit_temp(tmp, path, mode_from):
+    """Rename tmp over path, keeping the permissions of mode_from."""
+    try:
+        os.chmod(tmp, os.stat(mode_from).st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+
+
+def write_extension(path, name, value, out_path=None, loads=json.loads, dumps=None):
+    """Set the top-level extensions[name] of a glTF/GLB file to value (None removes it).
+
+    For a GLB only the JSON chunk is re-encoded; every chunk after it is
+    copied byte for byte. The result replaces out_path (default: path)
+    atomically. Returns the new file size.
+    """
+    dumps = dumps or (lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+    out_path = out_path or path
+    with open(path, 'rb') as src:
+        glb = src.read(4) == GLB_MAGIC
+        if glb:
+            layout = read_layout(src)
+            src.seek(layout.json_offset)
+            doc = loads(src.read(layout.json_length))
+        else:
+            src.seek(0)
+            doc = loads(src.read())
+        if not isinstance(doc, dict):
+            raise GLBError('glTF JSON is not an object')
+
+        extensions = doc.setdefault('extensions', {})
+        used = doc.setdefault('extensionsUsed', [])
+        if not isinstance(extensions, dict) or not isinstance(used, list):
+            raise GLBError('glTF extensions is not an object or extensionsUsed is not an array')
+        if value is None:
+            extensions.pop(name, None)
+            if name in used:
+                used.remove(name)
+        else:
+            extensions[name] = value
+            if name not in used:
+                used.append(name)
+        for key in ('extensions', 'extensionsUsed'):
+            if not doc[key]:
+                del doc[key]
+        encoded = dumps(doc)
+
+        if glb:
+            # Chunks must start on 4-byte boundaries; JSON is padded with spaces
+            encoded += b' ' * (-len(encoded) % 4)
+            tail_offset = layout.json_offset + layout.json_length
+            tail_length = layout.length - tail_offset
+            total = HEADER.size + CHUNK_HEADER.size + len(encoded) + tail_length
+
+            def write(f):
+                f.write(HEADER.pack(GLB_MAGIC, layout.version, total))
+                f.write(CHUNK_HEADER.pack(len(encoded), CHUNK_JSON))
+                f.write(encoded)
+                f.flush()
+                _copy_range(src, f, tail_offset, tail_length)
+        else:
+            total = len(encoded)
+
+            def write(f):
+                f.write(encoded)
+
+        tmp = _write_temp(out_path, write)
+    # The source is closed first: Windows cannot replace an open file
+    _commit_temp(tmp, out_path, path)
+    return total
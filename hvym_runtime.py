@@ -0,0 +1,223 @@
+"""
+Persistent Runtime Cache for HeavyMeta CLI onedir builds
+
+A onefile build unpacks its whole archive (Qt included) into a fresh _MEI
+temp dir on every call. The onedir build ships the same tree as an archive
+instead; this module unpacks it once into
+
+    <CLI_PATH>/runtime/<build_hash>/
+
+and keeps a `current.json` pointer to the active version, so callers (the GUI,
+Blender) run the already unpacked executable directly. Installs are atomic
+(unpack to a temp dir, then rename) and older versions are pruned.
+
+Stdlib only: installers can run it as `python hvym_runtime.py install <archive>`.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tarfile
+import zipfile
+import argparse
+from pathlib import Path
+
+
+BUILD_HASH_FILE = 'BUILD_HASH'
+POINTER_FILE = 'current.json'
+COMPLETE_MARKER = '.complete'
+DEFAULT_KEEP = 2
+
+
+def compute_build_hash(paths, extra=()):
+    """Hash the contents of files/directories plus extra strings into a short build id."""
+    digest = hashlib.sha256()
+    for item in extra:
+        digest.update(str(item).encode('utf-8'))
+        digest.update(b'\0')
+    for root in sorted(Path(p) for p in paths):
+        if not root.exists():
+            continue
+        files = [root] if root.is_file() else sorted(p for p in root.rglob('*') if p.is_file())
+        for path in files:
+            if '__pycache__' in path.parts:
+                continue
+            # The path inside root, so moving or swapping files changes the hash
+            name = root.name if path == root else path.relative_to(root).as_posix()
+            digest.update(f'{name}\0{path.stat().st_size}\0'.encode('utf-8'))
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def executable_name():
+    return 'hvym.exe' if os.name == 'nt' else 'hvym'
+
+
+def runtime_root(cli_path):
+    return Path(cli_path) / 'runtime'
+
+
+def _read_archive_hash(archive):
+    archive = str(archive)
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            for name in zf.namelist():
+                if os.path.normpath(name) == BUILD_HASH_FILE:
+                    return zf.read(name).decode('utf-8').strip()
+    else:
+        with tarfile.open(archive) as tf:
+            for member in tf:
+                if os.path.normpath(member.name) == BUILD_HASH_FILE and member.isfile():
+                    return tf.extractfile(member).read().decode('utf-8').strip()
+    raise ValueError(f'{archive} has no {BUILD_HASH_FILE} entry')
+
+
+def _extract(archive, dest):
+    archive = str(archive)
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(dest)
+        return
+    with tarfile.open(archive) as tf:
+        if hasattr(tarfile, 'data_filter'):
+            tf.extractall(dest, filter='data')
+        else:
+            tf.extractall(dest)
+
+
+def _write_pointer(root, build_hash):
+    pointer = {
+        'build_hash': build_hash,
+        'executable': str(root / build_hash / executable_name()),
+        'installed': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    tmp = root / f'{POINTER_FILE}.{os.getpid()}.tmp'
+    tmp.write_text(json.dumps(pointer, indent=2))
+    os.replace(tmp, root / POINTER_FILE)
+    return pointer
+
+
+def current(root):
+    """Return the active pointer dict, or None if no complete runtime is installed."""
+    root = Path(root)
+    try:
+        pointer = json.loads((root / POINTER_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if not (root / pointer.get('build_hash', '') / COMPLETE_MARKER).exists():
+        return None
+    return pointer
+
+
+def installed_versions(root):
+    root = Path(root)
+    if not root.exists():
+        return []
+    return [p for p in root.iterdir() if p.is_dir() and (p / COMPLETE_MARKER).exists()]
+
+
+def prune(root, keep=DEFAULT_KEEP):
+    """Remove all but the `keep` most recent versions; the active one is always kept."""
+    root = Path(root)
+    active = (current(root) or {}).get('build_hash')
+    versions = sorted(installed_versions(root), key=lambda p: (p / COMPLETE_MARKER).stat().st_mtime, reverse=True)
+    kept = {active} if active else set()
+    removed = []
+    for path in versions:
+        if path.name in kept:
+            continue
+        if len(kept) < keep:
+            kept.add(path.name)
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed.append(path.name)
+    # Leftovers of interrupted installs
+    for stale in root.glob('.tmp-*'):
+        if time.time() - stale.stat().st_mtime > 3600:
+            shutil.rmtree(stale, ignore_errors=True)
+    return removed
+
+
+def install(archive, root, build_hash=None, keep=DEFAULT_KEEP):
+    """Unpack a onedir archive into root/<build_hash> unless it is already there.
+
+    Returns the pointer dict of the now active runtime.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    try:
+        build_hash = build_hash or _read_archive_hash(archive)
+    except (tarfile.TarError, zipfile.BadZipFile) as e:
+        raise ValueError(f'{archive} is not a valid runtime archive: {e}')
+    target = root / build_hash
+
+    if not (target / COMPLETE_MARKER).exists():
+        staging = root / f'.tmp-{build_hash}-{os.getpid()}'
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        try:
+            try:
+                _extract(archive, staging)
+            except (tarfile.TarError, zipfile.BadZipFile) as e:
+                raise ValueError(f'{archive} is not a valid runtime archive: {e}')
+            exe = staging / executable_name()
+            if not exe.exists():
+                raise ValueError(f'{archive} does not contain {executable_name()}')
+            if os.name != 'nt':
+                os.chmod(exe, 0o755)
+            (staging / COMPLETE_MARKER).write_text(build_hash)
+            if target.exists():
+                # Half-written dir from an older, non-atomic attempt
+                shutil.rmtree(target, ignore_errors=True)
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another process finished the same install first
+                if not (target / COMPLETE_MARKER).exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    pointer = _write_pointer(root, build_hash)
+    prune(root, keep)
+    return pointer
+
+
+def _default_root():
+    # Mirrors CLI_PATH in hvym.py without importing it.
+    if os.name == 'nt':
+        base = Path.home() / 'AppData' / 'Local' / 'heavymeta-cli'
+    else:
+        base = Path.home() / '.local' / 'share' / 'heavymeta-cli'
+    return runtime_root(base)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the persistent hvym onedir runtime')
+    parser.add_argument('--root', type=Path, default=None, help='Runtime directory (default: <CLI_PATH>/runtime)')
+    sub = parser.add_subparsers(dest='action', required=True)
+    inst = sub.add_parser('install', help='Unpack a onedir archive and make it current')
+    inst.add_argument('archive')
+    inst.add_argument('--keep', type=int, default=DEFAULT_KEEP)
+    sub.add_parser('path', help='Print the current runtime executable')
+    args = parser.parse_args(argv)
+
+    root = args.root or _default_root()
+    if args.action == 'install':
+        print(install(args.archive, root, keep=args.keep)['executable'])
+        return 0
+    pointer = current(root)
+    if pointer is None:
+        print('No runtime installed', file=sys.stderr)
+        return 1
+    print(pointer['executable'])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
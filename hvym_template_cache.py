@@ -0,0 +1,242 @@
+"""
+Download Cache for HeavyMeta CLI project templates
+
+`_download_unzip` used to read a whole template archive (MODEL_MINTER_ZIP and
+friends) into memory and extract it on every new project. This module keeps
+each archive's extracted tree once, under
+
+    <CLI_PATH>/download_cache/trees/<sha256 of the archive>/
+
+with a small JSON entry per URL recording its ETag, Last-Modified, the
+archive's commit (GitHub stores it as the zip comment) and its tree. A fetch
+revalidates with If-None-Match / If-Modified-Since, so an unchanged template
+costs one request; a changed one is streamed to disk, hashed on the way, and
+extracted into a new tree. Offline, or when the server cannot be reached,
+the cached tree is served as is.
+
+Project directories are populated from the tree by reflink (copy-on-write,
+where the filesystem supports it), by hardlink when asked for, or by copy.
+
+Stdlib only.
+"""
+
+import os
+import re
+import json
+import time
+import errno
+import shutil
+import hashlib
+import zipfile
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+
+CACHE_DIR = 'download_cache'
+COMPLETE_MARKER = '.complete'
+BLOCK_SIZE = 1 << 20
+DEFAULT_TIMEOUT = 60
+# Linux ioctl that shares a file's extents with another (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+class TemplateCacheError(OSError):
+    """Raised when a template is neither downloadable nor cached."""
+
+
+def cache_root(cli_path):
+    return Path(cli_path) / CACHE_DIR
+
+
+def _url_key(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+
+
+def _commit_of(archive):
+    """The commit id GitHub writes as the zip comment of an archive, or None."""
+    with zipfile.ZipFile(archive) as zf:
+        comment = zf.comment.decode('ascii', 'replace').strip()
+    return comment if re.fullmatch(r'[0-9a-f]{40}', comment) else None
+
+
+class TemplateCache:
+    """Extracted template archives, content addressed, with one entry per URL."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.entries = self.root / 'entries'
+        self.trees = self.root / 'trees'
+        self.entries.mkdir(parents=True, exist_ok=True)
+        self.trees.mkdir(parents=True, exist_ok=True)
+
+    def entry(self, url):
+        """Return the cache entry of url if its tree is complete, else None."""
+        try:
+            entry = json.loads((self.entries / f'{_url_key(url)}.json').read_text())
+        except (OSError, ValueError):
+            return None
+        if not (self.trees / entry.get('sha256', '') / COMPLETE_MARKER).exists():
+            return None
+        return entry
+
+    def _write_entry(self, url, entry):
+        path = self.entries / f'{_url_key(url)}.json'
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(entry, indent=2))
+        os.replace(tmp, path)
+
+    def fetch(self, url, offline=False, timeout=DEFAULT_TIMEOUT):
+        """Return (tree path, status) for url, downloading only what changed.
+
+        status is 'downloaded', 'revalidated' (the server answered 304),
+        'offline' (not asked) or 'stale' (the server could not be reached).
+        """
+        cached = self.entry(url)
+        if offline:
+            if cached is None:
+                raise TemplateCacheError(f'{url} is not in the download cache (offline mode)')
+            return self.trees / cached['sha256'], 'offline'
+
+        request = urllib.request.Request(url)
+        if cached is not None:
+            if cached.get('etag'):
+                request.add_header('If-None-Match', cached['etag'])
+            if cached.get('last_modified'):
+                request.add_header('If-Modified-Since', cached['last_modified'])
+        try:
+            response = urllib.request.urlopen(request, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                cached['checked'] = time.time()
+                self._write_entry(url, cached)
+                return self.trees / cached['sha256'], 'revalidated'
+            if cached is not None and e.code >= 500:
+                return self.trees / cached['sha256'], 'stale'
+            raise TemplateCacheError(f'{url}: HTTP {e.code} {e.reason}')
+        except (urllib.error.URLError, OSError) as e:
+            if cached is not None:
+                return self.trees / cached['sha256'], 'stale'
+            raise TemplateCacheError(f'{url}: {e}')
+
+        with response:
+            tree, commit = self._store(response)
+        entry = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'commit': commit,
+            'sha256': tree.name,
+            'checked': time.time(),
+        }
+        self._write_entry(url, entry)
+        if cached is not None and cached['sha256'] != tree.name:
+            self._release(cached['sha256'])
+        return tree, 'downloaded'
+
+    def _store(self, response):
+        """Stream an archive to disk and extract it into its content-addressed tree."""
+        archive = self.root / f'.tmp-{os.getpid()}.zip'
+        digest = hashlib.sha256()
+        try:
+            with open(archive, 'wb') as f:
+                for block in iter(lambda: response.read(BLOCK_SIZE), b''):
+                    digest.update(block)
+                    f.write(block)
+            tree = self.trees / digest.hexdigest()
+            try:
+                commit = _commit_of(archive)
+            except zipfile.BadZipFile as e:
+                raise TemplateCacheError(f'{response.geturl()} is not a zip archive: {e}')
+            if not (tree / COMPLETE_MARKER).exists():
+                staging = self.root / f'.tmp-{tree.name}-{os.getpid()}'
+                shutil.rmtree(staging, ignore_errors=True)
+                try:
+                    with zipfile.ZipFile(archive) as zf:
+                        zf.extractall(staging)
+                    (staging / COMPLETE_MARKER).write_text(commit or '')
+                    if tree.exists():
+                        # Left over from an interrupted extraction
+                        shutil.rmtree(tree, ignore_errors=True)
+                    try:
+                        os.rename(staging, tree)
+                    except OSError:
+                        # Another process stored the same archive first
+                        if not (tree / COMPLETE_MARKER).exists():
+                            raise
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+        finally:
+            if archive.exists():
+                archive.unlink()
+        return tree, commit
+
+    def _release(self, sha256):
+        """Remove a tree once no entry refers to it."""
+        for path in self.entries.glob('*.json'):
+            try:
+                if json.loads(path.read_text()).get('sha256') == sha256:
+                    return
+            except (OSError, ValueError):
+                continue
+        shutil.rmtree(self.trees / sha256, ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.entries.mkdir(parents=True, exist_ok=True)
+        self.trees.mkdir(parents=True, exist_ok=True)
+
+    def materialize(self, tree, out_path, hardlink=False):
+        """Populate out_path with the files of tree, as extracting the archive there would.
+
+        Files are reflinked where the filesystem supports it and copied
+        otherwise. hardlink=True links them instead, which is cheapest but
+        shares the inode with the cache: only use it for output that is never
+        edited in place. Returns the number of files written.
+        """
+        tree = Path(tree)
+        out_path = Path(out_path)
+        clone = _Cloner(hardlink)
+        count = 0
+        for dirpath, dirnames, filenames in os.walk(tree):
+            rel = Path(dirpath).relative_to(tree)
+            target = out_path / rel
+            target.mkdir(parents=True, exist_ok=True)
+            for name in filenames:
+                if rel == Path('.') and name == COMPLETE_MARKER:
+                    continue
+                clone(Path(dirpath) / name, target / name)
+                count += 1
+        return count
+
+
+class _Cloner:
+    """Copies files by hardlink, reflink or copy, dropping a method once the filesystem refuses it."""
+
+    def __init__(self, hardlink):
+        self.hardlink = hardlink
+        self.reflink = os.name != 'nt'
+
+    def __call__(self, src, dst):
+        if dst.exists() or dst.is_symlink():
+            dst.unlink()
+        if self.hardlink:
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                self.hardlink = False
+        if self.reflink:
+            try:
+                import fcntl
+                with open(src, 'rb') as s, open(dst, 'wb') as d:
+                    fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+                shutil.copymode(src, dst)
+                return
+            except (ImportError, OSError) as e:
+                if isinstance(e, ImportError) or e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV,
+                                                             errno.EINVAL, errno.ENOSYS):
+                    self.reflink = False
+                if dst.exists():
+                    dst.unlink()
+        shutil.copy2(src, dst)
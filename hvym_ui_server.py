@@ -0,0 +1,223 @@
+"""
+Persistent UI Helper for HeavyMeta CLI
+
+Every popup command used to import PyQt5 and qthvym, build the QApplication
+and load the stylesheet before its dialog could appear. `hvym ui-server` does
+that once and then serves popup requests over a localhost socket, so a popup
+costs one round trip and the calling CLI process never loads Qt.
+
+Protocol: one JSON object per line, one request per connection.
+
+    -> {"token": "...", "method": "msg_popup", "args": ["Hello", "/path/icon.png"]}
+    <- {"ok": true, "value": null}
+
+The server writes {"port", "token", "pid"} to <CLI_PATH>/ui_server.json (mode
+0600) and removes it on exit. It exits after `idle_timeout` seconds without a
+request. The client half of this module is stdlib only.
+"""
+
+import os
+import json
+import hmac
+import time
+import socket
+import secrets
+from pathlib import Path
+
+
+STATE_FILE = 'ui_server.json'
+DEFAULT_IDLE_TIMEOUT = 900
+CONNECT_TIMEOUT = 0.25
+
+# HVYMInteraction methods a client may call; each stores its result on .value
+POPUP_METHODS = frozenset({
+    'splash', 'msg_popup', 'options_popup', 'edit_line_popup', 'user_popup',
+    'password_popup', 'user_password_popup', 'copy_line_popup', 'copy_text_popup',
+    'choice_popup', 'file_select_popup', 'folder_select_popup',
+})
+
+
+class UIServerError(Exception):
+    """Raised when the UI server rejects or fails a request."""
+
+
+def state_path(cli_path):
+    return Path(cli_path) / STATE_FILE
+
+
+def read_state(cli_path):
+    try:
+        return json.loads(state_path(cli_path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _send(state, payload, timeout=None):
+    payload = dict(payload, token=state['token'])
+    with socket.create_connection(('127.0.0.1', state['port']), timeout=CONNECT_TIMEOUT) as sock:
+        # Dialogs wait for the user, so only the connect is time limited.
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as reader:
+            line = reader.readline()
+    if not line:
+        raise UIServerError('UI server closed the connection')
+    reply = json.loads(line)
+    if not reply.get('ok'):
+        raise UIServerError(reply.get('error', 'UI server error'))
+    return reply
+
+
+def ping(cli_path):
+    """Return True if a UI server is running and answers with the stored token."""
+    state = read_state(cli_path)
+    if not state:
+        return False
+    try:
+        _send(state, {'method': 'ping'}, timeout=CONNECT_TIMEOUT * 4)
+        return True
+    except (OSError, ValueError, UIServerError):
+        return False
+
+
+def stop(cli_path):
+    """Ask a running UI server to exit. Returns True if one was running."""
+    state = read_state(cli_path)
+    if not state:
+        return False
+    try:
+        _send(state, {'method': 'shutdown'}, timeout=2)
+        return True
+    except (OSError, ValueError, UIServerError):
+        return False
+
+
+class RemoteInteraction:
+    """Drop-in for qthvym.HVYMInteraction that forwards popups to the UI server.
+
+    Like HVYMInteraction, each popup call stores its result on `.value`. A
+    request that fails (server gone, dialog error, bad reply) raises `error`
+    with the reason; it is never retried with another UI.
+    """
+
+    def __init__(self, state, error=UIServerError):
+        self._state = state
+        self._error = error
+        self.value = None
+
+    def __getattr__(self, name):
+        if name not in POPUP_METHODS:
+            raise AttributeError(name)
+
+        def _call(*args):
+            try:
+                reply = _send(self._state, {'method': name, 'args': list(args)})
+            except (OSError, ValueError, UIServerError) as e:
+                raise self._error(f'UI server request {name} failed: {e}') from e
+            self.value = reply.get('value')
+            return self.value
+        return _call
+
+
+def connect(cli_path, error=UIServerError):
+    """Return a RemoteInteraction if a UI server is reachable, else None.
+
+    Its failed requests raise `error`, e.g. click.ClickException for a CLI.
+    """
+    state = read_state(cli_path)
+    if not state or not ping(cli_path):
+        return None
+    return RemoteInteraction(state, error)
+
+
+def _write_state(cli_path, port, token):
+    path = state_path(cli_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{STATE_FILE}.{os.getpid()}.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'port': port, 'token': token, 'pid': os.getpid()}, f)
+    os.replace(tmp, path)
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def serve(cli_path, idle_timeout=DEFAULT_IDLE_TIMEOUT, preload_images=(), log=None):
+    """Run the UI server in this process until idle for `idle_timeout` seconds."""
+    from qthvym import APP, HVYMInteraction
+
+    # Decode each image once so the Qt image format plugins (svg, png) are
+    # loaded before the first dialog needs them.
+    from PyQt5.QtGui import QPixmap
+    for image in preload_images:
+        if os.path.exists(image):
+            QPixmap(str(image))
+    APP.processEvents()
+
+    token = secrets.token_hex(16)
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(8)
+    listener.settimeout(0.2)
+    _write_state(cli_path, listener.getsockname()[1], token)
+    if log:
+        log(f'UI server listening on 127.0.0.1:{listener.getsockname()[1]}')
+
+    last_request = time.monotonic()
+    running = True
+    try:
+        while running:
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                # Keep Qt responsive between requests
+                APP.processEvents()
+                if idle_timeout and time.monotonic() - last_request > idle_timeout:
+                    break
+                continue
+
+            last_request = time.monotonic()
+            with conn:
+                conn.settimeout(5)
+                try:
+                    with conn.makefile('rb') as reader:
+                        request = json.loads(reader.readline() or b'{}')
+                except (OSError, ValueError):
+                    continue
+
+                if not hmac.compare_digest(str(request.get('token', '')), token):
+                    reply = {'ok': False, 'error': 'invalid token'}
+                elif request.get('method') == 'ping':
+                    reply = {'ok': True}
+                elif request.get('method') == 'shutdown':
+                    reply = {'ok': True}
+                    running = False
+                elif request.get('method') in POPUP_METHODS:
+                    try:
+                        interaction = HVYMInteraction()
+                        getattr(interaction, request['method'])(*request.get('args', []))
+                        reply = {'ok': True, 'value': _jsonable(getattr(interaction, 'value', None))}
+                    except Exception as e:
+                        reply = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+                    APP.processEvents()
+                else:
+                    reply = {'ok': False, 'error': f"unknown method {request.get('method')!r}"}
+
+                try:
+                    conn.sendall(json.dumps(reply).encode('utf-8') + b'\n')
+                except OSError:
+                    pass
+    finally:
+        listener.close()
+        state = read_state(cli_path)
+        if state and state.get('pid') == os.getpid():
+            try:
+                state_path(cli_path).unlink()
+            except OSError:
+                pass
@@ -92,10 +92,11 @@ class LazyImporter:
     
     def _import_templating(self):
         """Templating imports."""
-        from jinja2 import Environment, FileSystemLoader
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
         return {
             'Environment': Environment,
-            'FileSystemLoader': FileSystemLoader
+            'FileSystemLoader': FileSystemLoader,
+            'FileSystemBytecodeCache': FileSystemBytecodeCache
         }
     
     def _import_ui(self):
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test parse-blender-hvym-collection and parse-blender-hvym-scene: --diff
+output and schema errors
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+os.environ.pop('HVYM_JSON_FAST', None)
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_bench
+
+
+def _parse(collection, *options, name='test_collection', collection_id='1'):
+    _, menu, nodes, actions = hvym_bench.synthetic_collection(0, collection_id=collection_id)
+    args = [name, 'multi', collection_id] + [json.dumps(d) for d in (collection, menu, nodes, actions)]
+    return CliRunner().invoke(hvym.parse_blender_hvym_collection, list(options) + args)
+
+
+def test_diff():
+    """--diff prints the whole document first, then only what changed"""
+    print("=== Testing --diff ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = hvym.CLI_PATH
+        hvym.CLI_PATH = tmp
+        try:
+            collection = hvym_bench.synthetic_collection(10, collection_id='1')[0]
+            first = _parse(collection, '--diff')
+            assert first.exit_code == 0, first.output
+            first = json.loads(first.output)
+            assert first['full'] is True
+            assert first['changed'] == json.loads(_parse(collection).output)
+
+            unchanged = json.loads(_parse(collection, '--diff').output)
+            assert unchanged == {'full': False, 'changed': {}, 'removed': {}}
+
+            edited = next(k for k in collection if k.isdigit() and collection[k]['trait_type'] == 'property')
+            collection[edited]['show'] = not collection[edited]['show']
+            changed = json.loads(_parse(collection, '--diff').output)
+            assert changed['full'] is False
+            assert list(changed['changed']) == ['valProps'] and len(changed['changed']['valProps']) == 1
+
+            other = json.loads(_parse(collection, '--diff', name='other').output)
+            assert other['full'] is True
+        finally:
+            hvym.CLI_PATH = saved
+    print("✅ --diff tracks each collection")
+    return True
+
+
+def _schema_errors(collection, actions=None, menu=None):
+    _, default_menu, nodes, default_actions = hvym_bench.synthetic_collection(4, collection_id='1')
+    menu = default_menu if menu is None else menu
+    try:
+        hvym._parse_hvym_collection('c', 'multi', '1', collection, menu, nodes,
+                                    default_actions if actions is None else actions)
+    except hvym.HvymSchemaError as e:
+        return dict(e.errors)
+    return {}
+
+
+def test_schema_errors():
+    """Bad traits are reported by JSON path instead of raising"""
+    print("=== Testing schema error paths ===")
+    collection, _, _, actions = hvym_bench.synthetic_collection(4, collection_id='1')
+    assert _schema_errors(collection) == {}
+
+    collection['0']['trait_type'] = ['property']
+    collection['1']['trait_type'] = {'a': 1}
+    collection['2'] = 'not a trait'
+    del collection['3']['type']
+    errors = _schema_errors(collection)
+    assert errors == {
+        '$.collection["0"].trait_type': 'expected a string',
+        '$.collection["1"].trait_type': 'expected a string',
+        '$.collection["2"]': 'expected an object',
+        '$.collection["3"].type': hvym._MISSING,
+    }, errors
+
+    collection = hvym_bench.synthetic_collection(4, collection_id='1')[0]
+    actions['0']['trait_type'] = ['mesh_action']
+    del actions['1']['action_set']
+    errors = _schema_errors(collection, actions)
+    assert errors == {
+        '$.actions["0"].trait_type': 'expected a string',
+        '$.actions["1"].action_set': hvym._MISSING,
+    }, errors
+
+    collection, menu, _, actions = hvym_bench.synthetic_collection(4, collection_id='1')
+    prop = next(k for k in collection if k.isdigit() and collection[k]['trait_type'] == 'property')
+    collection[prop]['type'] = ['name']
+    actions['0']['type'] = {'name': 1}
+    menu['0']['collection_id'] = ['1']
+    menu['1']['collection_id'] = 1
+    errors = _schema_errors(collection, actions, menu)
+    assert errors == {
+        f'$.collection["{prop}"].type': 'expected a string',
+        '$.actions["0"].type': 'expected a string',
+        '$.menu["0"].collection_id': 'expected a string',
+        '$.menu["1"].collection_id': 'expected a string',
+    }, errors
+
+    result = _parse({'0': {'trait_type': [1]}})
+    assert result.exit_code != 0 and '$.collection["0"].trait_type: expected a string' in result.output, result.output
+    print("✅ schema errors reported by path")
+    return True
+
+
+def test_scene_input_not_object():
+    """parse-blender-hvym-scene rejects --input documents that are not objects"""
+    print("=== Testing parse-blender-hvym-scene input checks ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'scene.json')
+        for doc in ([], 'x', 5, None):
+            with open(path, 'w') as f:
+                json.dump(doc, f)
+            result = CliRunner().invoke(hvym.parse_blender_hvym_scene, ['--input', path])
+            assert result.exit_code == 2, (doc, result.output, result.exception)
+            assert 'must be a JSON object' in result.output, result.output
+
+        with open(path, 'w') as f:
+            json.dump({'collections': {'1': {'collection_name': 'c', 'collection_type': 'multi', 'collection': 5}}}, f)
+        result = CliRunner().invoke(hvym.parse_blender_hvym_scene, ['--input', path])
+        assert isinstance(result.exception, SystemExit), repr(result.exception)
+    print("✅ non-object scene documents rejected")
+    return True
+
+
+def main():
+    """Run the collection tests"""
+    print("HeavyMeta Collection Parse Test")
+    print("=" * 50)
+
+    tests = [
+        test_diff,
+        test_schema_errors,
+        test_scene_input_not_object,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Test the data URL commands: batch output, --out-dir and the encode cache
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import base64
+import struct
+import zlib
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_data_url
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{0}"><rect width="{0}" height="{0}"/></svg>'
+
+
+def _svgs(root, *names):
+    paths = []
+    for i, name in enumerate(names):
+        path = Path(root) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(SVG.format(i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def _decoded(url):
+    return base64.b64decode(url.split(',', 1)[1])
+
+
+def _png(image, *chunks):
+    """PNG bytes of a Pillow image with extra (type, data) chunks after IHDR."""
+    out = io.BytesIO()
+    image.save(out, 'PNG')
+    data = out.getvalue()
+    extra = b''.join(struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+                     for kind, body in chunks)
+    return data[:33] + extra + data[33:]    # 8-byte signature + 25-byte IHDR
+
+
+def _geometry(root):
+    """(tag, {attr: numbers}, command letters) for each SVG element of root, metadata excluded."""
+    ns = '{%s}' % hvym_data_url.SVG_NS
+    shapes = []
+    for element in root.iter():
+        if not element.tag.startswith(ns) or element.tag == ns + 'metadata':
+            continue
+        attrs = {name: [float(n) for n in hvym_data_url._NUMBER.findall(value)]
+                 for name, value in element.attrib.items() if name in hvym_data_url.SVG_GEOMETRY_ATTRS}
+        commands = re.findall(r'[A-DF-Za-df-z]', element.get('d', ''))
+        shapes.append((element.tag, attrs, commands))
+    return shapes
+
+
+EDITOR_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- Created with Inkscape -->
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+     xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     width="100.000000" height="50.5" viewBox="0 0 100.0000 50.5" inkscape:version="1.3">
+  <metadata><rdf:RDF><dc:title>logo</dc:title></rdf:RDF></metadata>
+  <sodipodi:namedview id="view" inkscape:zoom="2"/>
+  <g transform="translate(1.23456, -2.000001)" inkscape:label="Layer 1">
+    <!-- outline -->
+    <path d="M 10.123456,20.000001 L 30.5 , -40.25 C 0.1234,0.5 1e-4,2 3,4 Z" fill="red"/>
+    <circle cx="0.33333333" cy="12" r="5.0005"/>
+    <text x="1" y="2">  Hello  world </text>
+  </g>
+</svg>
+"""
+
+
+def test_out_dir():
+    """--out-dir writes the same data URLs that stdout gets"""
+    print("=== Testing svg-to-data-url --out-dir ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _svgs(tmp, 'a.svg', 'b.svg')
+        printed = CliRunner().invoke(hvym.svg_to_data_url, files)
+        assert printed.exit_code == 0, printed.output
+        lines = printed.output.splitlines()
+        assert [_decoded(u) for u in lines] == [hvym_data_url.svg_bytes(f) for f in files]
+
+        out = Path(tmp) / 'out'
+        out.mkdir()
+        result = CliRunner().invoke(hvym.svg_to_data_url, ['--out-dir', str(out)] + files)
+        assert result.exit_code == 0, result.output
+        assert [(out / 'a.svg.txt').read_text(), (out / 'b.svg.txt').read_text()] == lines
+    print("✅ --out-dir output matches stdout")
+    return True
+
+
+def test_out_dir_collision():
+    """Files with the same name from different folders are rejected before writing"""
+    print("=== Testing --out-dir name collisions ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _svgs(tmp, 'a.svg', 'one/logo.svg', 'two/logo.svg')
+        out = Path(tmp) / 'out'
+        out.mkdir()
+        result = CliRunner().invoke(hvym.svg_to_data_url, ['--out-dir', str(out)] + files)
+        assert result.exit_code != 0
+        assert 'logo.svg.txt' in result.output, result.output
+        assert not os.listdir(out)
+
+        # The same file twice is not a clash
+        result = CliRunner().invoke(hvym.svg_to_data_url, ['--out-dir', str(out), files[0], files[0]])
+        assert result.exit_code == 0, result.output
+    print("✅ collisions rejected")
+    return True
+
+
+def test_encode_cache_invalidation():
+    """assets encode serves unchanged files from the cache and re-encodes edited ones"""
+    print("=== Testing the data URL cache ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        a, b = _svgs(tmp, 'a.svg', 'b.svg')
+        with patch.object(hvym, 'CLI_PATH', tmp):
+            def encode(*files):
+                result = CliRunner().invoke(hvym.assets, ['encode'] + list(files))
+                assert result.exit_code == 0, result.output
+                return json.loads(result.output)
+
+            first = encode(a, b)
+            with hvym_data_url.DataUrlCache(hvym_data_url.cache_path(tmp)) as cache:
+                assert cache.stats()['urls'] == 2
+            with patch.object(hvym, '_encode_asset', side_effect=AssertionError('re-encoded a cached file')):
+                assert encode(a, b) == first
+
+            Path(a).write_text(SVG.format(7))
+            edited = encode(a)
+            assert _decoded(edited[a]) == hvym_data_url.svg_bytes(a) != _decoded(first[a])
+
+            # The key is the content, so a copy under another name is a hit
+            copy = os.path.join(tmp, 'copy.svg')
+            Path(copy).write_text(Path(b).read_text())
+            with patch.object(hvym, '_encode_asset', side_effect=AssertionError('re-encoded a cached file')):
+                assert encode(copy)[copy] == first[b]
+            assert hvym_data_url.content_key(b) != hvym_data_url.content_key(b, variant='optimized')
+    print("✅ edits re-encoded, unchanged content served from the cache")
+    return True
+
+
+def test_cache_eviction():
+    """The cache drops its least recently used URLs once over max_bytes"""
+    print("=== Testing data URL cache eviction ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        with hvym_data_url.DataUrlCache(Path(tmp) / 'urls.sqlite', max_bytes=250) as cache:
+            # Sleeps keep the last-used times apart on coarse clocks
+            cache.put({b'a': b'x' * 100})
+            time.sleep(0.05)
+            cache.put({b'b': b'x' * 100})
+            time.sleep(0.05)
+            assert cache.get([b'a']) == {b'a': b'x' * 100}    # a is now the most recently used
+            time.sleep(0.05)
+            cache.put({b'c': b'x' * 100})
+            assert set(cache.get([b'a', b'b', b'c'])) == {b'a', b'c'}
+            assert cache.stats() == {'urls': 2, 'bytes': 200}
+    print("✅ least recently used URLs evicted")
+    return True
+
+def test_optimize_png():
+    """Optimized PNGs decode to the same pixels and are never larger"""
+    print("=== Testing optimize_png ===")
+    try:
+        from PIL import Image
+    except ImportError:
+        print("⏭ Pillow not installed")
+        return True
+
+    few = Image.new('RGBA', (64, 64), (255, 0, 0, 255))
+    few.paste((0, 0, 255, 128), (0, 0, 32, 32))
+    noisy = Image.frombytes('RGB', (32, 32), os.urandom(32 * 32 * 3))
+    grey = Image.new('LA', (16, 16), (90, 200))
+    gamma = (b'gAMA', struct.pack('>I', 45455)), (b'sRGB', b'\0')
+    for image, chunks in ((few, ()), (noisy, ()), (grey, ()), (few, gamma)):
+        data = _png(image, *chunks)
+        optimized = hvym_data_url.optimize_png(data)
+        assert len(optimized) <= len(data)
+        with Image.open(io.BytesIO(data)) as before, Image.open(io.BytesIO(optimized)) as after:
+            assert after.format == 'PNG'
+            assert before.convert('RGBA').tobytes() == after.convert('RGBA').tobytes()
+    assert len(hvym_data_url.optimize_png(_png(few))) < len(_png(few))
+
+    # Documented: Pillow writes no gAMA/sRGB chunks
+    with Image.open(io.BytesIO(hvym_data_url.optimize_png(_png(few, *gamma)))) as after:
+        assert 'gamma' not in after.info and 'srgb' not in after.info
+    print("✅ PNGs shrink losslessly")
+    return True
+
+
+def test_minify_svg():
+    """Minified SVGs parse, keep their geometry and drop comments and editor metadata"""
+    print("=== Testing minify_svg ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'logo.svg'
+        path.write_text(EDITOR_SVG, encoding='utf-8')
+        minified = hvym_data_url.minify_svg(str(path))
+    text = minified.decode('utf-8')
+    assert len(minified) < len(EDITOR_SVG.encode('utf-8'))
+    assert '<!--' not in text and 'metadata' not in text
+    assert 'inkscape' not in text and 'sodipodi' not in text and 'rdf' not in text
+    assert text.startswith('<svg ') and 'ns0:' not in text
+    assert 'xmlns="http://www.w3.org/2000/svg"' in text
+
+    original = ET.fromstring(EDITOR_SVG.encode('utf-8'))
+    root = ET.fromstring(minified)
+    assert root.tag == '{%s}svg' % hvym_data_url.SVG_NS
+    assert [e.tag for e in root.iter() if not e.tag.startswith('{%s}' % hvym_data_url.SVG_NS)] == []
+    tolerance = 0.5 * 10 ** -hvym_data_url.SVG_PRECISION
+    for (tag, attrs, commands), (new_tag, new_attrs, new_commands) in zip(
+            _geometry(original), _geometry(root), strict=True):
+        assert (tag, commands, attrs.keys()) == (new_tag, new_commands, new_attrs.keys())
+        for name, numbers in attrs.items():
+            assert len(numbers) == len(new_attrs[name]), name
+            assert all(abs(a - b) <= tolerance for a, b in zip(numbers, new_attrs[name])), name
+    assert root.find('.//{%s}text' % hvym_data_url.SVG_NS).text == '  Hello  world '
+    print("✅ SVG minified with its geometry intact")
+    return True
+
+
+def test_optimized_cache_keys():
+    """assets encode caches optimized and plain URLs of a file separately"""
+    print("=== Testing optimized cache keys ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'logo.svg')
+        Path(path).write_text(EDITOR_SVG, encoding='utf-8')
+        with patch.object(hvym, 'CLI_PATH', tmp):
+            def encode(*options):
+                result = CliRunner().invoke(hvym.assets, ['encode'] + list(options) + [path])
+                assert result.exit_code == 0, result.output
+                return json.loads(result.stdout)[path]
+
+            plain = encode()
+            optimized = encode('--optimize')
+            assert _decoded(plain) == hvym_data_url.svg_bytes(path)
+            assert _decoded(optimized) == hvym_data_url.minify_svg(path)
+            with hvym_data_url.DataUrlCache(hvym_data_url.cache_path(tmp)) as cache:
+                assert cache.stats()['urls'] == 2
+            with patch.object(hvym, '_encode_asset', side_effect=AssertionError('re-encoded a cached file')):
+                assert encode() == plain
+                assert encode('--optimize') == optimized
+    print("✅ optimized and plain URLs cached under their own keys")
+    return True
+
+
+def main():
+    """Run the data URL tests"""
+    print("HeavyMeta Data URL Test")
+    print("=" * 50)
+
+    tests = [
+        test_out_dir,
+        test_out_dir_collision,
+        test_encode_cache_invalidation,
+        test_cache_eviction,
+        test_optimize_png,
+        test_minify_svg,
+        test_optimized_cache_keys,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test the GLB/glTF metadata reader and writer in hvym_glb
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_glb
+
+
+def _glb(doc, binary=b''):
+    """Build a GLB file's bytes from a JSON-able doc and an optional BIN chunk."""
+    encoded = json.dumps(doc).encode('utf-8')
+    encoded += b' ' * (-len(encoded) % 4)
+    chunks = hvym_glb.CHUNK_HEADER.pack(len(encoded), hvym_glb.CHUNK_JSON) + encoded
+    if binary:
+        binary += b'\0' * (-len(binary) % 4)
+        chunks += hvym_glb.CHUNK_HEADER.pack(len(binary), hvym_glb.CHUNK_BIN) + binary
+    return hvym_glb.HEADER.pack(hvym_glb.GLB_MAGIC, 2, hvym_glb.HEADER.size + len(chunks)) + chunks
+
+
+def test_round_trip():
+    """write_extension then read_extension returns the value and keeps the BIN chunk"""
+    print("=== Testing GLB round trip ===")
+    binary = bytes(range(256)) * 64
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'model.glb'
+        path.write_bytes(_glb({'asset': {'version': '2.0'}, 'buffers': [{'byteLength': len(binary)}]}, binary))
+        assert hvym_glb.read_extension(path) is None
+
+        value = {'contract': {'nftType': 'HVYC', 'name': 'Sépia'}, 'col': {'type': 'multi'}}
+        size = hvym_glb.write_extension(path, 'HVYM_nft_data', value)
+        assert size == path.stat().st_size
+        assert hvym_glb.read_extension(path) == value
+        doc = hvym_glb.read_gltf_json(path)
+        assert doc['extensionsUsed'] == ['HVYM_nft_data'] and doc['asset'] == {'version': '2.0'}
+        with open(path, 'rb') as f:
+            layout = hvym_glb.read_layout(f)
+            assert layout.json_offset % 4 == 0 and layout.bin_offset % 4 == 0
+            f.seek(layout.bin_offset)
+            assert f.read(layout.bin_length) == binary
+
+        hvym_glb.write_extension(path, 'HVYM_nft_data', None)
+        assert hvym_glb.read_extension(path) is None
+        assert 'extensionsUsed' not in hvym_glb.read_gltf_json(path)
+
+        gltf = Path(tmp) / 'model.gltf'
+        gltf.write_text(json.dumps({'asset': {'version': '2.0'}}))
+        hvym_glb.write_extension(gltf, 'HVYM_nft_data', value)
+        assert hvym_glb.read_extension(gltf) == value
+    print("✅ GLB and glTF round trips")
+    return True
+
+
+def test_malformed():
+    """Non-object glTF JSON and bad headers raise GLBError"""
+    print("=== Testing malformed files ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            'list.glb': _glb([1, 2, 3]),
+            'string.gltf': b'"text"',
+            'extensions.glb': _glb({'extensions': [1]}),
+            'short.glb': b'glTF\x02\x00',
+            'version.glb': _glb({})[:4] + b'\x01\x00\x00\x00' + _glb({})[8:],
+        }
+        for name, data in cases.items():
+            path = Path(tmp) / name
+            path.write_bytes(data)
+            try:
+                hvym_glb.read_extension(path)
+            except hvym_glb.GLBError:
+                pass
+            else:
+                raise AssertionError(f'{name} was accepted')
+        try:
+            hvym_glb.write_extension(Path(tmp) / 'list.glb', 'HVYM_nft_data', {})
+        except hvym_glb.GLBError:
+            pass
+        else:
+            raise AssertionError('write_extension accepted a non-object document')
+        assert not [p for p in os.listdir(tmp) if p.endswith('.tmp')]
+    print("✅ malformed files rejected")
+    return True
+
+
+def test_write_hvym_data_cli():
+    """write-hvym-data sets, redirects with --output and removes the extension"""
+    print("=== Testing write-hvym-data ===")
+    binary = b'mesh' * 100
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'model.glb'
+        original = _glb({'asset': {'version': '2.0'}}, binary)
+        path.write_bytes(original)
+        value = {'contract': {'nftType': 'HVYC'}}
+
+        copy = Path(tmp) / 'copy.glb'
+        result = CliRunner().invoke(hvym.write_hvym_data, [str(path), json.dumps(value), '--output', str(copy)])
+        assert result.exit_code == 0, result.output
+        assert path.read_bytes() == original, '--output changed the source file'
+        assert hvym_glb.read_extension(copy) == value
+
+        source = Path(tmp) / 'data.json'
+        source.write_text(json.dumps(value))
+        result = CliRunner().invoke(hvym.write_hvym_data, [str(path), '--input', str(source)])
+        assert result.exit_code == 0, result.output
+        assert hvym_glb.read_extension(path) == value
+        assert path.read_bytes().endswith(binary)
+
+        result = CliRunner().invoke(hvym.write_hvym_data, [str(path), '--remove'])
+        assert result.exit_code == 0, result.output
+        assert hvym_glb.read_extension(path) is None
+        assert 'extensionsUsed' not in hvym_glb.read_gltf_json(path)
+
+        for args in ([str(path), '[1]'], [str(path), '{'], [str(path)]):
+            result = CliRunner().invoke(hvym.write_hvym_data, args)
+            assert result.exit_code == 2, (args, result.output)
+        assert not [p for p in os.listdir(tmp) if p.endswith('.tmp')]
+    print("✅ set, --output and --remove round trip")
+    return True
+
+
+def main():
+    """Run the GLB tests"""
+    print("HeavyMeta GLB Test")
+    print("=" * 50)
+
+    tests = [
+        test_round_trip,
+        test_malformed,
+        test_write_hvym_data_cli,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test --input for the Blender parse commands: files, stdin and gzip
+"""
+
+import os
+import sys
+import gzip
+import json
+import tempfile
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_bench
+
+
+def _collection_doc():
+    collection, menu, nodes, actions = hvym_bench.synthetic_collection(20, collection_id='1')
+    return {'collection_name': 'Café', 'collection_type': 'multi', 'collection_id': '1',
+            'collection': collection, 'menu': menu, 'nodes': nodes, 'actions': actions}
+
+
+def _positional(doc):
+    args = [doc['collection_name'], doc['collection_type'], doc['collection_id']]
+    args += [json.dumps(doc[k]) for k in ('collection', 'menu', 'nodes', 'actions')]
+    return CliRunner().invoke(hvym.parse_blender_hvym_collection, args)
+
+
+def test_collection_input():
+    """--input from a file, stdin and gzip prints what the positional arguments print"""
+    print("=== Testing parse-blender-hvym-collection --input ===")
+    doc = _collection_doc()
+    expected = _positional(doc)
+    assert expected.exit_code == 0, expected.output
+    raw = json.dumps(doc).encode('utf-8')
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, 'collection.json')
+        packed = os.path.join(tmp, 'collection.json.gz')
+        with open(plain, 'wb') as f:
+            f.write(raw)
+        with open(packed, 'wb') as f:
+            f.write(gzip.compress(raw))
+        runs = {
+            'file': (['--input', plain], None),
+            'gzip file': (['--input', packed], None),
+            'stdin': (['--input', '-'], raw),
+            'gzip stdin': (['--input', '-'], gzip.compress(raw)),
+        }
+        for label, (args, stdin) in runs.items():
+            result = CliRunner().invoke(hvym.parse_blender_hvym_collection, args, input=stdin)
+            assert result.exit_code == 0, (label, result.output)
+            assert result.output == expected.output, label
+    print("✅ file, stdin and gzip input match the positional output")
+    return True
+
+
+def test_bad_input():
+    """Documents that are not objects, lack fields or are truncated are usage errors"""
+    print("=== Testing bad --input documents ===")
+    doc = _collection_doc()
+    del doc['collection']
+    truncated = gzip.compress(json.dumps(_collection_doc()).encode('utf-8'))[:-12]
+    cases = {
+        'string': (json.dumps('collection_name collection_type collection_id collection').encode(), 'must be a JSON object'),
+        'list': (b'[]', 'must be a JSON object'),
+        'missing field': (json.dumps(doc).encode(), 'missing: collection'),
+        'invalid JSON': (b'{"collection_name":', 'Invalid value for --input'),
+        'truncated gzip': (truncated, 'truncated gzip input'),
+    }
+    for label, (stdin, message) in cases.items():
+        result = CliRunner().invoke(hvym.parse_blender_hvym_collection, ['--input', '-'], input=stdin)
+        assert result.exit_code == 2, (label, result.output, result.exception)
+        assert message in result.output, (label, result.output)
+    result = CliRunner().invoke(hvym.parse_blender_hvym_collection, ['--input', os.path.join(tempfile.gettempdir(), 'no-such-dir', 'x.json')])
+    assert result.exit_code == 2, result.output
+    print("✅ bad documents rejected")
+    return True
+
+
+def test_interactables_input():
+    """parse-blender-hvym-interactables reads the same document from OBJ_DATA, a file or gzip stdin"""
+    print("=== Testing parse-blender-hvym-interactables --input ===")
+    objs = hvym_bench.synthetic_interactables(10)
+    raw = json.dumps(objs).encode('utf-8')
+    expected = CliRunner().invoke(hvym.parse_blender_hvym_interactables, [raw.decode('utf-8')])
+    assert expected.exit_code == 0, expected.output
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'objs.json')
+        with open(path, 'wb') as f:
+            f.write(raw)
+        from_file = CliRunner().invoke(hvym.parse_blender_hvym_interactables, ['--input', path])
+    from_stdin = CliRunner().invoke(hvym.parse_blender_hvym_interactables, ['--input', '-'], input=gzip.compress(raw))
+    assert from_file.output == from_stdin.output == expected.output
+    print("✅ interactables input matches")
+    return True
+
+
+def main():
+    """Run the --input tests"""
+    print("HeavyMeta Parse Input Test")
+    print("=" * 50)
+
+    tests = [
+        test_collection_input,
+        test_bad_input,
+        test_interactables_input,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
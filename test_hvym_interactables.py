@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test parse-blender-hvym-interactables with per-object and columnar documents
+"""
+
+import os
+import sys
+import json
+
+os.environ.pop('HVYM_JSON_FAST', None)
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_bench
+
+
+def _parse(doc, *options):
+    return CliRunner().invoke(hvym.parse_blender_hvym_interactables, list(options) + [json.dumps(doc)])
+
+
+def test_columnar_matches_rows():
+    """A columnar document gives the same output as the per-object form"""
+    print("=== Testing columnar vs per-object input ===")
+    objs = hvym_bench.synthetic_interactables(20)
+    rows = _parse(objs)
+    columns = _parse(hvym_bench.interactable_columns(objs))
+    assert rows.exit_code == 0, rows.output
+    assert columns.exit_code == 0, columns.output
+    assert rows.output == columns.output
+    assert len(json.loads(rows.output)) == 20
+    print("✅ columnar and per-object output are identical")
+    return True
+
+
+def test_object_named_columns():
+    """An object named "columns" is not mistaken for a columnar document"""
+    print("=== Testing an object named columns ===")
+    objs = hvym_bench.synthetic_interactables(2)
+    obj = objs.pop('obj_0')
+    obj['name'] = 'columns'
+    objs['columns'] = obj
+    result = _parse(objs)
+    assert result.exit_code == 0, result.output
+    assert set(json.loads(result.output)) == {'columns', 'obj_1'}
+    print("✅ 'columns' parsed as an object")
+    return True
+
+
+def test_columnar_format_version():
+    """A columnar document without the expected __format__ is rejected"""
+    print("=== Testing the columnar format version ===")
+    doc = hvym_bench.interactable_columns(hvym_bench.synthetic_interactables(2))
+    doc['__format__'] = 2
+    result = _parse(doc)
+    assert result.exit_code != 0
+    assert '$.__format__' in result.output, result.output
+    print("✅ unknown format rejected")
+    return True
+
+
+def test_columnar_errors():
+    """Column errors are reported with their JSON path"""
+    print("=== Testing columnar errors ===")
+    doc = hvym_bench.interactable_columns(hvym_bench.synthetic_interactables(3))
+    doc['__columns__']['hvym_mesh_interaction_int_default'][1] = 99
+    result = _parse(doc)
+    assert result.exit_code != 0
+    assert '$.__columns__.hvym_mesh_interaction_int_default[1]' in result.output, result.output
+    del doc['__columns__']['children']
+    result = _parse(doc)
+    assert '$.__columns__.children' in result.output, result.output
+    print("✅ errors reported by path")
+    return True
+
+
+def test_mistyped_names_and_children():
+    """A non-array children or non-string name is an error by path in both modes"""
+    print("=== Testing mistyped children and names ===")
+    objs = hvym_bench.synthetic_interactables(4)
+    keys = list(objs)
+    objs[keys[0]]['children'] = 5
+    objs[keys[1]]['children'] = None
+    objs[keys[2]]['name'] = ['a']
+    expected = {
+        f'$["{keys[0]}"].children': 'expected an array',
+        f'$["{keys[1]}"].children': 'expected an array',
+        f'$["{keys[2]}"].name': 'expected a string',
+    }
+    assert dict(hvym._check_interactables(objs)) == expected, hvym._check_interactables(objs)
+    result = _parse(objs)
+    assert isinstance(result.exception, SystemExit), repr(result.exception)
+    assert all(f'{p}: {m}' in result.output for p, m in expected.items()), result.output
+
+    columns = hvym_bench.interactable_columns(objs)['__columns__']
+    errors = dict(hvym._check_interactable_columns(columns))
+    assert errors == {
+        '$.__columns__.children[0]': 'expected an array',
+        '$.__columns__.children[1]': 'expected an array',
+        '$.__columns__.name[2]': 'expected a string',
+    }, errors
+    result = _parse(hvym_bench.interactable_columns(objs))
+    assert isinstance(result.exception, SystemExit), repr(result.exception)
+    print("✅ mistyped fields reported by path")
+    return True
+
+
+def main():
+    """Run the interactables tests"""
+    print("HeavyMeta Interactables Test")
+    print("=" * 50)
+
+    tests = [
+        test_columnar_matches_rows,
+        test_object_named_columns,
+        test_columnar_format_version,
+        test_columnar_errors,
+        test_mistyped_names_and_children,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test that the Blender-facing commands print stdlib JSON by default
+and that --fast-json only changes the formatting, not the values
+"""
+
+import os
+import sys
+import json
+from unittest.mock import patch
+
+os.environ.pop('HVYM_JSON_FAST', None)
+
+from click.testing import CliRunner
+
+import hvym
+import hvym_bench
+
+
+def _collection_args():
+    collection, menu, nodes, actions = hvym_bench.synthetic_collection(12, collection_id='1')
+    return ['Sépia ✓', 'multi', '1', json.dumps(collection), json.dumps(menu), json.dumps(nodes), json.dumps(actions)]
+
+
+def _invoke(command, args):
+    hvym._JSON.set_fast(False)
+    result = CliRunner().invoke(command, args)
+    hvym._JSON.set_fast(False)
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_default_output_is_stdlib():
+    """Default output is byte-identical to json.dumps"""
+    print("=== Testing default JSON output ===")
+    out = _invoke(hvym.single_node_data, ['Näme', 'mesh'])
+    assert out == json.dumps({'name': 'Näme', 'type': 'mesh'}) + '\n', out
+
+    out = _invoke(hvym.parse_blender_hvym_collection, _collection_args())
+    assert out == json.dumps(json.loads(out)) + '\n'
+    assert ', ' in out and '\\u00e9' in out
+    print("✅ default output matches json.dumps")
+    return True
+
+
+def test_fast_json_is_opt_in():
+    """--fast-json gives the same values as the default output"""
+    print("=== Testing --fast-json ===")
+    args = _collection_args()
+    default = _invoke(hvym.parse_blender_hvym_collection, args)
+    fast = _invoke(hvym.parse_blender_hvym_collection, ['--fast-json'] + args)
+    assert json.loads(fast) == json.loads(default)
+    if hvym._fast_json_backend() is not None:
+        assert fast != default
+    print(f"✅ fast output ({hvym._fast_json_backend() or 'json'}) decodes to the same values")
+    return True
+
+
+def test_codec_fallbacks():
+    """The fast encoder falls back to the stdlib for values it rejects"""
+    print("=== Testing codec fallbacks ===")
+    fast = hvym._JsonCodec(fast=True)
+    big = {'n': 1 << 70}
+    assert json.loads(fast.dumps(big)) == big
+    assert hvym._JsonCodec().dumps({'a': [1, 2.5, None]}) == json.dumps({'a': [1, 2.5, None]})
+    assert fast.loads(b'{"a": 1}') == {'a': 1}
+    print("✅ fallbacks work")
+    return True
+
+def test_non_finite_floats():
+    """NaN is a token in default output and null in fast output"""
+    print("=== Testing non-finite floats ===")
+    data = {'x': float('nan'), 'y': float('inf')}
+    assert hvym._JsonCodec().dumps(data) == '{"x": NaN, "y": Infinity}'
+    for backend in ('orjson', 'msgspec'):
+        try:
+            __import__(backend)
+        except ImportError:
+            continue
+        with patch.object(hvym, '_fast_json_backend', return_value=backend):
+            assert json.loads(hvym._JsonCodec(fast=True).dumps(data)) == {'x': None, 'y': None}
+    print("✅ non-finite floats encode as documented")
+    return True
+
+
+def test_msgspec_encode_error():
+    """A msgspec.EncodeError falls back to the stdlib"""
+    print("=== Testing msgspec EncodeError fallback ===")
+    try:
+        import msgspec
+    except ImportError:
+        print("⏭ msgspec not installed")
+        return True
+    with patch.object(hvym, '_fast_json_backend', return_value='msgspec'), \
+            patch.object(msgspec.json, 'encode', side_effect=msgspec.EncodeError('boom')):
+        assert hvym._JsonCodec(fast=True).dumps({'a': 1}) == json.dumps({'a': 1})
+    print("✅ EncodeError falls back to json.dumps")
+    return True
+
+
+def main():
+    """Run the JSON codec tests"""
+    print("HeavyMeta JSON Output Test")
+    print("=" * 50)
+
+    tests = [
+        test_default_output_is_stdlib,
+        test_fast_json_is_opt_in,
+        test_codec_fallbacks,
+        test_non_finite_floats,
+        test_msgspec_encode_error,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test the _hvym_model_data memo: in-process hits, asset index hits and
+invalidation when the model file changes
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import hvym
+import hvym_asset_index
+from test_hvym_glb import _glb
+
+
+def _nft_data(price_name):
+    prop = {'prop_action_type': 'Setter', 'immutable': False, 'default': 1}
+    return {
+        'contract': {'nftType': 'HVYC', 'nftChain': 'Stellar'},
+        'project': {'name': 'p'},
+        'col_a': {'valProps': {price_name: prop, 'fixed': dict(prop, immutable=True)},
+                  'callProps': {'mint': {'call_param': 'x'}}},
+        'col_b': {'valProps': {'static': dict(prop, prop_action_type='Static')}},
+    }
+
+
+def _write_model(path, nft_data, mtime):
+    path.write_bytes(_glb({'asset': {'version': '2.0'}, 'extensions': {'HVYM_nft_data': nft_data}}))
+    os.utime(path, (mtime, mtime))
+
+
+def _no_read(*args):
+    raise AssertionError('the model file was read again')
+
+
+def test_memo_and_index():
+    """Repeated reads are served from memory, then from the asset index"""
+    print("=== Testing _hvym_model_data ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        model = Path(tmp) / 'model.glb'
+        _write_model(model, _nft_data('price'), time.time() - 10)
+        with patch.object(hvym, 'CLI_PATH', tmp), patch.dict(hvym._HVYM_MODEL_CACHE, clear=True):
+            data = hvym._hvym_model_data(model)
+            assert data == hvym._parse_hvym_data(_nft_data('price'), 'model.glb')
+            assert data['collections'] == {'col_a': {'valProps': {'price': _nft_data('price')['col_a']['valProps']['price']},
+                                                     'callProps': {'mint': {'call_param': 'x'}}}}
+
+            with patch.object(hvym, '_index_hvym_file', _no_read):
+                assert hvym._hvym_model_data(model) is data
+
+                # A later process: nothing in memory, the asset index has the entry
+                hvym._HVYM_MODEL_CACHE.clear()
+                assert hvym._hvym_model_data(model) == data
+            with hvym_asset_index.AssetIndex(hvym_asset_index.index_path(tmp)) as index:
+                assert index.get(str(model))['creator_hash'] == data['creatorHash']
+
+            # Editing the file invalidates both
+            _write_model(model, _nft_data('cost'), time.time())
+            edited = hvym._hvym_model_data(model)
+            assert 'cost' in edited['valProps'] and 'price' not in edited['valProps']
+            hvym._HVYM_MODEL_CACHE.clear()
+            with patch.object(hvym, '_index_hvym_file', _no_read):
+                assert hvym._hvym_model_data(model) == edited
+    print("✅ memoized, indexed and invalidated")
+    return True
+
+
+def test_without_index_and_errors():
+    """use_index=False leaves the index alone; malformed data raises ValueError"""
+    print("=== Testing _hvym_model_data without the index ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        model = Path(tmp) / 'model.glb'
+        _write_model(model, _nft_data('price'), time.time())
+        plain = Path(tmp) / 'plain.glb'
+        plain.write_bytes(_glb({'asset': {'version': '2.0'}}))
+        bad = Path(tmp) / 'bad.glb'
+        _write_model(bad, {'contract': {}, 'col': 'not an object'}, time.time())
+        with patch.object(hvym, 'CLI_PATH', tmp), patch.dict(hvym._HVYM_MODEL_CACHE, clear=True):
+            assert hvym._hvym_model_data(model, use_index=False)['valProps']
+            assert not os.path.exists(hvym_asset_index.index_path(tmp))
+            assert hvym._hvym_model_data(plain) is None
+            try:
+                hvym._hvym_model_data(bad)
+            except ValueError as e:
+                assert 'bad.glb' in str(e)
+            else:
+                raise AssertionError('malformed data was accepted')
+    print("✅ index optional, errors raised")
+    return True
+
+
+def main():
+    """Run the model data tests"""
+    print("HeavyMeta Model Data Test")
+    print("=" * 50)
+
+    tests = [
+        test_memo_and_index,
+        test_without_index_and_errors,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test npm link detection: scoped packages, the cached global prefix and
+its revalidation when modules look unlinked
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import hvym
+
+
+def _global_modules(prefix, links, installed=()):
+    """Make a global node_modules under prefix with links {name: target} and plain installed packages."""
+    root = Path(hvym._npm_global_modules(str(prefix)))
+    for name in installed:
+        (root / name).mkdir(parents=True)
+    for name, target in links.items():
+        Path(target).mkdir(parents=True, exist_ok=True)
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        os.symlink(target, root / name, target_is_directory=True)
+    return root
+
+
+class _Npm:
+    """Stands in for the npm executable; counts `npm prefix -g` runs."""
+
+    def __init__(self, tmp, prefix):
+        self.path = os.path.join(tmp, 'node', 'bin', 'npm')
+        self.prefix = str(prefix)
+        self.runs = 0
+
+    def run(self, *args, **kwargs):
+        self.runs += 1
+        return subprocess.CompletedProcess(args, 0, stdout=self.prefix + '\n', stderr='')
+
+    def patches(self, tmp):
+        hvym._npm_global_prefix.cache_clear()
+        return (patch.object(hvym.shutil, 'which', lambda name: self.path),
+                patch.object(hvym.subprocess, 'run', self.run),
+                patch.object(hvym, 'CLI_PATH', tmp),
+                patch.dict(os.environ, {'NPM_CONFIG_USERCONFIG': os.path.join(tmp, 'npmrc')}))
+
+
+def _with(patches, fn):
+    for p in patches:
+        p.start()
+    try:
+        return fn()
+    finally:
+        for p in reversed(patches):
+            p.stop()
+        hvym._npm_global_prefix.cache_clear()
+
+
+def test_scoped_links():
+    """Linked packages are found by exact name, scoped ones included"""
+    print("=== Testing npm link detection ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        _global_modules(Path(tmp) / 'prefix', {
+            'hvym-a': os.path.join(tmp, 'src', 'a'),
+            '@heavymeta/b': os.path.join(tmp, 'src', 'b'),
+        }, installed=['hvym-installed', '@heavymeta/installed'])
+        npm = _Npm(tmp, Path(tmp) / 'prefix')
+        links = _with(npm.patches(tmp), hvym._npm_linked_modules)
+        assert links == {
+            'hvym-a': os.path.realpath(os.path.join(tmp, 'src', 'a')),
+            '@heavymeta/b': os.path.realpath(os.path.join(tmp, 'src', 'b')),
+        }, links
+        assert hvym._module_is_linked('@heavymeta/b', links)
+        assert not hvym._module_is_linked('hvym', links)
+        assert not hvym._module_is_linked('@heavymeta/installed', links)
+    print("✅ scoped and plain links found")
+    return True
+
+
+def test_prefix_cache_key():
+    """The cached prefix is reused until an npmrc changes"""
+    print("=== Testing the npm prefix cache ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / 'prefix'
+        _global_modules(prefix, {'hvym-a': os.path.join(tmp, 'src', 'a')})
+        npm = _Npm(tmp, prefix)
+        _with(npm.patches(tmp), hvym._npm_linked_modules)
+        _with(npm.patches(tmp), hvym._npm_linked_modules)
+        assert npm.runs == 1, 'the prefix was not cached'
+
+        npmrc = Path(tmp) / 'npmrc'
+        npmrc.write_text('prefix=/elsewhere\n')
+        _with(npm.patches(tmp), hvym._npm_linked_modules)
+        assert npm.runs == 2, 'a new user npmrc did not invalidate the prefix'
+        os.utime(npmrc, (1, 1))
+        _with(npm.patches(tmp), hvym._npm_linked_modules)
+        assert npm.runs == 3, 'an edited user npmrc did not invalidate the prefix'
+    print("✅ npmrc changes invalidate the prefix")
+    return True
+
+
+def test_prefix_revalidated_when_missing():
+    """A module missing under a cached prefix makes npm report the prefix again"""
+    print("=== Testing npm prefix revalidation ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = Path(tmp) / 'old', Path(tmp) / 'new'
+        _global_modules(old, {})
+        _global_modules(new, {'hvym-a': os.path.join(tmp, 'src', 'a')})
+        npm = _Npm(tmp, old)
+        _with(npm.patches(tmp), hvym._npm_linked_modules)
+
+        npm.prefix = str(new)    # e.g. nvm switched the global prefix
+        links = _with(npm.patches(tmp), lambda: hvym._npm_linked_modules(['hvym-a']))
+        assert 'hvym-a' in links and npm.runs == 2, (links, npm.runs)
+        with open(os.path.join(tmp, hvym.NPM_PREFIX_FILE), encoding='utf-8') as f:
+            assert json.load(f)['prefix'] == str(new)
+
+        # Everything linked: the cached prefix is trusted
+        _with(npm.patches(tmp), lambda: hvym._npm_linked_modules(['hvym-a']))
+        assert npm.runs == 2
+    print("✅ stale prefix revalidated")
+    return True
+
+
+def main():
+    """Run the npm link tests"""
+    print("HeavyMeta npm Link Test")
+    print("=" * 50)
+
+    tests = [
+        test_scoped_links,
+        test_prefix_cache_key,
+        test_prefix_revalidated_when_missing,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
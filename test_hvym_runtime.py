@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test the persistent onedir runtime cache in hvym_runtime
+"""
+
+import os
+import io
+import sys
+import time
+import tarfile
+import zipfile
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import hvym_runtime
+
+
+def _tree(root, files):
+    for name, text in files.items():
+        path = Path(root) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return Path(root)
+
+
+def _archive(path, build_hash, files=None, fmt='tar'):
+    """Write a onedir archive holding BUILD_HASH, the executable and files."""
+    files = dict(files or {})
+    files.setdefault(hvym_runtime.BUILD_HASH_FILE, build_hash)
+    files.setdefault(hvym_runtime.executable_name(), '#!/bin/sh\n')
+    if fmt == 'zip':
+        with zipfile.ZipFile(path, 'w') as zf:
+            for name, text in files.items():
+                zf.writestr(name, text)
+    else:
+        with tarfile.open(path, 'w:gz') as tf:
+            for name, text in files.items():
+                data = text.encode('utf-8')
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_build_hash():
+    """The build hash follows file contents and their paths inside each root"""
+    print("=== Testing compute_build_hash ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = _tree(Path(tmp) / 'templates', {'a/index.txt': 'one', 'b/index.txt': 'two'})
+        base = hvym_runtime.compute_build_hash([tree])
+        assert hvym_runtime.compute_build_hash([tree]) == base
+        assert hvym_runtime.compute_build_hash([tree], extra=['3.12']) != base
+
+        # Swap two files with the same name
+        (tree / 'a/index.txt').write_text('two')
+        (tree / 'b/index.txt').write_text('one')
+        swapped = hvym_runtime.compute_build_hash([tree])
+        assert swapped != base
+
+        # Move a file to another directory
+        (tree / 'c').mkdir()
+        os.rename(tree / 'b/index.txt', tree / 'c/index.txt')
+        assert hvym_runtime.compute_build_hash([tree]) not in (base, swapped)
+
+        # Bytes moved from one file to the next
+        split = _tree(Path(tmp) / 'split', {'a': 'xy', 'b': 'z'})
+        before = hvym_runtime.compute_build_hash([split])
+        (split / 'a').write_text('x')
+        (split / 'b').write_text('yz')
+        assert hvym_runtime.compute_build_hash([split]) != before
+    print("✅ moves, swaps and edits change the hash")
+    return True
+
+
+def test_install_and_reuse():
+    """install unpacks each build once, atomically, and points current at it"""
+    print("=== Testing runtime install ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'runtime'
+        for fmt in ('tar', 'zip'):
+            build_hash = f'{fmt}hash'
+            archive = _archive(Path(tmp) / f'hvym.{fmt}', build_hash, {'lib/qt.txt': fmt}, fmt)
+            pointer = hvym_runtime.install(archive, root)
+            target = root / build_hash
+            assert pointer == hvym_runtime.current(root)
+            assert pointer['executable'] == str(target / hvym_runtime.executable_name())
+            assert (target / 'lib/qt.txt').read_text() == fmt
+            if os.name != 'nt':
+                assert os.access(pointer['executable'], os.X_OK)
+            assert not list(root.glob('.tmp-*')), 'the staging dir was left behind'
+
+            # Installed already: the tree is reused, not unpacked again
+            with patch.object(hvym_runtime, '_extract', side_effect=AssertionError('unpacked twice')):
+                assert hvym_runtime.install(archive, root)['build_hash'] == build_hash
+    print("✅ installed once and reused")
+    return True
+
+
+def test_failed_install_is_not_visible():
+    """An archive that fails to unpack leaves no target dir and keeps the current runtime"""
+    print("=== Testing atomic install ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'runtime'
+        hvym_runtime.install(_archive(Path(tmp) / 'good.tar', 'good'), root)
+
+        no_exe = Path(tmp) / 'no_exe.zip'
+        with zipfile.ZipFile(no_exe, 'w') as zf:
+            zf.writestr(hvym_runtime.BUILD_HASH_FILE, 'broken')
+            zf.writestr('lib/qt.txt', 'x')
+        for archive, build_hash in ((no_exe, None), (Path(tmp) / 'garbage.tar', 'garbage')):
+            if build_hash == 'garbage':
+                archive.write_bytes(b'not an archive')
+            try:
+                hvym_runtime.install(archive, root, build_hash=build_hash)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f'{archive.name} was installed')
+        assert sorted(p.name for p in root.iterdir()) == ['current.json', 'good']
+        assert hvym_runtime.current(root)['build_hash'] == 'good'
+
+        # A version without its completion marker is not current
+        (root / 'good' / hvym_runtime.COMPLETE_MARKER).unlink()
+        assert hvym_runtime.current(root) is None
+        # ... and is replaced by the next install of that build
+        hvym_runtime.install(_archive(Path(tmp) / 'good2.tar', 'good', {'new.txt': 'x'}), root)
+        assert (root / 'good' / 'new.txt').exists() and hvym_runtime.current(root)['build_hash'] == 'good'
+    print("✅ failed installs leave nothing behind")
+    return True
+
+
+def test_concurrent_install():
+    """When another process finishes the same install first, its tree is used"""
+    print("=== Testing a concurrent install ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'runtime'
+        archive = _archive(Path(tmp) / 'hvym.tar', 'same')
+        real_rename = os.rename
+
+        def other_process_wins(src, dst):
+            # The other installer renamed its complete copy into place first
+            _tree(dst, {hvym_runtime.COMPLETE_MARKER: 'same', hvym_runtime.executable_name(): 'theirs'})
+            real_rename(src, dst)
+
+        with patch.object(hvym_runtime.os, 'rename', other_process_wins):
+            pointer = hvym_runtime.install(archive, root)
+        assert Path(pointer['executable']).read_text() == 'theirs'
+        assert not list(root.glob('.tmp-*'))
+    print("✅ the finished install is kept")
+    return True
+
+
+def test_prune():
+    """prune keeps the active and the newest versions and clears old staging dirs"""
+    print("=== Testing runtime prune ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'runtime'
+        now = time.time()
+        for age, build_hash in enumerate(['v4', 'v3', 'v2', 'v1']):
+            hvym_runtime.install(_archive(Path(tmp) / f'{build_hash}.tar', build_hash), root, keep=10)
+            marker = root / build_hash / hvym_runtime.COMPLETE_MARKER
+            os.utime(marker, (now - 100 * age, now - 100 * age))
+        hvym_runtime._write_pointer(root, 'v1')    # the oldest is active
+
+        stale = root / '.tmp-v5-1'
+        fresh = root / '.tmp-v6-2'
+        stale.mkdir()
+        fresh.mkdir()
+        os.utime(stale, (now - 7200, now - 7200))
+
+        removed = hvym_runtime.prune(root, keep=2)
+        assert sorted(removed) == ['v2', 'v3'], removed
+        assert sorted(p.name for p in hvym_runtime.installed_versions(root)) == ['v1', 'v4']
+        assert not stale.exists() and fresh.exists()
+    print("✅ old versions pruned, active kept")
+    return True
+
+
+def main():
+    """Run the runtime cache tests"""
+    print("HeavyMeta Runtime Cache Test")
+    print("=" * 50)
+
+    tests = [
+        test_build_hash,
+        test_install_and_reuse,
+        test_failed_install_is_not_visible,
+        test_concurrent_install,
+        test_prune,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test that scan-hvym-data and assets index report malformed models and keep going
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ.pop('HVYM_JSON_FAST', None)
+
+from click.testing import CliRunner
+
+import hvym
+from test_hvym_glb import _glb
+
+NFT_DATA = {'contract': {'nftType': 'HVYC', 'nftChain': 'Stellar'}, 'project': {'name': 'p'},
+            'col': {'collectionName': 'col', 'collectionType': 'multi'}}
+
+
+def _models(root):
+    """Write a good model, one without data and three malformed ones under root."""
+    root = Path(root)
+    (root / 'sub').mkdir()
+    (root / 'good.glb').write_bytes(_glb({'asset': {}, 'extensions': {'HVYM_nft_data': NFT_DATA}}))
+    (root / 'sub' / 'plain.glb').write_bytes(_glb({'asset': {}}))
+    (root / 'list.glb').write_bytes(_glb([1, 2]))
+    (root / 'short.glb').write_bytes(b'glTF')
+    (root / 'badjson.glb').write_bytes(_glb({})[:20] + b'{"a":')
+
+
+def _scan(root, *options):
+    result = CliRunner().invoke(hvym.scan_hvym_data, [str(root)] + list(options))
+    assert result.exit_code == 0, result.output
+    return {os.path.basename(row['path']): row for row in map(json.loads, result.output.splitlines())}
+
+
+def test_scan_reports_bad_files():
+    """Malformed models get an error line and the others are still scanned"""
+    print("=== Testing scan-hvym-data with malformed models ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        _models(tmp)
+        for jobs in ('1', '2'):
+            rows = _scan(tmp, '--jobs', jobs)
+            assert set(rows) == {'good.glb', 'plain.glb', 'list.glb', 'short.glb', 'badjson.glb'}
+            assert rows['good.glb']['has_data'] and rows['good.glb']['collections'] == 1
+            assert not rows['plain.glb']['has_data'] and 'error' not in rows['plain.glb']
+            for name in ('list.glb', 'short.glb', 'badjson.glb'):
+                assert rows[name]['error'] and not rows[name]['has_data'], rows[name]
+    print("✅ bad models reported, scan completed")
+    return True
+
+
+def test_scan_worker_unexpected_error():
+    """An unexpected exception while reading one model is reported for that model"""
+    print("=== Testing the scan worker with an unexpected error ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        _models(tmp)
+        path = os.path.join(tmp, 'good.glb')
+        with patch('hvym_glb.read_extension', side_effect=AttributeError('boom')):
+            result = hvym._scan_hvym_file((path, 1, 2.0))
+        assert not result['has_data'] and 'boom' in result['error'], result
+    print("✅ unexpected errors reported")
+    return True
+
+
+def test_index_reports_bad_files():
+    """assets index stores malformed models with their error and indexes the rest"""
+    print("=== Testing assets index with malformed models ===")
+    import hvym_asset_index
+    with tempfile.TemporaryDirectory() as tmp:
+        models = os.path.join(tmp, 'models')
+        os.mkdir(models)
+        _models(models)
+        saved = hvym.CLI_PATH
+        hvym.CLI_PATH = tmp
+        try:
+            with patch('hvym._parse_hvym_data', side_effect=RuntimeError('boom')):
+                result = CliRunner().invoke(hvym.assets, ['index', models, '--jobs', '1'])
+            assert result.exit_code == 0, result.output
+            assert '5 updated' in result.output and '4 with errors' in result.output, result.output
+            with hvym_asset_index.AssetIndex(hvym_asset_index.index_path(tmp)) as index:
+                rows = {os.path.basename(r['path']): r for r in index.query()}
+            assert set(rows) == {'good.glb', 'plain.glb', 'list.glb', 'short.glb', 'badjson.glb'}
+            assert 'boom' in rows['good.glb']['error']
+            assert rows['plain.glb']['error'] is None
+        finally:
+            hvym.CLI_PATH = saved
+    print("✅ bad models indexed with errors")
+    return True
+
+
+def main():
+    """Run the scan tests"""
+    print("HeavyMeta Model Scan Test")
+    print("=" * 50)
+
+    tests = [
+        test_scan_reports_bad_files,
+        test_scan_worker_unexpected_error,
+        test_index_reports_bad_files,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
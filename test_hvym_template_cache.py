@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test the project template download cache against a local HTTP server
+"""
+
+import io
+import sys
+import zlib
+import zipfile
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import hvym_template_cache
+
+
+def _archive(files, commit='0' * 40):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for name, text in files.items():
+            zf.writestr(name, text)
+        zf.comment = commit.encode('ascii')
+    return buffer.getvalue()
+
+
+class _TemplateServer:
+    """Serves one archive at /template.zip with an ETag; counts full downloads."""
+
+    def __init__(self, archive):
+        self.archive = archive
+        self.downloads = 0
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                etag = f'"{zlib.crc32(server.archive):08x}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                server.downloads += 1
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(server.archive)))
+                self.end_headers()
+                self.wfile.write(server.archive)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/template.zip'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_fetch_revalidate_and_update():
+    """Unchanged templates revalidate with a 304; changed ones replace the cached tree"""
+    print("=== Testing template download cache ===")
+    server = _TemplateServer(_archive({'proj/a.txt': 'one'}, 'a' * 40))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = hvym_template_cache.TemplateCache(Path(tmp) / 'cache')
+            tree, status = cache.fetch(server.url)
+            assert status == 'downloaded' and (tree / 'proj' / 'a.txt').read_text() == 'one'
+            assert cache.entry(server.url)['commit'] == 'a' * 40
+
+            again, status = cache.fetch(server.url)
+            assert (again, status) == (tree, 'revalidated') and server.downloads == 1
+
+            server.archive = _archive({'proj/a.txt': 'two'}, 'b' * 40)
+            updated, status = cache.fetch(server.url)
+            assert status == 'downloaded' and updated != tree
+            assert (updated / 'proj' / 'a.txt').read_text() == 'two'
+            assert not tree.exists(), 'the replaced tree was not released'
+
+            out = Path(tmp) / 'project'
+            assert cache.materialize(updated, out) == 1
+            assert (out / 'proj' / 'a.txt').read_text() == 'two'
+            assert not (out / hvym_template_cache.COMPLETE_MARKER).exists()
+    finally:
+        server.close()
+    print("✅ revalidated, then updated")
+    return True
+
+
+def test_offline_and_unreachable():
+    """Offline or without a server the cached tree is served; with no entry it is an error"""
+    print("=== Testing offline template cache ===")
+    server = _TemplateServer(_archive({'a.txt': 'one'}))
+    url = server.url
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = hvym_template_cache.TemplateCache(Path(tmp) / 'cache')
+        try:
+            try:
+                cache.fetch(url, offline=True)
+            except hvym_template_cache.TemplateCacheError:
+                pass
+            else:
+                raise AssertionError('offline fetch of an uncached URL succeeded')
+            tree, _ = cache.fetch(url)
+        finally:
+            server.close()
+        assert cache.fetch(url, offline=True) == (tree, 'offline')
+        assert cache.fetch(url, timeout=2) == (tree, 'stale')
+        cache.clear()
+        try:
+            cache.fetch(url, offline=True)
+        except hvym_template_cache.TemplateCacheError:
+            pass
+        else:
+            raise AssertionError('clear() kept the entry')
+    print("✅ offline and stale fetches served from the cache")
+    return True
+
+
+def main():
+    """Run the template cache tests"""
+    print("HeavyMeta Template Cache Test")
+    print("=" * 50)
+
+    tests = [
+        test_fetch_revalidate_and_update,
+        test_offline_and_unreachable,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test project template rendering: the cached Jinja environment picks up
+template edits, and _render_plan renders concurrently, writes atomically
+and leaves unchanged outputs alone
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import hvym
+
+
+def _write_template(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+def _render(tmp, data):
+    out = Path(tmp) / 'out.txt'
+    hvym._render_template('t.txt', data, out)
+    return out.read_text()
+
+
+def test_template_edits_invalidate():
+    """Editing a template changes the output of the next render"""
+    print("=== Testing template cache invalidation ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = Path(tmp) / 'templates'
+        templates.mkdir()
+        template = templates / 't.txt'
+        now = time.time()
+        _write_template(template, 'v1 {{ data.name }}', now - 10)
+        with patch.object(hvym, 'FILE_PATH', Path(tmp)), patch.object(hvym, 'CLI_PATH', tmp):
+            hvym._template_env.cache_clear()
+            try:
+                assert _render(tmp, {'name': 'a'}) == 'v1 a'
+                assert os.listdir(Path(tmp) / hvym.TEMPLATE_CACHE_DIR), 'no bytecode was cached'
+
+                # Same process: auto_reload sees the new mtime
+                _write_template(template, 'v2 {{ data.name }}', now)
+                assert _render(tmp, {'name': 'b'}) == 'v2 b'
+
+                # New environment (a later run): the bytecode cache is keyed by source
+                hvym._template_env.cache_clear()
+                assert _render(tmp, {'name': 'c'}) == 'v2 c'
+                _write_template(template, 'v3 {{ data.name }}', now + 10)
+                hvym._template_env.cache_clear()
+                assert _render(tmp, {'name': 'd'}) == 'v3 d'
+            finally:
+                hvym._template_env.cache_clear()
+    print("✅ template edits picked up")
+    return True
+
+
+def test_render_plan():
+    """A render plan writes every output, then leaves unchanged ones untouched"""
+    print("=== Testing the render plan ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = Path(tmp) / 'templates'
+        templates.mkdir()
+        names = [f't{i}.txt' for i in range(6)]
+        for i, name in enumerate(names):
+            (templates / name).write_text(f'{i}: {{{{ data.name }}}}\n' + '{% for x in data.rows %}{{ x }},{% endfor %}')
+        out = Path(tmp) / 'out'
+        out.mkdir()
+        plan = [(name, out / name) for name in names]
+        data = {'name': 'café', 'rows': list(range(100))}
+        rows = ','.join(map(str, range(100))) + ','
+        with patch.object(hvym, 'FILE_PATH', Path(tmp)), patch.object(hvym, 'CLI_PATH', tmp):
+            hvym._template_env.cache_clear()
+            try:
+                assert hvym._render_plan(plan, data, jobs=4) == {path: True for _, path in plan}
+                for i, (_, path) in enumerate(plan):
+                    assert path.read_text() == f'{i}: café\n{rows}'
+
+                old = time.time() - 100
+                for _, path in plan:
+                    os.utime(path, (old, old))
+                (templates / names[0]).write_text('edited {{ data.name }}')
+                os.utime(templates / names[0], (time.time() + 5, time.time() + 5))
+                written = hvym._render_plan(plan, data, jobs=4)
+                assert written == {path: path == plan[0][1] for _, path in plan}, written
+                assert [path.stat().st_mtime == old for _, path in plan] == [False] + [True] * 5
+                assert plan[0][1].read_text() == 'edited café'
+
+                # jobs=1 renders in order with the same results
+                assert hvym._render_plan(plan, data, jobs=1) == {path: False for _, path in plan}
+                assert not [p for p in os.listdir(out) if p.endswith('.tmp')]
+            finally:
+                hvym._template_env.cache_clear()
+    print("✅ outputs written once, unchanged ones skipped")
+    return True
+
+
+def test_render_failure_keeps_output():
+    """A template that fails mid-render leaves the previous output and no temp file"""
+    print("=== Testing an atomic render ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = Path(tmp) / 'templates'
+        templates.mkdir()
+        (templates / 'ok.txt').write_text('ok {{ data.name }}')
+        (templates / 'bad.txt').write_text('{% for x in data.rows %}{{ x }}\n{% endfor %}{{ data.name.missing() }}')
+        out = Path(tmp) / 'out'
+        out.mkdir()
+        (out / 'bad.txt').write_text('previous')
+        plan = [('bad.txt', out / 'bad.txt'), ('ok.txt', out / 'ok.txt')]
+        with patch.object(hvym, 'FILE_PATH', Path(tmp)), patch.object(hvym, 'CLI_PATH', tmp):
+            hvym._template_env.cache_clear()
+            try:
+                hvym._render_plan(plan, {'name': 'a', 'rows': range(1000)}, jobs=2)
+            except Exception:
+                pass
+            else:
+                raise AssertionError('the failing template did not raise')
+            finally:
+                hvym._template_env.cache_clear()
+        assert (out / 'bad.txt').read_text() == 'previous'
+        assert (out / 'ok.txt').read_text() == 'ok a', 'the other entry was not finished'
+        assert sorted(os.listdir(out)) == ['bad.txt', 'ok.txt']
+    print("✅ failed render left the old output")
+    return True
+
+
+def main():
+    """Run the template tests"""
+    print("HeavyMeta Template Render Test")
+    print("=" * 50)
+
+    tests = [
+        test_template_edits_invalidate,
+        test_render_plan,
+        test_render_failure_keeps_output,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
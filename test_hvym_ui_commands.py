@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test that _UI_COMMANDS lists every registered command that opens a Qt dialog
+"""
+
+import sys
+import ast
+
+import click
+
+import hvym
+
+# Commands that need the full build without going through _get_hvym_interaction
+QT_COMMANDS = {'ui-server'}
+
+
+def _ui_functions():
+    """Names of the module-level functions of hvym.py that reach _get_hvym_interaction."""
+    with open(hvym.__file__, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    calls = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            calls[node.name] = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    ui = {'_get_hvym_interaction'}
+    changed = True
+    while changed:
+        changed = False
+        for name, names in calls.items():
+            if name not in ui and names & ui:
+                ui.add(name)
+                changed = True
+    return ui
+
+
+def _ui_commands(commands, ui):
+    """Names of the commands whose callback (or any subcommand's) is in ui."""
+    found = set()
+    for command in commands:
+        if isinstance(command, click.Group):
+            if _ui_commands(command.commands.values(), ui):
+                found.add(command.name)
+        elif command.callback.__name__ in ui:
+            found.add(command.name)
+    return found
+
+
+def _defined_commands():
+    """Every top-level command defined in hvym.py, added to cli or not."""
+    subcommands = set()
+    for value in vars(hvym).values():
+        if isinstance(value, click.Group) and value is not hvym.cli:
+            subcommands.update(id(c) for c in value.commands.values())
+    return [v for v in vars(hvym).values()
+            if isinstance(v, click.Command) and v is not hvym.cli and id(v) not in subcommands]
+
+
+def test_ui_commands_complete():
+    """_UI_COMMANDS matches the commands that open dialogs"""
+    print("=== Testing _UI_COMMANDS ===")
+    expected = _ui_commands(_defined_commands(), _ui_functions()) | QT_COMMANDS
+    missing = expected - hvym._UI_COMMANDS
+    extra = hvym._UI_COMMANDS - expected
+    assert not missing, f'missing from _UI_COMMANDS: {sorted(missing)}'
+    assert not extra, f'not UI commands: {sorted(extra)}'
+    assert 'didc-bind-js-popup' in hvym._UI_COMMANDS and 'didc-bind-ts-popup' in hvym._UI_COMMANDS
+    print(f"✅ {len(expected)} UI commands listed")
+    return True
+
+
+def main():
+    """Run the UI command tests"""
+    print("HeavyMeta UI Command Test")
+    print("=" * 50)
+
+    tests = [
+        test_ui_commands_complete,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test that popup requests to a UI server report its failures instead of
+falling back to in-process Qt
+"""
+
+import os
+import sys
+import json
+import socket
+import tempfile
+import threading
+from unittest.mock import patch
+
+os.environ.pop('HVYM_UI_SERVER', None)
+
+import click
+
+import hvym
+import hvym_ui_server
+
+
+def _fake_server(cli_path, replies):
+    """Serve one line-JSON reply per connection from replies (None closes without one)."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(8)
+    hvym_ui_server._write_state(cli_path, listener.getsockname()[1], 'secret')
+
+    def run():
+        with listener:
+            for reply in replies:
+                conn, _ = listener.accept()
+                with conn, conn.makefile('rb') as reader:
+                    json.loads(reader.readline())
+                    if reply is not None:
+                        conn.sendall(json.dumps(reply).encode('utf-8') + b'\n')
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def _no_qt(*groups):
+    raise AssertionError(f'loaded {groups} after the UI server answered')
+
+
+def test_request_failure_is_reported():
+    """A popup the server fails raises ClickException and never loads Qt"""
+    print("=== Testing a failed UI server request ===")
+    for failure in ({'ok': False, 'error': 'RuntimeError: boom'}, None):
+        with tempfile.TemporaryDirectory() as tmp:
+            thread = _fake_server(tmp, [{'ok': True}, failure])
+            with patch.object(hvym, 'CLI_PATH', tmp), patch.object(hvym.lazy_importer, 'get_modules', _no_qt):
+                try:
+                    hvym._msg_popup('hello', 'icon.png')
+                except click.ClickException as e:
+                    assert 'msg_popup failed' in e.message, e.message
+                else:
+                    raise AssertionError('the failed request was not reported')
+            thread.join(5)
+    print("✅ failed requests reported")
+    return True
+
+
+def test_request_success():
+    """A popup the server answers returns its value"""
+    print("=== Testing a UI server request ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        thread = _fake_server(tmp, [{'ok': True}, {'ok': True, 'value': 'blue'}])
+        with patch.object(hvym, 'CLI_PATH', tmp), patch.object(hvym.lazy_importer, 'get_modules', _no_qt):
+            assert hvym._options_popup('Pick', ['red', 'blue']).value == 'blue'
+        thread.join(5)
+    print("✅ value returned")
+    return True
+
+
+def test_core_build_without_server():
+    """hvym-core reports a UI server that stopped instead of importing Qt"""
+    print("=== Testing hvym-core without a UI server ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(hvym, 'CLI_PATH', tmp), patch.object(hvym, '_is_core_build', lambda: True), \
+             patch.object(hvym.lazy_importer, 'get_modules', _no_qt):
+            try:
+                hvym._get_hvym_interaction()
+            except click.ClickException as e:
+                assert 'UI server' in e.message
+            else:
+                raise AssertionError('hvym-core fell back to Qt')
+    print("✅ hvym-core reports the missing server")
+    return True
+
+
+def main():
+    """Run the UI server client tests"""
+    print("HeavyMeta UI Server Client Test")
+    print("=" * 50)
+
+    tests = [
+        test_request_failure_is_reported,
+        test_request_success,
+        test_core_build_without_server,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)